@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
 
 import pygame
@@ -8,12 +9,15 @@ import pygame
 from bit_life_survival.app.scenes.core import Scene
 from bit_life_survival.app.scenes.intro import IntroScene
 from bit_life_survival.app.services.audio import AudioService
+from bit_life_survival.app.services.frame_pacing import FrameScheduler
+from bit_life_survival.app.services.frame_profiler import FrameProfiler, ProfileSummary
 from bit_life_survival.app.services.logger import configure_logging
 from bit_life_survival.app.services.paths import resolve_user_paths
 from bit_life_survival.app.services.saves import SaveService
 from bit_life_survival.app.services.settings_store import SettingsStore
-from bit_life_survival.app.ui import theme
+from bit_life_survival.app.ui import avatar, button_skins, theme
 from bit_life_survival.app.ui.backgrounds import BackgroundRenderer
+from bit_life_survival.app.ui.overlays.profiler import draw_profiler_overlay
 from bit_life_survival.app.ui.pixel_renderer import PixelRenderer
 from bit_life_survival.app.ui.widgets import wrap_text
 from bit_life_survival.core.loader import ContentValidationError, load_content
@@ -21,6 +25,14 @@ from bit_life_survival.core.models import EquippedSlots
 from bit_life_survival.core.persistence import store_item
 
 
+# Per-frame time spent rendering button skin variants and sprite-sheet cells ahead of first use.
+# Skin tints (~2-3ms each) are sliced so a step fits inside this budget.
+SKIN_PREWARM_BUDGET_MS = 2.0
+SPRITE_BAKE_BUDGET_MS = 1.0
+# Frames between profiler overlay refreshes, so the numbers stay readable.
+PROFILER_REFRESH_FRAMES = 15
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -41,8 +53,7 @@ class GameApp:
         self.settings = self.settings_store.load()
         self.settings["video"]["ui_theme"] = theme.apply_theme(self.settings["video"].get("ui_theme", theme.DEFAULT_THEME))
         theme.set_font_scale(float(self.settings["video"].get("ui_scale", 1.0)))
-        slot_count = int(self.settings.get("gameplay", {}).get("save_slots", 3))
-        self.save_service = SaveService(self.user_paths.saves, slot_count=slot_count)
+        self.save_service = self.create_save_service()
         self.audio = AudioService()
         self.audio.configure(
             self.settings["audio"]["master"],
@@ -60,10 +71,15 @@ class GameApp:
         self.running = True
         self.quit_after_scene = False
         self.scene: Scene | None = None
+        self._prewarmed_buttons: object | None = None
 
         os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
         pygame.init()
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock)
+        self.profiler = FrameProfiler()
+        self._profile_summary: ProfileSummary | None = None
+        self._profile_age = 0
         self.pixel_renderer = PixelRenderer(
             virtual_width=theme.VIRTUAL_RESOLUTION[0],
             virtual_height=theme.VIRTUAL_RESOLUTION[1],
@@ -82,6 +98,16 @@ class GameApp:
             self.logger.exception("Failed to load content.")
             raise SystemExit(1)
 
+    def create_save_service(self) -> SaveService:
+        gameplay = self.settings.get("gameplay", {})
+        return SaveService(
+            self.user_paths.saves,
+            slot_count=int(gameplay.get("save_slots", 3)),
+            write_behind=True,
+            journal=True,
+            save_format=gameplay.get("save_format", "json"),
+        )
+
     def save_settings(self) -> None:
         self.settings_store.save(self.settings)
 
@@ -112,6 +138,7 @@ class GameApp:
         self.window = pygame.display.set_mode(resolution, flags)
         self.pixel_renderer.set_window_size(self.window.get_size())
         self.screen = self.pixel_renderer.create_canvas()
+        self.backgrounds.invalidate()
         pygame.display.set_caption(theme.WINDOW_TITLE)
 
     def virtual_mouse_pos(self) -> tuple[int, int]:
@@ -165,6 +192,38 @@ class GameApp:
         self.scene = scene
         self.scene.on_enter(self)
 
+    def _prewarm_ui_assets(self) -> None:
+        # Scenes rebuild their button list on entry, resize and theme changes; queue the
+        # hover/disabled variants of a new list and render them a little per frame.
+        buttons = getattr(self.scene, "buttons", None)
+        if buttons and buttons is not self._prewarmed_buttons:
+            self._prewarmed_buttons = buttons
+            button_skins.queue_prewarm(buttons)
+        if button_skins.prewarm_pending():
+            button_skins.prewarm_step(SKIN_PREWARM_BUDGET_MS)
+        else:
+            avatar.SPRITE_SHEETS.bake_pending(SPRITE_BAKE_BUDGET_MS)
+
+    def toggle_frame_profiler(self) -> None:
+        gameplay = self.settings["gameplay"]
+        gameplay["show_frame_profiler"] = not bool(gameplay.get("show_frame_profiler", False))
+        self.save_settings()
+
+    def dump_frame_trace(self) -> Path:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self.profiler.dump_csv(self.user_paths.logs / f"frame-trace-{stamp}.csv")
+        self.logger.info("Frame trace written to %s", path)
+        return path
+
+    def _draw_frame_profiler(self) -> None:
+        if not self.settings["gameplay"].get("show_frame_profiler", False) or self.scene is None:
+            return
+        self._profile_age += 1
+        if self._profile_summary is None or self._profile_age >= PROFILER_REFRESH_FRAMES:
+            self._profile_summary = self.profiler.summary(type(self.scene).__name__)
+            self._profile_age = 0
+        draw_profiler_overlay(self.screen, self._profile_summary)
+
     def quit(self) -> None:
         self.running = False
 
@@ -209,22 +268,41 @@ class GameApp:
     def run(self) -> None:
         self.change_scene(IntroScene())
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt, events = self.frame_scheduler.next_frame(self.scene is None or self.scene.is_animating(self))
+            profiler = self.profiler
+            profiler.start_frame(type(self.scene).__name__ if self.scene is not None else "")
             try:
-                for event in pygame.event.get():
+                for event in events:
                     if event.type == pygame.QUIT:
                         self.quit()
                         continue
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.toggle_frame_profiler()
+                        continue
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        self.dump_frame_trace()
+                        continue
                     if event.type == pygame.WINDOWRESIZED:
                         self.pixel_renderer.set_window_size((event.x, event.y))
+                    elif event.type in {pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED}:
+                        self.pixel_renderer.invalidate()
                     if self.scene is not None:
                         self.scene.handle_event(self, self.pixel_renderer.transform_event(event))
+                profiler.lap("events")
                 if self.scene is not None:
                     self.backgrounds.update(dt)
                     self.scene.update(self, dt)
+                    profiler.lap("update")
                     self.scene.render(self, self.screen)
-                self.pixel_renderer.present(self.window, self.screen)
-                pygame.display.flip()
+                    self._draw_frame_profiler()
+                    profiler.lap("render")
+                    self._prewarm_ui_assets()
+                    profiler.lap("update")
+                dirty = self.pixel_renderer.present(self.window, self.screen)
+                if dirty:
+                    pygame.display.update(dirty)
+                profiler.lap("present")
+                profiler.end_frame(background_ms=self.backgrounds.take_draw_ms())
             except Exception as exc:  # noqa: BLE001
                 self.logger.exception("Unhandled runtime exception")
                 print(f"Fatal error. See log: {self.log_path}")
@@ -235,6 +313,10 @@ class GameApp:
             self.return_staged_loadout()
         except Exception:
             self.logger.exception("Failed returning staged loadout during shutdown.")
+        try:
+            self.save_service.close()
+        except Exception:
+            self.logger.exception("Failed flushing pending saves during shutdown.")
         pygame.quit()
 
 
@@ -470,6 +470,7 @@ class BaseScene(Scene):
         if event.type == pygame.QUIT:
             app.quit()
             return
+        self.claw_room.wake()
         self._build_layout(app)
         if self._vault_assistant and self._vault_assistant.visible:
             result = self._vault_assistant.handle_event(event)
@@ -620,6 +621,10 @@ class BaseScene(Scene):
             hint_y = max(body.top, body.bottom - theme.get_font(theme.FONT_SIZE_META).get_linesize())
             draw_text(surface, "Tab: expand intel", theme.get_font(theme.FONT_SIZE_META), theme.COLOR_TEXT_MUTED, (x, hint_y))
 
+    def is_animating(self, app) -> bool:
+        # Room actors walk for a while after input, then stand still so the base can idle.
+        return self.claw_room.is_animating or self.claw_room.actors_moving
+
     def render(self, app, surface: pygame.Surface) -> None:
         if app.save_data is None:
             from .menu import MainMenuScene
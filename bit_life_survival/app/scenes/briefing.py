@@ -207,6 +207,9 @@ class BriefingScene(Scene):
         y += 6
         draw_text(surface, f"Readiness {readiness}%", theme.get_role_font("section", bold=True, kind="display"), theme.COLOR_SUCCESS if readiness >= 60 else theme.COLOR_WARNING, (body.left, y))
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "vault")
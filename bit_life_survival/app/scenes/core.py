@@ -23,3 +23,11 @@ class Scene:
 
     def render(self, app: "GameApp", surface: pygame.Surface) -> None:
         return
+
+    def is_animating(self, app: "GameApp") -> bool:
+        """Whether the scene needs full-rate frames without input.
+
+        Scenes whose only motion is ambient (backgrounds, idle sprites) return False and
+        keep animating at the scheduler's idle rate.
+        """
+        return True
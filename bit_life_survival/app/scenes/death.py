@@ -138,6 +138,9 @@ class DeathScene(Scene):
                 draw_text(surface, wrapped, theme.get_role_font("meta"), theme.COLOR_TEXT_MUTED, (body.left, y))
                 y += theme.FONT_SIZE_META + 4
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "vault")
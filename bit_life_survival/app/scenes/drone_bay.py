@@ -155,6 +155,9 @@ class DroneBayScene(Scene):
             if button.handle_event(event):
                 return
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "industrial")
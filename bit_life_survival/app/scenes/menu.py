@@ -13,6 +13,9 @@ from bit_life_survival.app.ui.widgets import Button, Panel, SectionCard, clamp_w
 
 from .core import Scene
 
+# Seconds the hero mascot keeps walking after the last input before it stands still.
+MASCOT_WANDER_S = 8.0
+
 
 class MainMenuScene(Scene):
     def __init__(self, message: str = "") -> None:
@@ -24,6 +27,8 @@ class MainMenuScene(Scene):
         self._actions_rect = pygame.Rect(0, 0, 0, 0)
         self._intel_rect = pygame.Rect(0, 0, 0, 0)
         self._footer_rect = pygame.Rect(0, 0, 0, 0)
+        self._mascot_time_s = 0.0
+        self._mascot_wander_s = MASCOT_WANDER_S
 
     def _continue(self, app) -> None:
         slot = app.save_service.last_slot()
@@ -95,7 +100,13 @@ class MainMenuScene(Scene):
         except ValueError:
             return value
 
+    def update(self, app, dt: float) -> None:
+        if self._mascot_wander_s > 0.0:
+            self._mascot_time_s += dt
+            self._mascot_wander_s = max(0.0, self._mascot_wander_s - dt)
+
     def handle_event(self, app, event: pygame.event.Event) -> None:
+        self._mascot_wander_s = MASCOT_WANDER_S
         if event.type == pygame.QUIT:
             app.quit()
             return
@@ -109,13 +120,13 @@ class MainMenuScene(Scene):
         draw_text(surface, "VAULT SURVIVAL", theme.get_role_font("title", bold=True, kind="display"), theme.COLOR_TEXT, (hero.left + 10, hero.top + 10))
         draw_text(surface, "Select protocol. Deploy teams. Recover value. Expand the vault.", theme.get_role_font("body"), theme.COLOR_TEXT_MUTED, (hero.left + 12, hero.top + 36))
 
-        t = pygame.time.get_ticks() / 1000.0
+        t = self._mascot_time_s
         center_x = hero.right - 120
         center_y = hero.centery + 8
         orbit = 24
         x = int(center_x + math.cos(t * 1.1) * orbit) - 26
         y = int(center_y + math.sin(t * 1.7) * 8) - 26
-        draw_citizen_sprite(surface, x, y, citizen_id="menu_mascot", scale=3, selected=False, walk_phase=t * 1.5, pose="walk")
+        draw_citizen_sprite(surface, x, y, citizen_id="menu_mascot", scale=3, selected=False, walk_phase=t * 1.5 if self._mascot_wander_s > 0.0 else 0.0, pose="walk")
 
     def _draw_intel(self, app, surface: pygame.Surface) -> None:
         body = SectionCard(self._intel_rect, "Command Intel").draw(surface)
@@ -160,6 +171,10 @@ class MainMenuScene(Scene):
                 draw_text(surface, segment, theme.get_role_font("meta"), theme.COLOR_TEXT_MUTED, (body.left, y))
                 y += theme.FONT_SIZE_META + 6
 
+    def is_animating(self, app) -> bool:
+        # The mascot would stutter at the idle rate, so idle only once it stands still.
+        return self._mascot_wander_s > 0.0
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "vault")
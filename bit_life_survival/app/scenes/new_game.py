@@ -194,6 +194,9 @@ class NewGameScene(Scene):
                 draw_text(surface, wrapped, theme.get_font(15), color, (info_x, y))
                 y += 18
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._layout(app)
         app.backgrounds.draw(surface, "vault")
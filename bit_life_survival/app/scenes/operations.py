@@ -799,6 +799,9 @@ class OperationsScene(Scene):
             return
         self._draw_item_detail(app, surface)
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "vault")
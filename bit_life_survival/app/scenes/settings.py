@@ -8,6 +8,7 @@ from bit_life_survival.app.ui import theme
 from bit_life_survival.app.ui.design_system import clamp_rect
 from bit_life_survival.app.ui.layout import split_columns, split_rows
 from bit_life_survival.app.ui.widgets import Button, CommandStrip, Panel, SectionCard, draw_text, wrap_text
+from bit_life_survival.core.save_system import SAVE_FORMATS
 from bit_life_survival.core.settings import default_settings
 
 from .core import Scene
@@ -93,7 +94,12 @@ class SettingsScene(Scene):
             current = 3
         app.settings["gameplay"]["save_slots"] = current
         app.save_settings()
-        app.save_service = app.save_service.__class__(app.user_paths.saves, slot_count=current)
+        app.save_service.close()
+        app.save_service = app.create_save_service()
+
+    def _cycle_save_format(self, app) -> None:
+        self._cycle_value(app, "gameplay", "save_format", list(SAVE_FORMATS))
+        app.save_service.set_save_format(app.settings["gameplay"]["save_format"])
 
     def _resolution_choices(self) -> list[tuple[int, int]]:
         choices: list[tuple[int, int]] = list(self.COMMON_RESOLUTIONS)
@@ -135,12 +141,13 @@ class SettingsScene(Scene):
         app.save_settings()
         app.apply_video_settings()
         app._sync_vault_ui_settings()
+        app.save_service.set_save_format(app.settings["gameplay"]["save_format"])
         app.save_current_slot()
         self.message = "Settings reset to defaults."
 
     def _add_gameplay_controls(self, app) -> None:
         body = pygame.Rect(self._left_rect.left + 10, self._left_rect.top + 34, self._left_rect.width - 20, self._left_rect.height - 44)
-        rows = split_rows(body, [1, 1, 1, 1, 1, 1], gap=8)
+        rows = split_rows(body, [1, 1, 1, 1, 1, 1, 1, 1], gap=8)
         self.buttons.extend(
             [
                 self._mk_setting_button(rows[0], f"Skip Intro: {app.settings['gameplay']['skip_intro']}", on_click=lambda: self._toggle(app, "gameplay", "skip_intro")),
@@ -148,7 +155,9 @@ class SettingsScene(Scene):
                 self._mk_setting_button(rows[2], f"Confirm Retreat: {app.settings['gameplay']['confirm_retreat']}", on_click=lambda: self._toggle(app, "gameplay", "confirm_retreat")),
                 self._mk_setting_button(rows[3], f"Show Tooltips: {app.settings['gameplay'].get('show_tooltips', True)}", on_click=lambda: self._toggle(app, "gameplay", "show_tooltips")),
                 self._mk_setting_button(rows[4], f"Save Slots: {app.settings['gameplay'].get('save_slots', 3)}", on_click=lambda: self._cycle_save_slots(app)),
-                self._mk_setting_button(rows[5], "Replay Vault Assistant", on_click=lambda: self._request_replay_tutorial(app)),
+                self._mk_setting_button(rows[5], f"Save Format: {app.settings['gameplay'].get('save_format', 'json')}", on_click=lambda: self._cycle_save_format(app)),
+                self._mk_setting_button(rows[6], f"Frame Profiler: {app.settings['gameplay'].get('show_frame_profiler', False)}", on_click=lambda: self._toggle(app, "gameplay", "show_frame_profiler")),
+                self._mk_setting_button(rows[7], "Replay Vault Assistant", on_click=lambda: self._request_replay_tutorial(app)),
             ]
         )
 
@@ -275,6 +284,9 @@ class SettingsScene(Scene):
                 draw_text(surface, wrapped, theme.get_role_font("body"), theme.COLOR_TEXT_MUTED if self.tab != "controls" else theme.COLOR_TEXT, (body.left, y))
                 y += theme.FONT_SIZE_BODY + 4
 
+    def is_animating(self, app) -> bool:
+        return False
+
     def render(self, app, surface: pygame.Surface) -> None:
         self._build_layout(app)
         app.backgrounds.draw(surface, "vault")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+
+import pygame
+
+ACTIVE_FPS = 60
+IDLE_FPS = 12
+# Stay at the active rate this long after the last event so hover tooltips and
+# click feedback still land on time.
+IDLE_GRACE_S = 0.75
+
+
+class FrameScheduler:
+    """Picks the frame rate for the main loop.
+
+    While the scene reports it is animating, or input arrived within ``idle_grace_s``, frames
+    run at ``active_fps``. Otherwise the loop blocks in ``pygame.event.wait`` for up to one
+    idle frame, so ambient motion keeps going at ``idle_fps`` and any event wakes it
+    immediately and snaps back to the active rate.
+    """
+
+    __slots__ = ("clock", "active_fps", "idle_fps", "idle_grace_s", "idle", "_last_input")
+
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        active_fps: int = ACTIVE_FPS,
+        idle_fps: int = IDLE_FPS,
+        idle_grace_s: float = IDLE_GRACE_S,
+    ) -> None:
+        self.clock = clock
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_grace_s = idle_grace_s
+        self.idle = False
+        self._last_input = time.monotonic()
+
+    def note_input(self) -> None:
+        self._last_input = time.monotonic()
+
+    def wants_idle(self, animating: bool) -> bool:
+        return not animating and (time.monotonic() - self._last_input) >= self.idle_grace_s
+
+    def next_frame(self, animating: bool) -> tuple[float, list[pygame.event.Event]]:
+        """Wait for the next frame; returns ``(dt_seconds, events)``."""
+        self.idle = self.wants_idle(animating)
+        if self.idle:
+            first = pygame.event.wait(max(1, 1000 // max(1, self.idle_fps)))
+            elapsed_ms = self.clock.tick()
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+        else:
+            elapsed_ms = self.clock.tick(self.active_fps)
+            events = pygame.event.get()
+        if events:
+            self.note_input()
+        return elapsed_ms / 1000.0, events
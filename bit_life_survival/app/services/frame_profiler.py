@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import csv
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+PHASES = ("events", "update", "background", "render", "present")
+DEFAULT_WINDOW_FRAMES = 600
+DEFAULT_TRACE_FRAMES = 36_000
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended.
+HISTOGRAM_EDGES_MS = (4.0, 8.0, 16.7, 33.3, 50.0, 100.0)
+
+
+@dataclass(slots=True)
+class FrameSample:
+    index: int
+    started: float
+    scene: str
+    interval_ms: float
+    phases: tuple[float, ...]
+
+    @property
+    def work_ms(self) -> float:
+        return sum(self.phases)
+
+
+@dataclass(slots=True)
+class ProfileSummary:
+    scene: str
+    frames: int
+    fps: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    phase_ms: dict[str, float]
+    histogram: tuple[int, ...]
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class FrameProfiler:
+    """Per-phase frame timings with a rolling window per scene and a bounded CSV trace.
+
+    The main loop calls ``start_frame`` once per frame, ``lap`` after each phase and
+    ``end_frame`` last. Background drawing happens inside scene render, so its time is
+    passed to ``end_frame`` and subtracted from the render phase.
+    """
+
+    def __init__(self, window_frames: int = DEFAULT_WINDOW_FRAMES, trace_frames: int = DEFAULT_TRACE_FRAMES) -> None:
+        self.window_frames = window_frames
+        self._windows: dict[str, deque[FrameSample]] = {}
+        self._trace: deque[FrameSample] = deque(maxlen=trace_frames)
+        self._frame_index = 0
+        self._scene = ""
+        self._started = 0.0
+        self._previous_start: float | None = None
+        self._mark = 0.0
+        self._laps: dict[str, float] = {}
+
+    def start_frame(self, scene: str) -> None:
+        now = time.perf_counter()
+        self._scene = scene
+        self._started = now
+        self._mark = now
+        self._laps = {}
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._laps[phase] = self._laps.get(phase, 0.0) + (now - self._mark) * 1000.0
+        self._mark = now
+
+    def end_frame(self, background_ms: float = 0.0) -> FrameSample:
+        laps = self._laps
+        background_ms = min(background_ms, laps.get("render", 0.0))
+        laps["background"] = laps.get("background", 0.0) + background_ms
+        laps["render"] = laps.get("render", 0.0) - background_ms
+        interval_ms = 0.0 if self._previous_start is None else (self._started - self._previous_start) * 1000.0
+        self._previous_start = self._started
+        sample = FrameSample(
+            index=self._frame_index,
+            started=self._started,
+            scene=self._scene,
+            interval_ms=interval_ms,
+            phases=tuple(laps.get(phase, 0.0) for phase in PHASES),
+        )
+        self._frame_index += 1
+        window = self._windows.get(sample.scene)
+        if window is None:
+            window = deque(maxlen=self.window_frames)
+            self._windows[sample.scene] = window
+        window.append(sample)
+        self._trace.append(sample)
+        return sample
+
+    def scenes(self) -> list[str]:
+        return list(self._windows)
+
+    def summary(self, scene: str) -> ProfileSummary:
+        samples = list(self._windows.get(scene, ()))
+        work = sorted(sample.work_ms for sample in samples)
+        intervals = [sample.interval_ms for sample in samples if sample.interval_ms > 0.0]
+        mean_interval = sum(intervals) / len(intervals) if intervals else 0.0
+        histogram = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        for value in work:
+            bucket = 0
+            while bucket < len(HISTOGRAM_EDGES_MS) and value > HISTOGRAM_EDGES_MS[bucket]:
+                bucket += 1
+            histogram[bucket] += 1
+        count = max(1, len(samples))
+        return ProfileSummary(
+            scene=scene,
+            frames=len(samples),
+            fps=1000.0 / mean_interval if mean_interval > 0.0 else 0.0,
+            p50_ms=_percentile(work, 0.50),
+            p99_ms=_percentile(work, 0.99),
+            max_ms=work[-1] if work else 0.0,
+            phase_ms={phase: sum(sample.phases[i] for sample in samples) / count for i, phase in enumerate(PHASES)},
+            histogram=tuple(histogram),
+        )
+
+    def dump_csv(self, path: Path) -> Path:
+        """Write every traced frame to ``path``; returns the path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["frame", "time_s", "scene", "interval_ms", "work_ms", *(f"{phase}_ms" for phase in PHASES)])
+            origin = self._trace[0].started if self._trace else 0.0
+            for sample in self._trace:
+                writer.writerow(
+                    [
+                        sample.index,
+                        f"{sample.started - origin:.4f}",
+                        sample.scene,
+                        f"{sample.interval_ms:.3f}",
+                        f"{sample.work_ms:.3f}",
+                        *(f"{value:.3f}" for value in sample.phases),
+                    ]
+                )
+        return path
@@ -1,41 +1,160 @@
 from __future__ import annotations
 
+import logging
+import threading
 from pathlib import Path
 
 from bit_life_survival.core.models import SaveData
-from bit_life_survival.core.save_system import DEFAULT_SLOT_COUNT, SlotStorage, SlotSummary, normalize_slot_count
+from bit_life_survival.core.save_system import (
+    DEFAULT_SAVE_FORMAT,
+    DEFAULT_SLOT_COUNT,
+    SAVE_FORMATS,
+    SaveFormat,
+    SlotSnapshot,
+    SlotStorage,
+    SlotSummary,
+    normalize_slot_count,
+)
+
+logger = logging.getLogger("bit_life_survival.saves")
+
+
+class _SaveWriter:
+    """Background thread that writes queued slot snapshots.
+
+    Pending snapshots are keyed by slot, so a burst of saves to one slot collapses into a
+    single write of the newest snapshot.
+    """
+
+    def __init__(self, storage: SlotStorage) -> None:
+        self._storage = storage
+        self._pending: dict[int, SlotSnapshot] = {}
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="bls-save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, slot: int, snapshot: SlotSnapshot) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Save writer is closed.")
+            self._pending[slot] = snapshot
+            self._condition.notify_all()
+
+    def is_pending(self, slot: int) -> bool:
+        with self._condition:
+            return slot in self._pending
+
+    def discard(self, slot: int) -> None:
+        with self._condition:
+            self._pending.pop(slot, None)
+
+    def flush(self) -> None:
+        with self._condition:
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                slot = next(iter(self._pending))
+                snapshot = self._pending.pop(slot)
+                self._writing = True
+            try:
+                self._storage.write_snapshot(slot, snapshot)
+            except Exception:
+                logger.exception("Background save of slot %s failed.", slot)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
 
 
 class SaveService:
-    def __init__(self, saves_dir: Path, slot_count: int = DEFAULT_SLOT_COUNT) -> None:
+    def __init__(
+        self,
+        saves_dir: Path,
+        slot_count: int = DEFAULT_SLOT_COUNT,
+        write_behind: bool = False,
+        save_format: SaveFormat = DEFAULT_SAVE_FORMAT,
+        journal: bool = False,
+    ) -> None:
         self.saves_dir = saves_dir
         self.slot_count = normalize_slot_count(slot_count)
-        self._slots = SlotStorage(saves_dir, slot_count=self.slot_count)
+        self._slots = SlotStorage(saves_dir, slot_count=self.slot_count, save_format=save_format, journal=journal)
         self.slot_ids = self._slots.slot_ids
+        # With write_behind, save_slot only snapshots the save; disk I/O happens on a writer thread.
+        self._writer = _SaveWriter(self._slots) if write_behind else None
+
+    @property
+    def save_format(self) -> SaveFormat:
+        return self._slots.save_format
+
+    def set_save_format(self, save_format: SaveFormat) -> None:
+        """Switch the format for subsequent writes; existing slots convert on their next save."""
+        if save_format not in SAVE_FORMATS:
+            raise ValueError(f"Unknown save format '{save_format}'.")
+        self._slots.save_format = save_format
 
     def list_slots(self) -> list[SlotSummary]:
         return self._slots.list_slots()
 
     def slot_exists(self, slot: int) -> bool:
+        if self._writer is not None and self._writer.is_pending(slot):
+            return True
         return self._slots.slot_exists(slot)
 
     def create_new_game(self, slot: int, base_seed: int = 1337) -> SaveData:
+        self.flush()
         data = self._slots.create_new_game(slot, base_seed=base_seed)
         data.vault.last_run_seed = base_seed
         self.save_slot(slot, data)
         return data
 
     def load_slot(self, slot: int) -> SaveData:
+        self.flush()
         return self._slots.load_slot(slot)
 
     def save_slot(self, slot: int, save_data: SaveData) -> None:
-        self._slots.save_slot(slot, save_data)
+        if self._writer is None:
+            self._slots.save_slot(slot, save_data)
+            return
+        self._writer.submit(slot, SlotSnapshot.from_save(save_data))
 
     def delete_slot(self, slot: int) -> None:
+        if self._writer is not None:
+            self._writer.discard(slot)
+        self.flush()
         self._slots.delete_slot(slot)
 
     def rename_slot(self, slot: int, name: str) -> None:
+        self.flush()
         self._slots.rename_slot(slot, name)
 
     def last_slot(self) -> int | None:
         return self._slots.last_slot()
+
+    def flush(self) -> None:
+        """Block until every queued save is on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Write out queued saves, stop the writer thread and compact any journals."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._slots.compact_journals()
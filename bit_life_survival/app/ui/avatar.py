@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import hashlib
 import math
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from functools import lru_cache
+from typing import Literal
 
 import pygame
 
@@ -90,10 +92,19 @@ def _pose_offsets(frame: int, pose: str) -> tuple[int, int, int]:
     return (1, -2, -1)
 
 
-@lru_cache(maxsize=4096)
+def _face_variant(seed: bytes, frame: int, blink_step: int) -> tuple[bool, int]:
+    blink_on = ((blink_step + seed[21]) % 13) == 0
+    mouth_variant = (blink_step + frame + seed[22]) % 3
+    return blink_on, mouth_variant
+
+
 def _render_gameplay_sprite(citizen_id: str, frame: int, pose: str, blink_step: int) -> pygame.Surface:
+    blink_on, mouth_variant = _face_variant(_digest(citizen_id), frame, blink_step)
+    return _draw_gameplay_sprite(citizen_id, frame, pose, blink_on, mouth_variant)
+
+
+def _draw_gameplay_sprite(citizen_id: str, frame: int, pose: str, blink_on: bool, mouth_variant: int) -> pygame.Surface:
     pal = _build_palette(citizen_id)
-    seed = _digest(citizen_id)
     surf = pygame.Surface((GAMEPLAY_SOURCE_SIZE, GAMEPLAY_SOURCE_SIZE), pygame.SRCALPHA)
     y_bob, arm_shift, leg_shift = _pose_offsets(frame, pose)
 
@@ -160,14 +171,12 @@ def _render_gameplay_sprite(citizen_id: str, frame: int, pose: str, blink_step:
     # Eyebrows, eyes, pupils, and mouth
     brow = _shade(pal.hair_shadow, -20)
     _px(surf, brow, [(56, head_top + 15, 7, 2), (68, head_top + 15, 7, 2)])
-    blink_on = ((blink_step + seed[21]) % 13) == 0
     if blink_on:
         _px(surf, pal.outline, [(57, head_top + 19, 6, 1), (69, head_top + 19, 6, 1)])
     else:
         _px(surf, (236, 236, 232), [(57, head_top + 18, 6, 4), (69, head_top + 18, 6, 4)])
         _px(surf, pal.outline, [(59, head_top + 18, 2, 4), (71, head_top + 18, 2, 4)])
 
-    mouth_variant = (blink_step + frame + seed[22]) % 3
     if mouth_variant == 0:
         _px(surf, pal.outline, [(63, head_top + 26, 4, 1), (67, head_top + 26, 4, 1)])
     elif mouth_variant == 1:
@@ -207,7 +216,6 @@ def _render_gameplay_sprite(citizen_id: str, frame: int, pose: str, blink_step:
     return surf
 
 
-@lru_cache(maxsize=1024)
 def _render_portrait_sprite(citizen_id: str, frame: int, pose: str) -> pygame.Surface:
     base = _render_gameplay_sprite(citizen_id, frame, pose, blink_step=frame)
     portrait = pygame.transform.scale(base, (PORTRAIT_SOURCE_SIZE, PORTRAIT_SOURCE_SIZE))
@@ -221,6 +229,159 @@ def _render_portrait_sprite(citizen_id: str, frame: int, pose: str) -> pygame.Su
     return portrait
 
 
+SheetKind = Literal["gameplay", "portrait"]
+
+SHEET_POSES = ("walk", "jump", "crouch")
+SHEET_COLUMNS = 12
+WALK_FRAMES = 4
+# (4 walk frames + one frame per held pose) x blink x mouth variant: every distinct gameplay
+# sprite a citizen can show. Jump and crouch draw the same for every walk frame.
+GAMEPLAY_SHEET_CELLS = (WALK_FRAMES + len(SHEET_POSES) - 1) * 2 * 3
+PORTRAIT_SHEET_CELLS = 4
+DEFAULT_SPRITE_CACHE_BYTES = 48 * 1024 * 1024
+
+
+def _gameplay_cell(seed: bytes, frame: int, pose: str, blink_step: int) -> int:
+    # Poses other than jump/crouch draw exactly like walk.
+    pose_index = SHEET_POSES.index(pose) if pose in SHEET_POSES else 0
+    blink_on, mouth_variant = _face_variant(seed, frame, blink_step)
+    column = frame % WALK_FRAMES if pose_index == 0 else WALK_FRAMES + pose_index - 1
+    return (column * 2 + int(blink_on)) * 3 + mouth_variant
+
+
+class SpriteSheet:
+    """One atlas surface holding every sprite cell of a citizen at one display size.
+
+    Cells are baked on first use (or ahead of time by ``bake``) straight into the atlas,
+    so drawing is a single area blit with no per-frame scaling.
+    """
+
+    __slots__ = ("kind", "citizen_id", "cell_size", "seed", "surface", "_baked")
+
+    def __init__(self, kind: SheetKind, citizen_id: str, cell_size: int) -> None:
+        cells = GAMEPLAY_SHEET_CELLS if kind == "gameplay" else PORTRAIT_SHEET_CELLS
+        columns = min(cells, SHEET_COLUMNS)
+        rows = -(-cells // columns)
+        self.kind = kind
+        self.citizen_id = citizen_id
+        self.cell_size = cell_size
+        self.seed = _digest(citizen_id)
+        self.surface = pygame.Surface((columns * cell_size, rows * cell_size), pygame.SRCALPHA)
+        self._baked = bytearray(cells)
+
+    @property
+    def nbytes(self) -> int:
+        return self.surface.get_bytesize() * self.surface.get_width() * self.surface.get_height()
+
+    @property
+    def complete(self) -> bool:
+        return all(self._baked)
+
+    def cell_rect(self, index: int) -> pygame.Rect:
+        size = self.cell_size
+        columns = self.surface.get_width() // size
+        return pygame.Rect((index % columns) * size, (index // columns) * size, size, size)
+
+    def cell(self, index: int) -> pygame.Rect:
+        rect = self.cell_rect(index)
+        if not self._baked[index]:
+            self._bake(index, rect)
+        return rect
+
+    def bake(self, limit: int | None = None) -> int:
+        """Bake up to ``limit`` missing cells; returns how many were baked."""
+        baked = 0
+        for index, done in enumerate(self._baked):
+            if limit is not None and baked >= limit:
+                break
+            if not done:
+                self._bake(index, self.cell_rect(index))
+                baked += 1
+        return baked
+
+    def _bake(self, index: int, rect: pygame.Rect) -> None:
+        if self.kind == "gameplay":
+            rest, mouth_variant = divmod(index, 3)
+            column, blink_on = divmod(rest, 2)
+            if column < WALK_FRAMES:
+                frame, pose = column, "walk"
+            else:
+                frame, pose = 0, SHEET_POSES[column - WALK_FRAMES + 1]
+            source = _draw_gameplay_sprite(self.citizen_id, frame, pose, bool(blink_on), mouth_variant)
+        else:
+            source = _render_portrait_sprite(self.citizen_id, index, "walk")
+        pygame.transform.scale(source, rect.size, self.surface.subsurface(rect))
+        self._baked[index] = 1
+
+
+@dataclass(slots=True)
+class SpriteCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    sheets: int = 0
+    bytes_used: int = 0
+    max_bytes: int = 0
+
+
+class SpriteSheetCache:
+    """LRU of citizen sprite sheets bounded by total atlas bytes."""
+
+    __slots__ = ("max_bytes", "_sheets", "_bytes", "_stats")
+
+    def __init__(self, max_bytes: int = DEFAULT_SPRITE_CACHE_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._sheets: OrderedDict[tuple[SheetKind, str, int], SpriteSheet] = OrderedDict()
+        self._bytes = 0
+        self._stats = SpriteCacheStats()
+
+    def sheet(self, kind: SheetKind, citizen_id: str, cell_size: int) -> SpriteSheet:
+        key = (kind, citizen_id, cell_size)
+        sheet = self._sheets.get(key)
+        if sheet is not None:
+            self._sheets.move_to_end(key)
+            self._stats.hits += 1
+            return sheet
+        self._stats.misses += 1
+        sheet = SpriteSheet(kind, citizen_id, cell_size)
+        self._sheets[key] = sheet
+        self._bytes += sheet.nbytes
+        # The sheet just requested always stays, even if it alone exceeds the budget.
+        while self._bytes > self.max_bytes and len(self._sheets) > 1:
+            _, evicted = self._sheets.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._stats.evictions += 1
+        return sheet
+
+    def bake_pending(self, budget_ms: float) -> int:
+        """Fill missing cells of the most recently used sheets until ``budget_ms`` is spent."""
+        baked = 0
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        for sheet in reversed(self._sheets.values()):
+            while not sheet.complete:
+                baked += sheet.bake(limit=1)
+                if time.perf_counter() >= deadline:
+                    return baked
+        return baked
+
+    def clear(self) -> None:
+        self._sheets.clear()
+        self._bytes = 0
+
+    def stats(self) -> SpriteCacheStats:
+        return SpriteCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            sheets=len(self._sheets),
+            bytes_used=self._bytes,
+            max_bytes=self.max_bytes,
+        )
+
+
+SPRITE_SHEETS = SpriteSheetCache()
+
+
 def draw_citizen_sprite(
     surface: pygame.Surface,
     x: int,
@@ -233,16 +394,16 @@ def draw_citizen_sprite(
 ) -> pygame.Rect:
     frame = int(abs(walk_phase * 7.0)) % 4
     blink_step = int(abs(walk_phase * 1.5)) % 20
-    base = _render_gameplay_sprite(citizen_id, frame=frame, pose=pose, blink_step=blink_step)
     target_size = max(24, int(16 * max(1, scale)))
-    sprite = pygame.transform.scale(base, (target_size, target_size))
+    sheet = SPRITE_SHEETS.sheet("gameplay", citizen_id, target_size)
+    area = sheet.cell(_gameplay_cell(sheet.seed, frame, pose, blink_step))
     rect = pygame.Rect(int(x), int(y), target_size, target_size)
 
     if selected:
         glow = pygame.Surface((target_size + 12, target_size + 12), pygame.SRCALPHA)
         pygame.draw.ellipse(glow, (236, 210, 140, 82), glow.get_rect())
         surface.blit(glow, (rect.left - 6, rect.top - 4))
-    surface.blit(sprite, rect)
+    surface.blit(sheet.surface, rect, area)
     return rect
 
 
@@ -264,11 +425,12 @@ def draw_citizen_avatar(
     hero_size = min(inner.width - 4, inner.height - 14)
     hero_size = max(24, hero_size)
     frame = int(abs(time_s * 6.0)) % 4
-    portrait = _render_portrait_sprite(citizen_id, frame=frame, pose="walk")
-    hero = pygame.transform.scale(portrait, (hero_size, hero_size))
+    sheet = SPRITE_SHEETS.sheet("portrait", citizen_id, hero_size)
+    area = sheet.cell(frame)
     bob = 0 if not selected else int(math.sin(time_s * 4.2) * 2)
-    hero_rect = hero.get_rect(midtop=(inner.centerx, inner.top + 2 + bob))
-    surface.blit(hero, hero_rect)
+    hero_rect = pygame.Rect(0, 0, hero_size, hero_size)
+    hero_rect.midtop = (inner.centerx, inner.top + 2 + bob)
+    surface.blit(sheet.surface, hero_rect, area)
 
     initials = "".join(part[0] for part in name.split()[:2]).upper() or "?"
     draw_text(
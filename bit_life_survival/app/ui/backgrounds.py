@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import math
 import random
+import time
 
 import pygame
 
 from . import theme
 
 
+StaticLayerKey = tuple[str, tuple[int, int], tuple[tuple[int, int, int], ...]]
+MAX_STATIC_LAYERS = 8
+
+
 class BackgroundRenderer:
     def __init__(self, seed: int = 1337) -> None:
         self.t = 0.0
+        # Time spent in draw() since the last take_draw_ms(), for the frame profiler.
+        self.draw_ms = 0.0
+        # Pre-rendered non-animated layers per (biome, size, palette); a theme switch or a
+        # resize simply misses and rebuilds, so only particles, sway and flicker draw per frame.
+        self._static_layers: dict[StaticLayerKey, pygame.Surface] = {}
+        # One pre-baked sprite per particle kind/size/colour, shared by every particle of it.
+        self._sprites: dict[tuple, pygame.Surface] = {}
         rng = random.Random(seed)
         self.ash_particles = [(rng.random(), rng.random(), rng.uniform(0.25, 1.0)) for _ in range(90)]
         self.fog_particles = [(rng.random(), rng.random(), rng.uniform(0.6, 1.4)) for _ in range(36)]
@@ -20,15 +32,74 @@ class BackgroundRenderer:
         self.t += dt
 
     def draw(self, surface: pygame.Surface, biome_id: str) -> None:
+        started = time.perf_counter()
+        self._draw_biome(surface, biome_id)
+        self.draw_ms += (time.perf_counter() - started) * 1000.0
+
+    def take_draw_ms(self) -> float:
+        elapsed, self.draw_ms = self.draw_ms, 0.0
+        return elapsed
+
+    def _draw_biome(self, surface: pygame.Surface, biome_id: str) -> None:
         if biome_id == "vault":
-            self._draw_vault(surface)
+            self._blit_static(surface, "vault", self._draw_vault_static)
         elif biome_id == "forest":
+            self._blit_static(surface, "forest", self._draw_forest_static)
             self._draw_forest(surface)
         elif biome_id == "industrial":
+            self._blit_static(surface, "industrial", self._draw_industrial_static)
             self._draw_industrial(surface)
         else:
+            self._blit_static(surface, "suburbs", self._draw_suburbs_static)
             self._draw_suburbs(surface)
 
+    def invalidate(self) -> None:
+        self._static_layers.clear()
+        self._sprites.clear()
+
+    def _fog_sprite(self) -> pygame.Surface:
+        key = ("fog",)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((160, 70), pygame.SRCALPHA)
+            sprite.fill((180, 196, 186, 18))
+            self._sprites[key] = sprite
+        return sprite
+
+    def _puff_sprite(self, radius: int, color: tuple[int, ...]) -> pygame.Surface:
+        # Matches the original puff exactly: a (2r x 2r) canvas, so the disc's far edge is clipped.
+        key = ("puff", radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _disc_sprite(self, kind: str, radius: int, color: tuple[int, ...]) -> pygame.Surface:
+        key = (kind, radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._sprites[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _palette_key() -> tuple[tuple[int, int, int], ...]:
+        return (theme.COLOR_BG, theme.COLOR_PANEL, theme.COLOR_PANEL_ALT)
+
+    def _blit_static(self, surface: pygame.Surface, layer: str, render) -> None:
+        key = (layer, surface.get_size(), self._palette_key())
+        cached = self._static_layers.get(key)
+        if cached is None:
+            if len(self._static_layers) >= MAX_STATIC_LAYERS:
+                self._static_layers.clear()
+            cached = pygame.Surface(surface.get_size(), surface.get_flags(), surface)
+            render(cached)
+            self._static_layers[key] = cached
+        surface.blit(cached, (0, 0))
+
     @staticmethod
     def _mix(a: tuple[int, int, int], b: tuple[int, int, int], t: float) -> tuple[int, int, int]:
         return (
@@ -44,7 +115,7 @@ class BackgroundRenderer:
             max(0, min(255, color[2] + delta)),
         )
 
-    def _draw_vault(self, surface: pygame.Surface) -> None:
+    def _draw_vault_static(self, surface: pygame.Surface) -> None:
         top = self._mix(theme.COLOR_BG, theme.COLOR_PANEL, 0.30)
         bottom = self._mix(theme.COLOR_PANEL, theme.COLOR_PANEL_ALT, 0.62)
         self._draw_gradient(surface, top, bottom)
@@ -81,8 +152,10 @@ class BackgroundRenderer:
             )
             pygame.draw.line(surface, color, (0, y), (w, y))
 
-    def _draw_forest(self, surface: pygame.Surface) -> None:
+    def _draw_forest_static(self, surface: pygame.Surface) -> None:
         self._draw_gradient(surface, (16, 24, 20), (30, 42, 34))
+
+    def _draw_forest(self, surface: pygame.Surface) -> None:
         w, h = surface.get_size()
         for i in range(18):
             x = int((i / 18.0) * w)
@@ -91,52 +164,62 @@ class BackgroundRenderer:
             pygame.draw.rect(surface, (22, 30, 24), tree)
             crown = pygame.Rect(tree.left - 30, tree.top - 44, 86, 58)
             pygame.draw.ellipse(surface, (34, 54, 38), crown)
+        fog = self._fog_sprite()
+        span = w + 160
+        batch = []
         for px, py, speed in self.fog_particles:
-            drift = (self.t * speed * 12.0) % (w + 160)
-            x = int((px * w + drift) % (w + 160) - 80)
-            y = int(py * h)
-            fog = pygame.Surface((160, 70), pygame.SRCALPHA)
-            fog.fill((180, 196, 186, 18))
-            surface.blit(fog, (x, y))
+            drift = (self.t * speed * 12.0) % span
+            batch.append((fog, (int((px * w + drift) % span - 80), int(py * h))))
+        surface.blits(batch, doreturn=False)
 
-    def _draw_suburbs(self, surface: pygame.Surface) -> None:
+    def _draw_suburbs_static(self, surface: pygame.Surface) -> None:
         top = self._mix(theme.COLOR_BG, theme.COLOR_PANEL, 0.42)
         bottom = self._mix(theme.COLOR_PANEL, theme.COLOR_PANEL_ALT, 0.48)
         self._draw_gradient(surface, top, bottom)
         w, h = surface.get_size()
-        flicker = int(90 + 45 * (0.5 + 0.5 * math.sin(self.t * 5.5)))
+        pole = self._mix(theme.COLOR_PANEL_ALT, theme.COLOR_BG, 0.42)
         for i in range(6):
             x = int((i + 1) * w / 7)
-            pole = self._mix(theme.COLOR_PANEL_ALT, theme.COLOR_BG, 0.42)
             pygame.draw.line(surface, pole, (x, h - 280), (x, h - 30), 4)
+
+    def _draw_suburbs(self, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
+        flicker = int(90 + 45 * (0.5 + 0.5 * math.sin(self.t * 5.5)))
+        for i in range(6):
+            x = int((i + 1) * w / 7)
             spark = self._mix(theme.COLOR_WARNING, theme.COLOR_ACCENT, 0.25)
             spark = self._shift(spark, flicker - 120)
             pygame.draw.line(surface, spark, (x - 60, h - 220), (x + 60, h - 220), 2)
+        batch = []
         for px, py, speed in self.ash_particles:
             x = int(px * w + math.sin(self.t * speed + px * 6.0) * 18)
             y = int((py * h + self.t * speed * 34.0) % (h + 20))
             shade = int(120 + 80 * speed)
-            pygame.draw.circle(surface, (shade, shade, shade, 255), (x, y), 1)
+            batch.append((self._disc_sprite("ash", 1, (shade, shade, shade, 255)), (x - 1, y - 1)))
+        surface.blits(batch, doreturn=False)
 
-    def _draw_industrial(self, surface: pygame.Surface) -> None:
+    def _draw_industrial_static(self, surface: pygame.Surface) -> None:
         top = self._mix(theme.COLOR_BG, theme.COLOR_PANEL, 0.35)
         bottom = self._mix(theme.COLOR_PANEL, theme.COLOR_PANEL_ALT, 0.52)
         self._draw_gradient(surface, top, bottom)
         w, h = surface.get_size()
+        building = self._mix(theme.COLOR_PANEL_ALT, theme.COLOR_BG, 0.45)
         for i in range(10):
             x = int((i / 10.0) * w)
             y = h - 170 - (i % 3) * 22
-            building = self._mix(theme.COLOR_PANEL_ALT, theme.COLOR_BG, 0.45)
             pygame.draw.rect(surface, building, pygame.Rect(x, y, 120, 180))
+
+    def _draw_industrial(self, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
+        smoke = self._mix(theme.COLOR_TEXT_MUTED, theme.COLOR_PANEL_ALT, 0.55)
+        color = (smoke[0], smoke[1], smoke[2], 42)
+        batch = []
         for px, py, speed in self.steam_particles:
             x = int(px * w + math.sin(self.t * speed * 2.1 + px * 8.0) * 20)
             y = int((h - py * h * 0.7 - self.t * speed * 26.0) % h)
             radius = int(6 + speed * 6)
-            smoke = self._mix(theme.COLOR_TEXT_MUTED, theme.COLOR_PANEL_ALT, 0.55)
-            color = (smoke[0], smoke[1], smoke[2], 42)
-            puff = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(puff, color, (radius, radius), radius)
-            surface.blit(puff, (x - radius, y - radius))
+            batch.append((self._puff_sprite(radius, color), (x - radius, y - radius)))
+        surface.blits(batch, doreturn=False)
         for i in range(8):
             lx = int((i + 0.5) * w / 8)
             glow = int(45 + 40 * (0.5 + 0.5 * math.sin(self.t * 3.0 + i)))
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterable, Literal
 
 import pygame
 
@@ -87,6 +92,11 @@ FILE_EMBEDDED_LABELS: dict[str, str] = {
 }
 
 RenderMode = Literal["frame_text", "embedded_label", "procedural_fallback"]
+BaseKey = tuple[str, int, int, int, bool, str]
+
+TINTED_BASE_CACHE_SIZE = 256
+# Pixels tinted per prewarm slice: a full 256x64 skin is four slices of well under 1ms each.
+TINT_SLICE_PIXELS = 4096
 
 
 def available_skin_keys() -> tuple[str, ...]:
@@ -128,7 +138,10 @@ def skin_matches_label(skin_key: str | None, text: str) -> bool:
 
 def clear_cache() -> None:
     _load_raw.cache_clear()
+    _tinted_bases.clear()
     _render_tinted.cache_clear()
+    _prewarm_queue.clear()
+    _prewarm_jobs.clear()
 
 
 @lru_cache(maxsize=128)
@@ -156,27 +169,35 @@ def _brighten(color: tuple[int, int, int], delta: int) -> tuple[int, int, int]:
     )
 
 
+def _tint_pixel(pixel: int, tone: tuple[int, int, int]) -> int:
+    r, g, b, alpha = pixel.to_bytes(4, sys.byteorder)
+    if not alpha:
+        return 0
+    # Preserve luminance from source art so frame details survive tinting.
+    luma = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255.0
+    strength = 0.35 + (0.65 * luma)
+    return int.from_bytes(
+        bytes(
+            (
+                int(max(0, min(255, tone[0] * strength))),
+                int(max(0, min(255, tone[1] * strength))),
+                int(max(0, min(255, tone[2] * strength))),
+                alpha,
+            )
+        ),
+        sys.byteorder,
+    )
+
+
 def _single_hue_tint(raw: pygame.Surface, tone: tuple[int, int, int]) -> pygame.Surface:
-    width, height = raw.get_size()
-    tinted = pygame.Surface((width, height), pygame.SRCALPHA)
-    for y in range(height):
-        for x in range(width):
-            pixel = raw.get_at((x, y))
-            alpha = pixel.a
-            if alpha:
-                # Preserve luminance from source art so frame details survive tinting.
-                luma = (0.2126 * pixel.r + 0.7152 * pixel.g + 0.0722 * pixel.b) / 255.0
-                strength = 0.35 + (0.65 * luma)
-                tinted.set_at(
-                    (x, y),
-                    (
-                        int(max(0, min(255, tone[0] * strength))),
-                        int(max(0, min(255, tone[1] * strength))),
-                        int(max(0, min(255, tone[2] * strength))),
-                        alpha,
-                    ),
-                )
-    return tinted
+    # Skin art uses a few dozen distinct colours, so tint each colour once and map the
+    # whole RGBA buffer through that table instead of touching pixels one by one.
+    size = raw.get_size()
+    pixels = array("I")
+    pixels.frombytes(pygame.image.tobytes(raw, "RGBA"))
+    table = {pixel: _tint_pixel(pixel, tone) for pixel in set(pixels)}
+    tinted = array("I", map(table.__getitem__, pixels))
+    return pygame.image.frombytes(tinted.tobytes(), size, "RGBA")
 
 
 def _scrub_embedded_label_band(surface: pygame.Surface, tone: tuple[int, int, int]) -> None:
@@ -199,6 +220,47 @@ def _scrub_embedded_label_band(surface: pygame.Surface, tone: tuple[int, int, in
     surface.blit(scrub, band_rect.topleft)
 
 
+def _base_tone(key: BaseKey) -> tuple[int, int, int]:
+    _skin_key, tone_r, tone_g, tone_b, enabled, _render_mode = key
+    if enabled:
+        return (tone_r, tone_g, tone_b)
+    return (
+        (tone_r + theme.COLOR_BUTTON_DISABLED[0]) // 2,
+        (tone_g + theme.COLOR_BUTTON_DISABLED[1]) // 2,
+        (tone_b + theme.COLOR_BUTTON_DISABLED[2]) // 2,
+    )
+
+
+def _finish_base(key: BaseKey, tinted: pygame.Surface | None) -> pygame.Surface | None:
+    if tinted is not None and key[5] == "frame_text":
+        _scrub_embedded_label_band(tinted, _base_tone(key))
+    _tinted_bases[key] = tinted
+    _tinted_bases.move_to_end(key)
+    while len(_tinted_bases) > TINTED_BASE_CACHE_SIZE:
+        _tinted_bases.popitem(last=False)
+    return tinted
+
+
+# Explicit LRU rather than lru_cache so prewarm can tell which bases still need tinting.
+_tinted_bases: OrderedDict[BaseKey, pygame.Surface | None] = OrderedDict()
+
+
+def _tinted_base(
+    skin_key: str,
+    tone_r: int,
+    tone_g: int,
+    tone_b: int,
+    enabled: bool,
+    render_mode: str,
+) -> pygame.Surface | None:
+    key = (skin_key, tone_r, tone_g, tone_b, enabled, render_mode)
+    if key in _tinted_bases:
+        _tinted_bases.move_to_end(key)
+        return _tinted_bases[key]
+    raw = _load_raw(skin_key)
+    return _finish_base(key, None if raw is None else _single_hue_tint(raw, _base_tone(key)))
+
+
 @lru_cache(maxsize=1024)
 def _render_tinted(
     skin_key: str,
@@ -210,24 +272,21 @@ def _render_tinted(
     enabled: bool,
     render_mode: str,
 ) -> pygame.Surface | None:
-    raw = _load_raw(skin_key)
-    if raw is None:
+    # Tinting happens once per skin/tone/state at source size; each button size only scales.
+    tinted = _tinted_base(skin_key, tone_r, tone_g, tone_b, enabled, render_mode)
+    if tinted is None:
         return None
-    tone = (tone_r, tone_g, tone_b)
-    if not enabled:
-        tone = (
-            (tone[0] + theme.COLOR_BUTTON_DISABLED[0]) // 2,
-            (tone[1] + theme.COLOR_BUTTON_DISABLED[1]) // 2,
-            (tone[2] + theme.COLOR_BUTTON_DISABLED[2]) // 2,
-        )
-    tinted = _single_hue_tint(raw, tone)
-    if render_mode == "frame_text":
-        _scrub_embedded_label_band(tinted, tone)
-    if (width, height) != raw.get_size():
+    if (width, height) != tinted.get_size():
         return pygame.transform.scale(tinted, (width, height))
     return tinted
 
 
+def _button_tone(hovered: bool, enabled: bool) -> tuple[int, int, int]:
+    if hovered and enabled:
+        return _brighten(theme.COLOR_BUTTON_FLAT, 18)
+    return theme.COLOR_BUTTON_FLAT
+
+
 def get_button_surface(
     skin_key: str | None,
     size: tuple[int, int],
@@ -241,9 +300,7 @@ def get_button_surface(
         return None
     width = max(8, int(size[0]))
     height = max(8, int(size[1]))
-    tone = theme.COLOR_BUTTON_FLAT
-    if hovered and enabled:
-        tone = _brighten(tone, 18)
+    tone = _button_tone(hovered, enabled)
     return _render_tinted(
         skin_key,
         width,
@@ -254,3 +311,108 @@ def get_button_surface(
         enabled,
         render_mode,
     )
+
+
+@dataclass(slots=True)
+class _TintJob:
+    """One skin tint split into ``TINT_SLICE_PIXELS`` slices; output matches ``_single_hue_tint``."""
+
+    size: tuple[int, int]
+    tone: tuple[int, int, int]
+    pixels: array
+    table: dict[int, int] = field(default_factory=dict)
+    tinted: array = field(default_factory=lambda: array("I"))
+
+    @classmethod
+    def start(cls, raw: pygame.Surface, tone: tuple[int, int, int]) -> _TintJob:
+        pixels = array("I")
+        pixels.frombytes(pygame.image.tobytes(raw, "RGBA"))
+        return cls(size=raw.get_size(), tone=tone, pixels=pixels)
+
+    @property
+    def done(self) -> bool:
+        return len(self.tinted) >= len(self.pixels)
+
+    def advance(self) -> None:
+        start = len(self.tinted)
+        chunk = self.pixels[start : start + TINT_SLICE_PIXELS]
+        table = self.table
+        for pixel in set(chunk).difference(table):
+            table[pixel] = _tint_pixel(pixel, self.tone)
+        self.tinted.extend(map(table.__getitem__, chunk))
+
+    def surface(self) -> pygame.Surface:
+        return pygame.image.frombytes(self.tinted.tobytes(), self.size, "RGBA")
+
+
+PrewarmRequest = tuple[str, tuple[int, int], bool, bool, RenderMode]
+_prewarm_queue: deque[PrewarmRequest] = deque()
+_prewarm_jobs: dict[BaseKey, _TintJob] = {}
+
+
+def queue_prewarm(buttons: Iterable[Any]) -> int:
+    """Queue every skin variant (idle, hover, disabled) the given buttons can draw.
+
+    Accepts anything shaped like ``widgets.Button``. Returns the number of requests queued.
+    """
+    queued = 0
+    for button in buttons:
+        if not getattr(button, "allow_skin", False):
+            continue
+        render_mode = button.skin_render_mode
+        if render_mode == "procedural_fallback":
+            continue
+        skin_key = button.skin_key or infer_skin_key(button.text)
+        if not skin_key:
+            continue
+        if render_mode == "embedded_label" and not skin_matches_label(skin_key, button.text):
+            continue
+        size = (button.rect.width, button.rect.height)
+        for hovered, enabled in ((False, True), (True, True), (False, False)):
+            _prewarm_queue.append((skin_key, size, hovered, enabled, render_mode))
+            queued += 1
+    return queued
+
+
+def _advance_prewarm_tint(key: BaseKey) -> None:
+    job = _prewarm_jobs.get(key)
+    if job is None:
+        raw = _load_raw(key[0])
+        if raw is None:
+            _finish_base(key, None)
+            return
+        job = _prewarm_jobs[key] = _TintJob.start(raw, _base_tone(key))
+    job.advance()
+    if job.done:
+        del _prewarm_jobs[key]
+        _finish_base(key, job.surface())
+
+
+def prewarm_step(budget_ms: float) -> int:
+    """Work through queued skin variants within ``budget_ms``; returns how many finished.
+
+    Tints advance one slice at a time and the step stops before a unit that would
+    likely run past the deadline, judged by the previous unit. At least one unit runs.
+    """
+    done = 0
+    now = time.perf_counter()
+    deadline = now + budget_ms / 1000.0
+    while _prewarm_queue:
+        started = now
+        skin_key, size, hovered, enabled, render_mode = _prewarm_queue[0]
+        tone = _button_tone(hovered, enabled)
+        key = (skin_key, tone[0], tone[1], tone[2], enabled, render_mode)
+        if key in _tinted_bases:
+            _prewarm_queue.popleft()
+            get_button_surface(skin_key, size, hovered=hovered, enabled=enabled, render_mode=render_mode)
+            done += 1
+        else:
+            _advance_prewarm_tint(key)
+        now = time.perf_counter()
+        if now + (now - started) >= deadline:
+            break
+    return done
+
+
+def prewarm_pending() -> int:
+    return len(_prewarm_queue)
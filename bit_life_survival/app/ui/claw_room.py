@@ -12,6 +12,11 @@ from . import theme
 from .avatar import draw_citizen_sprite
 from .widgets import draw_text
 
+# Seconds actors keep walking after the last input or roster change before they stand still.
+ROOM_WANDER_S = 8.0
+# Spacing pushes and block accumulation were tuned per frame at this rate; scale them by dt.
+ROOM_REFERENCE_FPS = 60.0
+
 
 @dataclass(slots=True)
 class RoomActor:
@@ -39,6 +44,7 @@ class ClawRoom:
         self.selected_roster_id: str | None = None
 
         self._time_s: float = 0.0
+        self._wander_s: float = ROOM_WANDER_S
         self._last_hitboxes: list[tuple[str, str, pygame.Rect]] = []
         self._finished_target_id: str | None = None
 
@@ -54,6 +60,21 @@ class ClawRoom:
     def is_animating(self) -> bool:
         return self.claw_phase != "idle"
 
+    @property
+    def actors_moving(self) -> bool:
+        """Whether actors are still walking or easing between lanes."""
+        if self._wander_s > 0.0:
+            return True
+        return any(
+            actor.lane_blend != float(actor.lane_target) or actor.lane_blend_velocity
+            for actors in (self.intake_actors, self.roster_actors)
+            for actor in actors.values()
+        )
+
+    def wake(self) -> None:
+        """Restart the wander period; call on input so settled actors walk again."""
+        self._wander_s = ROOM_WANDER_S
+
     def _actor_seed(self, citizen_id: str) -> bytes:
         return hashlib.sha256(citizen_id.encode("utf-8")).digest()
 
@@ -97,6 +118,7 @@ class ClawRoom:
         for idx, citizen in enumerate(citizens):
             if citizen.id not in actors:
                 actors[citizen.id] = self._spawn_actor(citizen.id, idx, len(citizens), room)
+                self.wake()
 
     def start_grab(self, target_id: str) -> bool:
         if self.is_animating:
@@ -110,6 +132,7 @@ class ClawRoom:
         self._claw_pick_world_x = self._room_world_x("intake", actor.x_norm)
         self._claw_release_world_x = 0.79
         self.claw_phase = "move_to_pick"
+        self.wake()
         return True
 
     def consume_finished_target(self) -> str | None:
@@ -143,10 +166,14 @@ class ClawRoom:
         return 0.05 + (x_norm * 0.40)
 
     def update(self, dt: float) -> None:
-        self._time_s += dt
+        wandering = self._wander_s > 0.0 or self.claw_phase != "idle"
+        self._wander_s = max(0.0, self._wander_s - dt)
+        if wandering:
+            # Frozen while settled so the idle claw sway holds still too.
+            self._time_s += dt
         skip_id = self.claw_target_id if self.claw_phase != "idle" else None
-        self._update_room(self.intake_actors, dt, skip_id=skip_id)
-        self._update_room(self.roster_actors, dt, skip_id=None)
+        self._update_room(self.intake_actors, dt, skip_id=skip_id, wandering=wandering)
+        self._update_room(self.roster_actors, dt, skip_id=None, wandering=wandering)
 
         if self.claw_phase == "idle":
             self.claw_world_x = 0.22 + math.sin(self._time_s * 0.45) * 0.012
@@ -187,10 +214,19 @@ class ClawRoom:
                 self.claw_phase = "idle"
                 self.claw_target_id = None
 
-    def _update_room(self, actors: dict[str, RoomActor], dt: float, skip_id: str | None) -> None:
+    def _update_room(self, actors: dict[str, RoomActor], dt: float, skip_id: str | None, wandering: bool = True) -> None:
         left, right = 0.07, 0.93
         lane_gap = 0.12
+        frames = dt * ROOM_REFERENCE_FPS
         actor_list = list(actors.values())
+        if not wandering:
+            # Settled: drop reactions and let lane easing finish; nobody walks.
+            for actor in actor_list:
+                actor.reaction = "wander"
+                actor.reaction_time = 0.0
+                actor.blocked_time = 0.0
+            self._ease_lanes(actor_list, dt)
+            return
         for actor in actor_list:
             if actor.citizen_id == skip_id:
                 continue
@@ -226,18 +262,18 @@ class ClawRoom:
                 min_x = prev.x_norm + lane_gap
                 if curr.x_norm < min_x:
                     overlap = min_x - curr.x_norm
-                    curr_push = min(overlap * 0.5, 0.014)
-                    prev_push = min(overlap * 0.3, 0.010)
+                    curr_push = min(overlap * 0.5, 0.014 * frames)
+                    prev_push = min(overlap * 0.3, 0.010 * frames)
                     curr.x_norm += curr_push
                     prev.x_norm -= prev_push
-                    curr.blocked_time += overlap * 4.0
-                    prev.blocked_time += overlap * 2.8
+                    curr.blocked_time += overlap * 4.0 * frames
+                    prev.blocked_time += overlap * 2.8 * frames
             for i in range(len(lane_actors) - 2, -1, -1):
                 curr = lane_actors[i]
                 nxt = lane_actors[i + 1]
                 max_x = nxt.x_norm - lane_gap
                 if curr.x_norm > max_x:
-                    curr.x_norm -= min(curr.x_norm - max_x, 0.014)
+                    curr.x_norm -= min(curr.x_norm - max_x, 0.014 * frames)
             for actor in lane_actors:
                 actor.x_norm = max(left, min(right, actor.x_norm))
 
@@ -252,8 +288,8 @@ class ClawRoom:
                     continue
                 if abs(actor.x_norm - other.x_norm) >= lane_gap:
                     continue
-                actor.blocked_time += 0.16
-                other.blocked_time += 0.16
+                actor.blocked_time += 0.16 * frames
+                other.blocked_time += 0.16 * frames
 
         for actor in actor_list:
             if actor.citizen_id == skip_id:
@@ -263,6 +299,10 @@ class ClawRoom:
             self._react_to_block(actor, actors, lane_gap)
             actor.blocked_time = 0.0
 
+        self._ease_lanes(actor_list, dt)
+
+    @staticmethod
+    def _ease_lanes(actor_list: list[RoomActor], dt: float) -> None:
         # Smooth visual lane transition with damped velocity to avoid micro-jitter.
         stiffness = 42.0
         damping = 11.0
@@ -364,6 +404,8 @@ class ClawRoom:
                 continue
             lane_offset = int(round(-14 + (actor.lane_blend * 12.0)))
             pose = "walk"
+            # Walk frame 0 is the neutral standing stance once the room settles.
+            walk_phase = actor.walk_phase if self._wander_s > 0.0 else 0.0
             reaction_offset = 0
             if actor.reaction == "jump":
                 pose = "jump"
@@ -382,7 +424,7 @@ class ClawRoom:
                 citizen_id=actor.citizen_id,
                 scale=2,
                 selected=selected,
-                walk_phase=actor.walk_phase,
+                walk_phase=walk_phase,
                 pose=pose,
             )
             self._last_hitboxes.append((room_name, actor.citizen_id, sprite_rect.inflate(4, 4)))
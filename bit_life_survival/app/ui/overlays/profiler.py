@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pygame
+
+from bit_life_survival.app.services.frame_profiler import HISTOGRAM_EDGES_MS, PHASES, ProfileSummary
+from bit_life_survival.app.ui import theme
+from bit_life_survival.app.ui.widgets import draw_text
+
+PANEL_WIDTH = 300
+
+
+def draw_profiler_overlay(surface: pygame.Surface, summary: ProfileSummary) -> pygame.Rect:
+    font = theme.get_font(12)
+    line_h = font.get_linesize() + 2
+    lines = [
+        (f"{summary.scene}  {summary.fps:5.1f} FPS", theme.COLOR_TEXT),
+        (f"p50 {summary.p50_ms:5.2f}  p99 {summary.p99_ms:5.2f}  max {summary.max_ms:5.2f} ms", theme.COLOR_TEXT),
+    ]
+    for phase in PHASES:
+        lines.append((f"{phase:<10} {summary.phase_ms.get(phase, 0.0):6.2f} ms", theme.COLOR_TEXT_MUTED))
+
+    bars_h = 34
+    panel = pygame.Rect(0, 0, PANEL_WIDTH, 12 + len(lines) * line_h + bars_h + 16)
+    panel.topright = (surface.get_width() - 8, 8)
+    backdrop = pygame.Surface(panel.size, pygame.SRCALPHA)
+    backdrop.fill((0, 0, 0, 176))
+    surface.blit(backdrop, panel.topleft)
+    pygame.draw.rect(surface, theme.COLOR_BORDER, panel, width=1)
+
+    y = panel.top + 6
+    for text, color in lines:
+        draw_text(surface, text, font, color, (panel.left + 8, y))
+        y += line_h
+
+    # Work-time histogram; the bucket containing the 60 FPS budget and beyond is tinted.
+    buckets = len(summary.histogram)
+    peak = max(1, max(summary.histogram, default=0))
+    bar_w = (panel.width - 16) // max(1, buckets)
+    baseline = y + bars_h
+    for index, count in enumerate(summary.histogram):
+        height = int(round((count / peak) * bars_h))
+        over_budget = index > 0 and HISTOGRAM_EDGES_MS[index - 1] >= 16.7
+        color = theme.COLOR_DANGER if over_budget else theme.COLOR_ACCENT
+        if height:
+            pygame.draw.rect(surface, color, pygame.Rect(panel.left + 8 + index * bar_w, baseline - height, bar_w - 2, height))
+    pygame.draw.line(surface, theme.COLOR_BORDER, (panel.left + 8, baseline), (panel.right - 8, baseline), 1)
+    return panel
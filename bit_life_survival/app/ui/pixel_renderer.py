@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 
 import pygame
 
+# Target height (in canvas rows) of the horizontal bands compared for changes each frame.
+DIRTY_BAND_ROWS = 16
+
 
 @dataclass(slots=True)
 class PixelRenderer:
     virtual_width: int = 640
     virtual_height: int = 360
     clear_color: tuple[int, int, int] = (22, 14, 30)
+    dirty_tracking: bool = True
     _window_size: tuple[int, int] = field(init=False, repr=False)
     _scaled_size: tuple[int, int] = field(init=False, repr=False)
     _offset: tuple[int, int] = field(init=False, repr=False)
@@ -17,6 +22,8 @@ class PixelRenderer:
     _cached_scaled: pygame.Surface | None = field(init=False, default=None, repr=False)
     _cached_source_size: tuple[int, int] | None = field(init=False, default=None, repr=False)
     _cached_target_size: tuple[int, int] | None = field(init=False, default=None, repr=False)
+    _previous_pixels: bytes | None = field(init=False, default=None, repr=False)
+    _band_rows: int = field(init=False, default=0, repr=False)
 
     def __post_init__(self) -> None:
         self._window_size: tuple[int, int] = (self.virtual_width * 2, self.virtual_height * 2)
@@ -26,6 +33,8 @@ class PixelRenderer:
         self._cached_scaled: pygame.Surface | None = None
         self._cached_source_size: tuple[int, int] | None = None
         self._cached_target_size: tuple[int, int] | None = None
+        self._previous_pixels: bytes | None = None
+        self._band_rows = 0
 
     @property
     def virtual_size(self) -> tuple[int, int]:
@@ -50,6 +59,11 @@ class PixelRenderer:
         self._cached_scaled = None
         self._cached_source_size = None
         self._cached_target_size = None
+        self._previous_pixels = None
+
+    def invalidate(self) -> None:
+        """Force the next ``present`` to redraw the whole window (e.g. after it was exposed)."""
+        self._previous_pixels = None
 
     def window_to_virtual(self, pos: tuple[int, int]) -> tuple[int, int]:
         if self._scale <= 0.0:
@@ -72,7 +86,13 @@ class PixelRenderer:
             return pygame.event.Event(event.type, payload)
         return event
 
-    def present(self, window_surface: pygame.Surface, canvas_surface: pygame.Surface) -> None:
+    def present(self, window_surface: pygame.Surface, canvas_surface: pygame.Surface) -> list[pygame.Rect]:
+        """Scale the canvas onto the window and return the window rects that changed.
+
+        With ``dirty_tracking`` the canvas is compared with the previous frame in horizontal
+        bands and only changed bands are rescaled and blitted; an unchanged frame returns
+        ``[]`` and needs no display update at all.
+        """
         if window_surface.get_size() != self._window_size:
             self.set_window_size(window_surface.get_size())
 
@@ -82,11 +102,56 @@ class PixelRenderer:
             or self._cached_source_size != source_size
             or self._cached_target_size != self._scaled_size
         ):
-            self._cached_scaled = pygame.transform.scale(canvas_surface, self._scaled_size)
+            self._cached_scaled = pygame.Surface(self._scaled_size, 0, canvas_surface)
             self._cached_source_size = source_size
             self._cached_target_size = self._scaled_size
-        else:
+            self._band_rows = self._aligned_band_rows(source_size[1], self._scaled_size[1])
+            self._previous_pixels = None
+
+        pixels = canvas_surface.get_buffer().raw if self.dirty_tracking else None
+        previous = self._previous_pixels
+        self._previous_pixels = pixels
+        if pixels is None or previous is None or len(previous) != len(pixels):
             pygame.transform.scale(canvas_surface, self._scaled_size, self._cached_scaled)
+            window_surface.fill(self.clear_color)
+            window_surface.blit(self._cached_scaled, self._offset)
+            return [window_surface.get_rect()]
 
-        window_surface.fill(self.clear_color)
-        window_surface.blit(self._cached_scaled, self._offset)
+        rects: list[pygame.Rect] = []
+        for top, bottom in self._changed_runs(previous, pixels, canvas_surface.get_pitch(), source_size[1]):
+            rects.append(self._present_rows(window_surface, canvas_surface, top, bottom))
+        return rects
+
+    def _aligned_band_rows(self, source_height: int, target_height: int) -> int:
+        # Rescaling a band on its own matches the full-canvas scale only when the band edges
+        # land on whole target rows, i.e. on multiples of source_height / gcd(...).
+        unit = source_height // math.gcd(source_height, target_height)
+        return max(unit, (DIRTY_BAND_ROWS // unit) * unit)
+
+    def _changed_runs(self, previous: bytes, pixels: bytes, pitch: int, height: int) -> list[tuple[int, int]]:
+        runs: list[tuple[int, int]] = []
+        band = self._band_rows
+        for top in range(0, height, band):
+            bottom = min(height, top + band)
+            if previous[top * pitch : bottom * pitch] == pixels[top * pitch : bottom * pitch]:
+                continue
+            if runs and runs[-1][1] == top:
+                runs[-1] = (runs[-1][0], bottom)
+            else:
+                runs.append((top, bottom))
+        return runs
+
+    def _present_rows(self, window_surface: pygame.Surface, canvas_surface: pygame.Surface, top: int, bottom: int) -> pygame.Rect:
+        source_width, source_height = canvas_surface.get_size()
+        target_width, target_height = self._scaled_size
+        target_top = top * target_height // source_height
+        target_bottom = bottom * target_height // source_height
+        area = pygame.Rect(0, target_top, target_width, target_bottom - target_top)
+        pygame.transform.scale(
+            canvas_surface.subsurface((0, top, source_width, bottom - top)),
+            area.size,
+            self._cached_scaled.subsurface(area),
+        )
+        window_rect = area.move(self._offset)
+        window_surface.blit(self._cached_scaled, window_rect, area)
+        return window_rect
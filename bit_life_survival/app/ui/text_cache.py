@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pygame
+
+from . import theme
+
+DEFAULT_TEXT_CACHE_BYTES = 8 * 1024 * 1024
+DEFAULT_WRAP_CACHE_ENTRIES = 2048
+DEFAULT_WIDTH_CACHE_ENTRIES = 8192
+
+TextKey = tuple[int, str, tuple[int, ...], bool]
+
+
+@dataclass(slots=True)
+class TextCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+
+
+class TextSurfaceCache:
+    """LRU cache of ``font.render`` results bounded by surface bytes.
+
+    Keys use font identity, so each entry keeps its font alive to stop a recycled ``id``
+    from matching a different font. The whole cache is dropped when ``theme`` reports a
+    new style generation (theme or font scale change).
+    """
+
+    __slots__ = ("max_bytes", "_entries", "_bytes", "_generation", "_stats")
+
+    def __init__(self, max_bytes: int = DEFAULT_TEXT_CACHE_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[TextKey, tuple[pygame.font.Font, pygame.Surface, int]] = OrderedDict()
+        self._bytes = 0
+        self._generation = theme.style_generation()
+        self._stats = TextCacheStats()
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, ...],
+        antialias: bool = False,
+    ) -> pygame.Surface:
+        generation = theme.style_generation()
+        if generation != self._generation:
+            self.clear()
+            self._generation = generation
+        key = (id(font), text, tuple(color), antialias)
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None and entry[0] is font:
+            entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+        self._stats.misses += 1
+        rendered = font.render(text, antialias, color)
+        size = rendered.get_bytesize() * rendered.get_width() * rendered.get_height()
+        if entry is not None:
+            self._bytes -= entry[2]
+            del entries[key]
+        if size > self.max_bytes:
+            return rendered
+        entries[key] = (font, rendered, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, _, evicted) = entries.popitem(last=False)
+            self._bytes -= evicted
+            self._stats.evictions += 1
+        return rendered
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> TextCacheStats:
+        return TextCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            entries=len(self._entries),
+            bytes_used=self._bytes,
+        )
+
+    def reset_stats(self) -> None:
+        self._stats = TextCacheStats()
+
+
+class TextWrapCache:
+    """Memoized greedy word wrapping.
+
+    Whole results are cached per ``(font, text, max_width)`` in an LRU, and every string
+    measured while wrapping goes through a per-font width memo, so re-wrapping the same
+    text at another width mostly reuses earlier ``font.size`` calls. Widths are never
+    summed from parts: ``font.size`` is not additive once kerning applies.
+    """
+
+    __slots__ = ("max_entries", "max_widths", "_wraps", "_widths", "_generation", "hits", "misses")
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_WRAP_CACHE_ENTRIES,
+        max_widths: int = DEFAULT_WIDTH_CACHE_ENTRIES,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_widths = max(1, int(max_widths))
+        self._wraps: OrderedDict[tuple[int, str, int], tuple[pygame.font.Font, tuple[str, ...]]] = OrderedDict()
+        self._widths: dict[int, tuple[pygame.font.Font, dict[str, int]]] = {}
+        self._generation = theme.style_generation()
+        self.hits = 0
+        self.misses = 0
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> tuple[str, ...]:
+        if max_width <= 0:
+            return (text,)
+        generation = theme.style_generation()
+        if generation != self._generation:
+            self.clear()
+            self._generation = generation
+        key = (id(font), text, max_width)
+        wraps = self._wraps
+        entry = wraps.get(key)
+        if entry is not None and entry[0] is font:
+            wraps.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        lines = self._wrap_uncached(text, font, max_width)
+        wraps[key] = (font, lines)
+        wraps.move_to_end(key)
+        while len(wraps) > self.max_entries:
+            wraps.popitem(last=False)
+        return lines
+
+    def clear(self) -> None:
+        self._wraps.clear()
+        self._widths.clear()
+
+    def _width_table(self, font: pygame.font.Font) -> dict[str, int]:
+        entry = self._widths.get(id(font))
+        if entry is None or entry[0] is not font:
+            entry = (font, {})
+            self._widths[id(font)] = entry
+        elif len(entry[1]) > self.max_widths:
+            entry[1].clear()
+        return entry[1]
+
+    def _wrap_uncached(self, text: str, font: pygame.font.Font, max_width: int) -> tuple[str, ...]:
+        words = text.split()
+        if not words:
+            return ("",)
+        widths = self._width_table(font)
+        lines: list[str] = []
+        current = words[0]
+        for word in words[1:]:
+            candidate = f"{current} {word}"
+            width = widths.get(candidate)
+            if width is None:
+                width = font.size(candidate)[0]
+                widths[candidate] = width
+            if width <= max_width:
+                current = candidate
+            else:
+                lines.append(current)
+                current = word
+        lines.append(current)
+        return tuple(lines)
+
+
+TEXT_CACHE = TextSurfaceCache()
+WRAP_CACHE = TextWrapCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color: tuple[int, ...], antialias: bool = False) -> pygame.Surface:
+    return TEXT_CACHE.render(font, text, color, antialias)
+
+
+def wrap_lines(text: str, font: pygame.font.Font, max_width: int) -> tuple[str, ...]:
+    return WRAP_CACHE.wrap(text, font, max_width)
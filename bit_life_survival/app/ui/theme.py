@@ -496,6 +496,8 @@ FONT_SIZE_META = 13
 FontKind = Literal["body", "display"]
 FontRole = Literal["title", "section", "body", "meta"]
 _FONT_SCALE = 1.0
+# Bumped whenever fonts or palette change so caches of rendered output can drop stale entries.
+_STYLE_GENERATION = 0
 _FONT_DIR = Path(__file__).resolve().parents[2] / "assets" / "fonts"
 _FONT_FILES: dict[str, dict[str, str]] = {
     "body": {
@@ -517,8 +519,12 @@ def available_themes() -> tuple[str, ...]:
     return tuple(THEMES.keys())
 
 
+def style_generation() -> int:
+    return _STYLE_GENERATION
+
+
 def apply_theme(theme_name: str | None) -> str:
-    global CURRENT_THEME
+    global CURRENT_THEME, _STYLE_GENERATION
     palette = THEMES.get(theme_name or "")
     if palette is None:
         theme_name = DEFAULT_THEME
@@ -548,13 +554,15 @@ def apply_theme(theme_name: str | None) -> str:
             "COLOR_BUTTON_FLAT": palette.button_flat,
         }
     )
+    _STYLE_GENERATION += 1
     return CURRENT_THEME
 
 
 def set_font_scale(scale: float) -> None:
-    global _FONT_SCALE
+    global _FONT_SCALE, _STYLE_GENERATION
     _FONT_SCALE = max(0.75, min(1.6, float(scale)))
     _load_font.cache_clear()
+    _STYLE_GENERATION += 1
 
 
 @lru_cache(maxsize=256)
@@ -7,6 +7,7 @@ import pygame
 
 from . import button_skins, theme
 from .layout import split_columns
+from .text_cache import render_text, wrap_lines
 
 
 def draw_text(
@@ -17,7 +18,7 @@ def draw_text(
     pos: tuple[int, int],
     anchor: str = "topleft",
 ) -> pygame.Rect:
-    rendered = font.render(text, False, color)
+    rendered = render_text(font, text, color)
     rect = rendered.get_rect()
     setattr(rect, anchor, pos)
     surface.blit(rendered, rect)
@@ -25,22 +26,7 @@ def draw_text(
 
 
 def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
-    if max_width <= 0:
-        return [text]
-    words = text.split()
-    if not words:
-        return [""]
-    lines: list[str] = []
-    current = words[0]
-    for word in words[1:]:
-        candidate = f"{current} {word}"
-        if font.size(candidate)[0] <= max_width:
-            current = candidate
-        else:
-            lines.append(current)
-            current = word
-    lines.append(current)
-    return lines
+    return list(wrap_lines(text, font, max_width))
 
 
 def clamp_wrapped_lines(
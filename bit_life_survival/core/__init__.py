@@ -9,6 +9,7 @@ from .engine import (
     apply_choice,
     apply_choice_with_state_rng,
     apply_choice_with_state_rng_detailed,
+    create_initial_sim_state,
     create_initial_state,
     run_simulation,
     step,
@@ -16,6 +17,7 @@ from .engine import (
 from .loader import ContentBundle, ContentValidationError, load_content
 from .models import GameState, SaveData, VaultState
 from .outcomes import OutcomeReport
+from .sim_state import SimState
 from .persistence import (
     create_default_save_data,
     draft_citizen_from_claw,
@@ -37,12 +39,14 @@ __all__ = [
     "GameState",
     "OutcomeReport",
     "SaveData",
+    "SimState",
     "VaultState",
     "advance_to_next_event",
     "apply_choice",
     "apply_choice_with_state_rng",
     "apply_choice_with_state_rng_detailed",
     "create_default_save_data",
+    "create_initial_sim_state",
     "create_initial_state",
     "draft_citizen_from_claw",
     "load_content",
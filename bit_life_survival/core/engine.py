@@ -4,11 +4,12 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 from .loader import ContentBundle
-from .models import GameState, LogEntry, make_log_entry
+from .models import GameState, LogEntry, LogLevel, make_log_entry
 from .outcomes import OutcomeReport, apply_outcomes
-from .requirements import evaluate_requirement
+from .requirements import RequirementContext
 from .rng import DeterministicRNG
 from .selector import select_event
+from .sim_state import RunState, SimState
 from .travel import advance_travel
 
 AutopickPolicy = Literal["safe", "random", "greedy"]
@@ -58,6 +59,12 @@ def create_initial_state(seed: int | str, biome_id: str) -> GameState:
     return GameState(seed=seed, biome_id=biome_id, rng_state=rng.state, rng_calls=rng.calls)
 
 
+def create_initial_sim_state(seed: int | str, biome_id: str) -> SimState:
+    """Initial state on the lightweight backend used by headless batch runs."""
+    rng = DeterministicRNG.from_seed(seed)
+    return SimState(seed=seed, biome_id=biome_id, rng_state=rng.state, rng_calls=rng.calls)
+
+
 def _decrement_cooldowns(state: GameState) -> None:
     next_cooldowns: dict[str, int] = {}
     for event_id, remaining in state.event_cooldowns.items():
@@ -85,12 +92,19 @@ def _option_loot_bias(option_payload: list[dict[str, Any]]) -> int:
     return bias
 
 
-def _instantiate_event(event: Any, state: GameState, content: ContentBundle) -> EventInstance:
+def _instantiate_event(
+    event: Any,
+    state: GameState,
+    content: ContentBundle,
+    requirements: RequirementContext | None = None,
+) -> EventInstance:
+    if requirements is None:
+        requirements = RequirementContext(state, content)
     options: list[EventOptionInstance] = []
     for option in event.options:
         death_hint = max(_option_death_chance(option.costs), _option_death_chance(option.outcomes))
         loot_bias = _option_loot_bias(option.outcomes)
-        if option.requirements is None:
+        if requirements.check(event, option):
             options.append(
                 EventOptionInstance(
                     id=option.id,
@@ -107,7 +121,7 @@ def _instantiate_event(event: Any, state: GameState, content: ContentBundle) ->
             )
             continue
 
-        ok, reasons = evaluate_requirement(option.requirements, state, content)
+        ok, reasons = requirements.explain(event, option)
         options.append(
             EventOptionInstance(
                 id=option.id,
@@ -161,37 +175,46 @@ def apply_choice_detailed(
     option_id: str,
     content: ContentBundle,
     rng: DeterministicRNG,
+    log_level: LogLevel = "full",
 ) -> ChoiceResolution:
     option = next((option for option in event_instance.options if option.id == option_id), None)
     if option is None:
         raise ValueError(f"Option '{option_id}' not found on event '{event_instance.event_id}'.")
+    full = log_level == "full"
     if option.locked:
+        if log_level == "none":
+            return ChoiceResolution(logs=[], report=OutcomeReport())
         return ChoiceResolution(
             logs=[
                 make_log_entry(
                     state,
                     "system",
-                    f"Choice '{option.label}' is locked: {'; '.join(option.lock_reasons) or 'unknown reason'}",
+                    f"Choice '{option.label}' is locked: {'; '.join(option.lock_reasons) or 'unknown reason'}"
+                    if full
+                    else "",
+                    data=None if full else {"eventId": event_instance.event_id, "optionId": option.id},
                 )
             ],
             report=OutcomeReport(),
         )
 
-    logs: list[LogEntry] = [
-        make_log_entry(
-            state,
-            "choice",
-            option.log_line,
-            data={"eventId": event_instance.event_id, "optionId": option.id},
+    logs: list[LogEntry] = []
+    if log_level != "none":
+        logs.append(
+            make_log_entry(
+                state,
+                "choice",
+                option.log_line if full else "",
+                data={"eventId": event_instance.event_id, "optionId": option.id},
+            )
         )
-    ]
     report = OutcomeReport()
     if option.costs:
-        cost_logs, cost_report = apply_outcomes(state, option.costs, content, rng)
+        cost_logs, cost_report = apply_outcomes(state, option.costs, content, rng, log_level)
         logs.extend(cost_logs)
         report.merge(cost_report)
     if not state.dead:
-        outcome_logs, outcome_report = apply_outcomes(state, option.outcomes, content, rng)
+        outcome_logs, outcome_report = apply_outcomes(state, option.outcomes, content, rng, log_level)
         logs.extend(outcome_logs)
         report.merge(outcome_report)
     return ChoiceResolution(logs=logs, report=report)
@@ -203,8 +226,9 @@ def apply_choice(
     option_id: str,
     content: ContentBundle,
     rng: DeterministicRNG,
+    log_level: LogLevel = "full",
 ) -> list[LogEntry]:
-    return apply_choice_detailed(state, event_instance, option_id, content, rng).logs
+    return apply_choice_detailed(state, event_instance, option_id, content, rng, log_level).logs
 
 
 def apply_choice_with_state_rng(
@@ -232,21 +256,24 @@ def apply_choice_with_state_rng_detailed(
 
 
 def advance_to_next_event(
-    state: GameState,
+    state: RunState,
     content: ContentBundle,
-) -> tuple[GameState, EventInstance | None, list[LogEntry]]:
+    log_level: LogLevel = "full",
+) -> tuple[RunState, EventInstance | None, list[LogEntry]]:
     rng = _rng_from_state(state)
     logs: list[LogEntry] = []
     _decrement_cooldowns(state)
 
-    logs.extend(advance_travel(state, content))
+    logs.extend(advance_travel(state, content, log_level))
     if state.dead:
         _sync_rng_to_state(state, rng)
         return state, None, logs
 
-    event = select_event(state, content, rng)
+    requirements = RequirementContext(state, content)
+    event = select_event(state, content, rng, requirements)
     if event is None:
-        logs.append(make_log_entry(state, "system", "No event triggered this step."))
+        if log_level != "none":
+            logs.append(make_log_entry(state, "system", "No event triggered this step." if log_level == "full" else ""))
         _sync_rng_to_state(state, rng)
         return state, None, logs
 
@@ -261,44 +288,57 @@ def advance_to_next_event(
     if len(state.recent_event_ids) > 7:
         state.recent_event_ids = state.recent_event_ids[-7:]
 
-    event_instance = _instantiate_event(event, state, content)
-    logs.append(make_log_entry(state, "event", f"{event.title}: {event.text}", data={"eventId": event.id}))
+    event_instance = _instantiate_event(event, state, content, requirements)
+    if log_level != "none":
+        line = f"{event.title}: {event.text}" if log_level == "full" else ""
+        logs.append(make_log_entry(state, "event", line, data={"eventId": event.id}))
     _sync_rng_to_state(state, rng)
     return state, event_instance, logs
 
 
 def step(
-    state: GameState,
+    state: RunState,
     content: ContentBundle,
     policy: AutopickPolicy = "safe",
-) -> tuple[GameState, EventInstance | None, list[LogEntry]]:
-    state, event_instance, logs = advance_to_next_event(state, content)
+    log_level: LogLevel = "full",
+) -> tuple[RunState, EventInstance | None, list[LogEntry]]:
+    state, event_instance, logs = advance_to_next_event(state, content, log_level)
     if event_instance is None:
         return state, None, logs
 
     rng = _rng_from_state(state)
     selected_option = _choose_option(policy, event_instance, rng)
     if selected_option is None:
-        logs.append(make_log_entry(state, "system", "All event options are locked."))
+        if log_level != "none":
+            logs.append(make_log_entry(state, "system", "All event options are locked." if log_level == "full" else ""))
         _sync_rng_to_state(state, rng)
         return state, event_instance, logs
 
-    logs.extend(apply_choice(state, event_instance, selected_option.id, content, rng))
+    logs.extend(apply_choice(state, event_instance, selected_option.id, content, rng, log_level))
     _sync_rng_to_state(state, rng)
     return state, event_instance, logs
 
 
 def run_simulation(
-    initial_state: GameState,
+    initial_state: RunState,
     content: ContentBundle,
     steps: int,
     policy: AutopickPolicy = "safe",
-) -> tuple[GameState, list[LogEntry]]:
+    log_level: LogLevel = "full",
+) -> tuple[RunState, list[LogEntry]]:
+    """Run up to ``steps`` autopicked steps.
+
+    ``log_level`` trades log detail for speed without touching the RNG stream:
+    ``"full"`` builds every narrative line, ``"events"`` keeps typed entries with their
+    ``data`` payloads but empty lines, and ``"none"`` skips log construction entirely.
+    Logs are a small share of a step (event selection dominates), so expect a few
+    percent from ``"none"``, not a multiple.
+    """
     state = initial_state
     timeline: list[LogEntry] = []
     for _ in range(steps):
         if state.dead:
             break
-        _, _, step_logs = step(state, content, policy)
+        _, _, step_logs = step(state, content, policy, log_level)
         timeline.extend(step_logs)
     return state, timeline
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .models import Event
+
+ANY_BIOME = "*"
+
+
+@dataclass(slots=True)
+class _DistanceCell:
+    open_events: tuple[Event, ...] = ()
+    flagged_events: dict[str, tuple[tuple[int, Event], ...]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _BiomeBuckets:
+    breakpoints: list[float]
+    cells: list[_DistanceCell]
+
+
+def _event_span(event: Event) -> tuple[float, float]:
+    low = float(event.trigger.min_distance) if event.trigger.min_distance is not None else float("-inf")
+    high = float(event.trigger.max_distance) if event.trigger.max_distance is not None else float("inf")
+    return low, high
+
+
+def _build_buckets(entries: list[tuple[int, Event]]) -> _BiomeBuckets:
+    breakpoints = sorted(
+        {
+            bound
+            for _, event in entries
+            for bound in _event_span(event)
+            if bound not in (float("-inf"), float("inf"))
+        }
+    )
+    edges = [float("-inf"), *breakpoints, float("inf")]
+    cells: list[_DistanceCell] = []
+    for low, high in zip(edges, edges[1:]):
+        # Cells are closed on both ends so a distance sitting exactly on a breakpoint
+        # sees every event that could trigger there; the selector still runs the exact
+        # trigger check, so the index only needs to be a superset.
+        open_events: list[Event] = []
+        flagged: dict[str, list[tuple[int, Event]]] = {}
+        for position, event in entries:
+            event_low, event_high = _event_span(event)
+            if event_high < low or event_low > high:
+                continue
+            required = event.trigger.required_flags_all
+            if required:
+                flagged.setdefault(required[0], []).append((position, event))
+            else:
+                open_events.append(event)
+        cells.append(
+            _DistanceCell(
+                open_events=tuple(open_events),
+                flagged_events={flag: tuple(bucket) for flag, bucket in flagged.items()},
+            )
+        )
+    return _BiomeBuckets(breakpoints=breakpoints, cells=cells)
+
+
+class EventIndex:
+    """Buckets events by biome, distance interval and leading required flag.
+
+    ``candidates`` returns every event that could pass its trigger at the given biome,
+    distance and flag set, in catalog order, so weighted picks over the result match a
+    scan of the full event list.
+    """
+
+    __slots__ = ("_buckets", "_positions", "_has_any_biome")
+
+    def __init__(self, events: Iterable[Event]) -> None:
+        by_biome: dict[str, list[tuple[int, Event]]] = {}
+        any_biome: list[tuple[int, Event]] = []
+        self._positions: dict[str, int] = {}
+        for position, event in enumerate(events):
+            self._positions[event.id] = position
+            if event.trigger.biome_ids:
+                for biome_id in dict.fromkeys(event.trigger.biome_ids):
+                    by_biome.setdefault(biome_id, []).append((position, event))
+            else:
+                any_biome.append((position, event))
+
+        self._has_any_biome = bool(any_biome)
+        self._buckets: dict[str, _BiomeBuckets] = {ANY_BIOME: _build_buckets(any_biome)}
+        for biome_id, entries in by_biome.items():
+            merged = sorted([*entries, *any_biome], key=lambda pair: pair[0])
+            self._buckets[biome_id] = _build_buckets(merged)
+
+    def candidates(self, biome_id: str, distance: float, flags: set[str]) -> tuple[Event, ...] | list[Event]:
+        buckets = self._buckets.get(biome_id)
+        if buckets is None:
+            if not self._has_any_biome:
+                return ()
+            buckets = self._buckets[ANY_BIOME]
+        cell = buckets.cells[bisect_right(buckets.breakpoints, distance)]
+        if not cell.flagged_events or not flags:
+            return cell.open_events
+
+        unlocked = [
+            pair
+            for flag, bucket in cell.flagged_events.items()
+            if flag in flags
+            for pair in bucket
+        ]
+        if not unlocked:
+            return cell.open_events
+        positions = self._positions
+        merged = [(positions[event.id], event) for event in cell.open_events]
+        merged.extend(unlocked)
+        merged.sort(key=lambda pair: pair[0])
+        return [event for _, event in merged]
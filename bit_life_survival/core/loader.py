@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar
 
+import pydantic
+
 from pydantic import TypeAdapter, ValidationError
 
-from .models import BODY_PARTS, Biome, Event, Item, LootTable, METER_NAMES, Recipe
+from .event_index import EventIndex
+from .models import BODY_PARTS, Biome, Event, Item, LootTable, LootTableEntry, METER_NAMES, Recipe
+from .requirements import Requirement, compile_event_requirements
+from .rng import WeightedEntry, WeightedTable
 
 T = TypeVar("T")
 
+CONTENT_FILES: tuple[str, ...] = ("items.json", "loottables.json", "biomes.json", "events.json", "recipes.json")
+CONTENT_CACHE_VERSION = 1
+CONTENT_CACHE_DIRNAME = "__pycache__"
+# Modules whose classes end up inside a pickled bundle; editing any of them invalidates the cache.
+_CACHE_SOURCE_MODULES: tuple[str, ...] = ("event_index.py", "loader.py", "models.py", "requirements.py", "rng.py")
+
 
 class ContentValidationError(ValueError):
     def __init__(self, message: str, details: list[str] | None = None) -> None:
@@ -31,19 +47,87 @@ class ContentBundle:
     biome_by_id: dict[str, Biome]
     event_by_id: dict[str, Event]
     recipe_by_id: dict[str, Recipe]
+    event_index: EventIndex
+    # Compiled option requirements per event and item ids per tag, for the selector hot path.
+    option_requirements: dict[str, tuple[Event, tuple[Requirement | None, ...]]]
+    item_ids_by_tag: dict[str, frozenset[str]]
+    loot_sampler_by_id: dict[str, WeightedTable[LootTableEntry]]
+    # sha256 of the content JSON files; stable across code changes, so downstream caches can key off it.
+    fingerprint: str
+
+
+def _read_content_files(base_path: Path) -> dict[str, bytes | None]:
+    raw: dict[str, bytes | None] = {}
+    for name in CONTENT_FILES:
+        try:
+            raw[name] = (base_path / name).read_bytes()
+        except FileNotFoundError:
+            raw[name] = None
+    return raw
+
+
+def content_fingerprint(raw: dict[str, bytes | None]) -> str:
+    digest = hashlib.sha256()
+    for name in CONTENT_FILES:
+        data = raw.get(name)
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0" if data is None else len(data).to_bytes(8, "little") + data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _code_salt() -> bytes:
+    digest = hashlib.sha256(f"{CONTENT_CACHE_VERSION}|{sys.version}|{pydantic.VERSION}".encode("utf-8"))
+    core_dir = Path(__file__).resolve().parent
+    for name in _CACHE_SOURCE_MODULES:
+        digest.update((core_dir / name).read_bytes())
+    return digest.digest()
 
 
-def _load_json(path: Path) -> Any:
+def _cache_key(fingerprint: str) -> str:
+    return hashlib.sha256(_code_salt() + fingerprint.encode("utf-8")).hexdigest()[:24]
+
+
+def _read_cached_bundle(path: Path, fingerprint: str) -> ContentBundle | None:
+    try:
+        with path.open("rb") as handle:
+            bundle = pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or incompatible cache is just a miss; the rebuild overwrites it.
+        return None
+    if not isinstance(bundle, ContentBundle) or bundle.fingerprint != fingerprint:
+        return None
+    return bundle
+
+
+def _write_cached_bundle(path: Path, bundle: ContentBundle) -> None:
+    cache_dir = path.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(temp_path, path)
+        for stale in cache_dir.glob("content-*.pickle"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # Read-only installs still work, they just validate on every start.
+        return
+
+
+def _parse_json(path: Path, raw: bytes | None) -> Any:
+    if raw is None:
+        raise ContentValidationError(f"Missing content file: {path}")
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError as exc:
-        raise ContentValidationError(f"Missing content file: {path}") from exc
+        return json.loads(raw.decode("utf-8"))
     except json.JSONDecodeError as exc:
         raise ContentValidationError(f"Invalid JSON in {path.name}: {exc.msg} at line {exc.lineno}") from exc
 
 
-def _load_typed_list(path: Path, item_type: type[T]) -> list[T]:
-    data = _load_json(path)
+def _load_typed_list(path: Path, item_type: type[T], raw: bytes | None) -> list[T]:
+    data = _parse_json(path, raw)
     adapter = TypeAdapter(list[item_type])  # type: ignore[index]
     try:
         return adapter.validate_python(data)
@@ -55,10 +139,10 @@ def _load_typed_list(path: Path, item_type: type[T]) -> list[T]:
         raise ContentValidationError(f"Schema validation failed for {path.name}.", errors) from exc
 
 
-def _load_optional_typed_list(path: Path, item_type: type[T]) -> list[T]:
-    if not path.exists():
+def _load_optional_typed_list(path: Path, item_type: type[T], raw: bytes | None) -> list[T]:
+    if raw is None:
         return []
-    return _load_typed_list(path, item_type)
+    return _load_typed_list(path, item_type, raw)
 
 
 def _assert_unique_ids(kind: str, values: list[Any]) -> None:
@@ -276,13 +360,36 @@ def _validate_references(
         )
 
 
-def load_content(content_dir: Path | str) -> ContentBundle:
+def load_content(content_dir: Path | str, cache_dir: Path | str | None = None, use_cache: bool = True) -> ContentBundle:
+    """Load, validate and index the content bundle.
+
+    Validated bundles are pickled to ``cache_dir`` (default: ``<content_dir>/__pycache__``)
+    keyed by the content fingerprint and the loader/model sources, so unchanged content
+    skips JSON parsing, schema validation and reference checks on the next start.
+    """
     base_path = Path(content_dir)
-    items = _load_typed_list(base_path / "items.json", Item)
-    loottables = _load_typed_list(base_path / "loottables.json", LootTable)
-    biomes = _load_typed_list(base_path / "biomes.json", Biome)
-    events = _load_typed_list(base_path / "events.json", Event)
-    recipes = _load_optional_typed_list(base_path / "recipes.json", Recipe)
+    raw = _read_content_files(base_path)
+    fingerprint = content_fingerprint(raw)
+    cache_path: Path | None = None
+    if use_cache:
+        cache_root = Path(cache_dir) if cache_dir is not None else base_path / CONTENT_CACHE_DIRNAME
+        cache_path = cache_root / f"content-{_cache_key(fingerprint)}.pickle"
+        cached = _read_cached_bundle(cache_path, fingerprint)
+        if cached is not None:
+            return cached
+
+    bundle = _build_bundle(base_path, raw, fingerprint)
+    if cache_path is not None:
+        _write_cached_bundle(cache_path, bundle)
+    return bundle
+
+
+def _build_bundle(base_path: Path, raw: dict[str, bytes | None], fingerprint: str) -> ContentBundle:
+    items = _load_typed_list(base_path / "items.json", Item, raw["items.json"])
+    loottables = _load_typed_list(base_path / "loottables.json", LootTable, raw["loottables.json"])
+    biomes = _load_typed_list(base_path / "biomes.json", Biome, raw["biomes.json"])
+    events = _load_typed_list(base_path / "events.json", Event, raw["events.json"])
+    recipes = _load_optional_typed_list(base_path / "recipes.json", Recipe, raw["recipes.json"])
 
     _assert_unique_ids("item", items)
     _assert_unique_ids("loot table", loottables)
@@ -291,6 +398,10 @@ def load_content(content_dir: Path | str) -> ContentBundle:
     _assert_unique_ids("recipe", recipes)
 
     _validate_references(items, loottables, biomes, events, recipes)
+    item_ids_by_tag: dict[str, set[str]] = {}
+    for item in items:
+        for tag in item.tags:
+            item_ids_by_tag.setdefault(tag, set()).add(item.id)
 
     return ContentBundle(
         items=items,
@@ -303,4 +414,12 @@ def load_content(content_dir: Path | str) -> ContentBundle:
         biome_by_id={biome.id: biome for biome in biomes},
         event_by_id={event.id: event for event in events},
         recipe_by_id={recipe.id: recipe for recipe in recipes},
+        event_index=EventIndex(events),
+        option_requirements=compile_event_requirements(events),
+        item_ids_by_tag={tag: frozenset(item_ids) for tag, item_ids in item_ids_by_tag.items()},
+        loot_sampler_by_id={
+            table.id: WeightedTable.build(WeightedEntry(value=entry, weight=entry.weight) for entry in table.entries)
+            for table in loottables
+        },
+        fingerprint=fingerprint,
     )
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 MeterName = Literal["stamina", "hydration", "morale"]
 RunnerStatus = Literal["ready", "deployed", "dead"]
@@ -12,6 +12,7 @@ ItemSlot = Literal["pack", "armor", "vehicle", "utility", "faction", "consumable
 ItemRarity = Literal["common", "uncommon", "rare", "legendary"]
 MaterialName = Literal["scrap", "cloth", "plastic", "metal"]
 BodyPart = Literal["head", "torso", "left_arm", "right_arm", "left_leg", "right_leg"]
+LogLevel = Literal["full", "events", "none"]
 RunLogCategory = Literal["TRAVEL", "EVENT", "CHOICE", "OUTCOME", "LOOT", "INJURY", "HEAL", "SYSTEM"]
 
 SAVE_VERSION = 4
@@ -135,6 +136,8 @@ class EventOption(StrictModel):
     costs: list[dict[str, Any]] = Field(default_factory=list)
     outcomes: list[dict[str, Any]] = Field(min_length=1)
     log_line: str = Field(alias="logLine", min_length=1)
+    # (source expression, compiled predicate); populated by core.requirements.option_requirement.
+    _compiled_requirements: tuple[dict[str, Any], Any] | None = PrivateAttr(default=None)
 
 
 class Event(StrictModel):
@@ -162,8 +165,12 @@ class EquippedSlots(StrictModel):
     faction: str | None = None
 
     def as_values(self) -> list[str]:
-        values = self.model_dump(mode="python")
-        return [item_id for item_id in values.values() if item_id]
+        values = []
+        for slot in RUNNER_EQUIP_SLOTS:
+            item_id = getattr(self, slot)
+            if item_id:
+                values.append(item_id)
+        return values
 
 
 class RunLogEntry(StrictModel):
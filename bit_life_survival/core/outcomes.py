@@ -4,8 +4,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from .loader import ContentBundle
-from .models import BODY_PARTS, GameState, LogEntry, clamp_meter, make_log_entry, sync_total_injury
-from .rng import DeterministicRNG, WeightedEntry
+from .models import BODY_PARTS, GameState, LogEntry, LogLevel, clamp_meter, make_log_entry, sync_total_injury
+from .rng import DeterministicRNG
 from .travel import apply_death_checks
 
 
@@ -150,9 +150,9 @@ def _apply_loot_roll(
         _add_inventory_item(state, guaranteed.item_id, guaranteed.qty)
         _increment_counter(gained, guaranteed.item_id, guaranteed.qty)
 
-    weighted_entries = [WeightedEntry(value=entry, weight=entry.weight) for entry in table.entries]
+    sampler = content.loot_sampler_by_id[table_id]
     for _ in range(rolls):
-        selected_entry = rng.pick_weighted(weighted_entries)
+        selected_entry = rng.sample(sampler)
         min_qty = selected_entry.min_qty or 1
         max_qty = selected_entry.max_qty or min_qty
         qty = min_qty if max_qty == min_qty else rng.next_int(min_qty, max_qty + 1)
@@ -167,6 +167,7 @@ def apply_outcomes(
     outcomes: list[dict[str, Any]],
     content: ContentBundle,
     rng: DeterministicRNG,
+    log_level: LogLevel = "full",
 ) -> tuple[list[LogEntry], OutcomeReport]:
     logs: list[LogEntry] = []
     report = OutcomeReport()
@@ -263,6 +264,10 @@ def apply_outcomes(
             if death_reason:
                 death_from_checks = death_reason
 
+    if log_level == "none":
+        return logs, report
+    full = log_level == "full"
+
     if any(abs(delta) > 1e-9 for delta in report.meters_delta.values()):
         logs.append(
             make_log_entry(
@@ -273,22 +278,26 @@ def apply_outcomes(
                     f"stamina {report.meters_delta['stamina']:+.1f}, "
                     f"hydration {report.meters_delta['hydration']:+.1f}, "
                     f"morale {report.meters_delta['morale']:+.1f}."
-                ),
+                )
+                if full
+                else "",
                 data={"metersDelta": report.meters_delta.copy()},
             )
         )
 
     if abs(report.injury_effective_delta) > 1e-9:
-        part_bits = []
-        for part in BODY_PARTS:
-            delta = report.injury_part_delta.get(part, 0.0)
-            if abs(delta) > 1e-9:
-                part_bits.append(f"{part.replace('_', ' ')} {delta:+.1f}")
-        part_text = f" Affected: {', '.join(part_bits)}." if part_bits else ""
-        if report.injury_effective_delta > 0:
-            injury_line = f"You were hurt (+{report.injury_effective_delta:.1f} injury).{part_text}"
-        else:
-            injury_line = f"You recovered ({report.injury_effective_delta:+.1f} injury).{part_text}"
+        injury_line = ""
+        if full:
+            part_bits = []
+            for part in BODY_PARTS:
+                delta = report.injury_part_delta.get(part, 0.0)
+                if abs(delta) > 1e-9:
+                    part_bits.append(f"{part.replace('_', ' ')} {delta:+.1f}")
+            part_text = f" Affected: {', '.join(part_bits)}." if part_bits else ""
+            if report.injury_effective_delta > 0:
+                injury_line = f"You were hurt (+{report.injury_effective_delta:.1f} injury).{part_text}"
+            else:
+                injury_line = f"You recovered ({report.injury_effective_delta:+.1f} injury).{part_text}"
         logs.append(
             make_log_entry(
                 state,
@@ -306,7 +315,7 @@ def apply_outcomes(
             make_log_entry(
                 state,
                 "outcome",
-                f"You found: {_format_item_counts(report.items_gained, content)}.",
+                f"You found: {_format_item_counts(report.items_gained, content)}." if full else "",
                 data={"itemsGained": report.items_gained.copy()},
             )
         )
@@ -316,7 +325,7 @@ def apply_outcomes(
             make_log_entry(
                 state,
                 "outcome",
-                f"You lost: {_format_item_counts(report.items_lost, content)}.",
+                f"You lost: {_format_item_counts(report.items_lost, content)}." if full else "",
                 data={"itemsLost": report.items_lost.copy()},
             )
         )
@@ -326,7 +335,7 @@ def apply_outcomes(
             make_log_entry(
                 state,
                 "outcome",
-                f"Flags set: {', '.join(sorted(report.flags_set))}.",
+                f"Flags set: {', '.join(sorted(report.flags_set))}." if full else "",
                 data={"flagsSet": sorted(report.flags_set)},
             )
         )
@@ -335,7 +344,7 @@ def apply_outcomes(
             make_log_entry(
                 state,
                 "outcome",
-                f"Flags cleared: {', '.join(sorted(report.flags_unset))}.",
+                f"Flags cleared: {', '.join(sorted(report.flags_unset))}." if full else "",
                 data={"flagsUnset": sorted(report.flags_unset)},
             )
         )
@@ -351,7 +360,7 @@ def apply_outcomes(
                 make_log_entry(
                     state,
                     "death",
-                    f"A fatal outcome triggered ({chance * 100:.1f}% risk, roll {roll:.4f}).",
+                    f"A fatal outcome triggered ({chance * 100:.1f}% risk, roll {roll:.4f})." if full else "",
                     data={"deathChance": chance, "roll": roll, "triggered": True},
                 )
             )
@@ -360,12 +369,15 @@ def apply_outcomes(
                 make_log_entry(
                     state,
                     "outcome",
-                    f"You survived a close call ({chance * 100:.1f}% risk, roll {roll:.4f}).",
+                    f"You survived a close call ({chance * 100:.1f}% risk, roll {roll:.4f})." if full else "",
                     data={"deathChance": chance, "roll": roll, "triggered": False},
                 )
             )
 
     if death_from_checks and not death_from_roll_logged:
-        logs.append(make_log_entry(state, "death", f"Runner died: {death_from_checks}."))
+        if full:
+            logs.append(make_log_entry(state, "death", f"Runner died: {death_from_checks}."))
+        else:
+            logs.append(make_log_entry(state, "death", "", data={"deathReason": death_from_checks}))
 
     return logs, report
@@ -1,67 +1,160 @@
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
 
-from .loader import ContentBundle
-from .models import GameState, has_owned_item, owned_item_ids
+from .models import RUNNER_EQUIP_SLOTS, Event, EventOption, GameState
 
+if TYPE_CHECKING:
+    from .loader import ContentBundle
 
-def _check_leaf(expr: dict[str, Any], state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
-    if "hasTag" in expr:
-        required_tag = expr["hasTag"]
-        owned_ids = owned_item_ids(state)
-        has_tag = any(required_tag in content.item_by_id[item_id].tags for item_id in owned_ids if item_id in content.item_by_id)
-        if has_tag:
+
+def _owns_item(state: GameState, item_id: str) -> bool:
+    if state.inventory.get(item_id, 0) > 0:
+        return True
+    equipped = state.equipped
+    for slot in RUNNER_EQUIP_SLOTS:
+        if getattr(equipped, slot) == item_id:
+            return True
+    return False
+
+
+def _owns_tag(state: GameState, content: ContentBundle, tag: str) -> bool:
+    tagged = content.item_ids_by_tag.get(tag)
+    if not tagged:
+        return False
+    inventory = state.inventory
+    for item_id in tagged:
+        if inventory.get(item_id, 0) > 0:
+            return True
+    equipped = state.equipped
+    for slot in RUNNER_EQUIP_SLOTS:
+        if getattr(equipped, slot) in tagged:
+            return True
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class HasTagRequirement:
+    tag: str
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return _owns_tag(state, content, self.tag)
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
             return True, []
-        return False, [f"Requires owned item with tag '{required_tag}'."]
+        return False, [f"Requires owned item with tag '{self.tag}'."]
 
-    if "hasItem" in expr:
-        item_id = expr["hasItem"]
-        has_item = has_owned_item(state, item_id)
-        return (True, []) if has_item else (False, [f"Requires item '{item_id}' in inventory or equipped slots."])
 
-    if "flag" in expr:
-        flag = expr["flag"]
-        has_flag = flag in state.flags
-        return (True, []) if has_flag else (False, [f"Requires flag '{flag}'."])
+@dataclass(frozen=True, slots=True)
+class HasItemRequirement:
+    item_id: str
 
-    if "meterGte" in expr:
-        payload = expr["meterGte"]
-        meter = payload["meter"]
-        required_value = float(payload["value"])
-        current = getattr(state.meters, meter)
-        if current >= required_value:
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return _owns_item(state, self.item_id)
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
             return True, []
-        return False, [f"Requires {meter} >= {required_value}."]
+        return False, [f"Requires item '{self.item_id}' in inventory or equipped slots."]
 
-    if "injuryLte" in expr:
-        required_injury = float(expr["injuryLte"])
-        if state.injury <= required_injury:
+
+@dataclass(frozen=True, slots=True)
+class FlagRequirement:
+    flag: str
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return self.flag in state.flags
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
             return True, []
-        return False, [f"Requires injury <= {required_injury}."]
+        return False, [f"Requires flag '{self.flag}'."]
 
-    if "distanceGte" in expr:
-        required_distance = float(expr["distanceGte"])
-        if state.distance >= required_distance:
+
+@dataclass(frozen=True, slots=True)
+class MeterGteRequirement:
+    meter: str
+    value: float
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return getattr(state.meters, self.meter) >= self.value
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
             return True, []
-        return False, [f"Requires distance >= {required_distance}."]
+        return False, [f"Requires {self.meter} >= {self.value}."]
 
-    return False, ["Unknown requirement."]
 
+@dataclass(frozen=True, slots=True)
+class InjuryLteRequirement:
+    value: float
 
-def evaluate_requirement(expr: dict[str, Any], state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
-    if "all" in expr:
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return state.injury <= self.value
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
+            return True, []
+        return False, [f"Requires injury <= {self.value}."]
+
+
+@dataclass(frozen=True, slots=True)
+class DistanceGteRequirement:
+    value: float
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return state.distance >= self.value
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.check(state, content):
+            return True, []
+        return False, [f"Requires distance >= {self.value}."]
+
+
+@dataclass(frozen=True, slots=True)
+class UnknownRequirement:
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return False
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        return False, ["Unknown requirement."]
+
+
+@dataclass(frozen=True, slots=True)
+class AllRequirement:
+    children: tuple[Requirement, ...]
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        for child in self.children:
+            if not child.check(state, content):
+                return False
+        return True
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
         all_reasons: list[str] = []
-        for child in expr["all"]:
-            ok, reasons = evaluate_requirement(child, state, content)
+        for child in self.children:
+            ok, reasons = child.explain(state, content)
             if not ok:
                 all_reasons.extend(reasons)
         return (len(all_reasons) == 0, all_reasons)
 
-    if "any" in expr:
+
+@dataclass(frozen=True, slots=True)
+class AnyRequirement:
+    children: tuple[Requirement, ...]
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        for child in self.children:
+            if child.check(state, content):
+                return True
+        return False
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
         all_failures: list[str] = []
-        for child in expr["any"]:
-            ok, reasons = evaluate_requirement(child, state, content)
+        for child in self.children:
+            ok, reasons = child.explain(state, content)
             if ok:
                 return True, []
             all_failures.extend(reasons)
@@ -69,10 +162,131 @@ def evaluate_requirement(expr: dict[str, Any], state: GameState, content: Conten
             return False, [f"Requires any of: {' OR '.join(all_failures)}"]
         return False, ["Requires any listed condition."]
 
-    if "not" in expr:
-        ok, _ = evaluate_requirement(expr["not"], state, content)
-        if ok:
+
+@dataclass(frozen=True, slots=True)
+class NotRequirement:
+    child: Requirement
+
+    def check(self, state: GameState, content: ContentBundle) -> bool:
+        return not self.child.check(state, content)
+
+    def explain(self, state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+        if self.child.check(state, content):
             return False, ["Blocked by negated requirement."]
         return True, []
 
-    return _check_leaf(expr, state, content)
+
+Requirement = (
+    HasTagRequirement
+    | HasItemRequirement
+    | FlagRequirement
+    | MeterGteRequirement
+    | InjuryLteRequirement
+    | DistanceGteRequirement
+    | UnknownRequirement
+    | AllRequirement
+    | AnyRequirement
+    | NotRequirement
+)
+
+
+def compile_requirement(expr: dict[str, Any]) -> Requirement:
+    """Compile a requirement expression into a predicate tree.
+
+    ``check`` is the allocation-free boolean path; ``explain`` returns the same
+    ``(ok, reasons)`` pair the UI shows for locked options.
+    """
+    if "all" in expr:
+        return AllRequirement(children=tuple(compile_requirement(child) for child in expr["all"]))
+    if "any" in expr:
+        return AnyRequirement(children=tuple(compile_requirement(child) for child in expr["any"]))
+    if "not" in expr:
+        return NotRequirement(child=compile_requirement(expr["not"]))
+    if "hasTag" in expr:
+        return HasTagRequirement(tag=expr["hasTag"])
+    if "hasItem" in expr:
+        return HasItemRequirement(item_id=expr["hasItem"])
+    if "flag" in expr:
+        return FlagRequirement(flag=expr["flag"])
+    if "meterGte" in expr:
+        payload = expr["meterGte"]
+        return MeterGteRequirement(meter=payload["meter"], value=float(payload["value"]))
+    if "injuryLte" in expr:
+        return InjuryLteRequirement(value=float(expr["injuryLte"]))
+    if "distanceGte" in expr:
+        return DistanceGteRequirement(value=float(expr["distanceGte"]))
+    return UnknownRequirement()
+
+
+def option_requirement(option: EventOption) -> Requirement | None:
+    """Return the compiled requirement for an option, compiling it on first use."""
+    if option.requirements is None:
+        return None
+    cached = option._compiled_requirements
+    if cached is not None and cached[0] is option.requirements:
+        return cached[1]
+    compiled = compile_requirement(option.requirements)
+    option._compiled_requirements = (option.requirements, compiled)
+    return compiled
+
+
+def compile_event_requirements(events: Iterable[Event]) -> dict[str, tuple[Event, tuple[Requirement | None, ...]]]:
+    """Compile every option requirement; returns ``{event id: (event, per-option requirements)}``."""
+    return {event.id: (event, tuple(option_requirement(option) for option in event.options)) for event in events}
+
+
+@dataclass(slots=True)
+class RequirementContext:
+    """Per-step memo of option requirement results for one state.
+
+    Built once per ``advance_to_next_event`` call and shared by event selection and
+    event instantiation, so each option is evaluated at most once per step. It must
+    not outlive the step: anything that changes inventory, flags, meters, injury or
+    distance invalidates it.
+    """
+
+    state: GameState
+    content: ContentBundle
+    _results: dict[str, tuple[bool, ...]] = field(default_factory=dict, repr=False)
+    _reasons: dict[tuple[str, str], list[str]] = field(default_factory=dict, repr=False)
+
+    def option_results(self, event: Event) -> tuple[bool, ...]:
+        """Whether each option of ``event`` is unlocked, in option order."""
+        results = self._results.get(event.id)
+        if results is None:
+            entry = self.content.option_requirements.get(event.id)
+            if entry is not None and entry[0] is event:
+                compiled = entry[1]
+            else:
+                compiled = tuple(option_requirement(option) for option in event.options)
+            state = self.state
+            content = self.content
+            results = tuple(requirement is None or requirement.check(state, content) for requirement in compiled)
+            self._results[event.id] = results
+        return results
+
+    def unlocked_count(self, event: Event) -> int:
+        return sum(self.option_results(event))
+
+    def check(self, event: Event, option: EventOption) -> bool:
+        for index, candidate in enumerate(event.options):
+            if candidate is option:
+                return self.option_results(event)[index]
+        requirement = option_requirement(option)
+        return requirement is None or requirement.check(self.state, self.content)
+
+    def explain(self, event: Event, option: EventOption) -> tuple[bool, list[str]]:
+        if self.check(event, option):
+            return True, []
+        key = (event.id, option.id)
+        reasons = self._reasons.get(key)
+        if reasons is None:
+            requirement = option_requirement(option)
+            assert requirement is not None
+            _, reasons = requirement.explain(self.state, self.content)
+            self._reasons[key] = reasons
+        return False, list(reasons)
+
+
+def evaluate_requirement(expr: dict[str, Any], state: GameState, content: ContentBundle) -> tuple[bool, list[str]]:
+    return compile_requirement(expr).explain(state, content)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Generic, Sequence, TypeVar
+from itertools import accumulate
+from typing import Generic, Iterable, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -20,6 +22,82 @@ class WeightedEntry(Generic[T]):
     weight: float
 
 
+@dataclass(frozen=True, slots=True)
+class WeightedTable(Generic[T]):
+    """Cumulative-weight sampler for a fixed distribution.
+
+    Draws cost one ``next_float`` and a bisect. When every weight is integral the
+    cumulative sums are exact, so a draw picks the same entry ``pick_weighted`` would
+    for the same entries; otherwise ``exact`` is False and ``DeterministicRNG.sample``
+    falls back to the linear scan to keep that guarantee. ``total`` is computed with
+    ``sum`` like ``pick_weighted``, not taken from ``cumulative``: on Python 3.12+ float
+    ``sum`` is compensated and can differ from the running total.
+    """
+
+    values: tuple[T, ...]
+    weights: tuple[float, ...]
+    cumulative: tuple[float, ...]
+    exact: bool
+    total: float
+
+    @classmethod
+    def build(cls, entries: Iterable[WeightedEntry[T]]) -> "WeightedTable[T]":
+        valid_entries = [entry for entry in entries if entry.weight > 0]
+        if not valid_entries:
+            raise ValueError("WeightedTable requires at least one positive weight.")
+        weights = tuple(float(entry.weight) for entry in valid_entries)
+        cumulative = tuple(accumulate(weights))
+        return cls(
+            values=tuple(entry.value for entry in valid_entries),
+            weights=weights,
+            cumulative=cumulative,
+            exact=all(weight.is_integer() for weight in weights) and cumulative[-1] < 2**53,
+            total=sum(entry.weight for entry in valid_entries),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AliasTable(Generic[T]):
+    """Walker/Vose alias sampler for a fixed distribution: one ``next_float``, O(1).
+
+    The value drawn for a given RNG state differs from ``pick_weighted``; use it for new
+    content and tooling, not where existing seeds must replay unchanged.
+    """
+
+    values: tuple[T, ...]
+    probabilities: tuple[float, ...]
+    aliases: tuple[int, ...]
+
+    @classmethod
+    def build(cls, entries: Iterable[WeightedEntry[T]]) -> "AliasTable[T]":
+        valid_entries = [entry for entry in entries if entry.weight > 0]
+        if not valid_entries:
+            raise ValueError("AliasTable requires at least one positive weight.")
+        count = len(valid_entries)
+        total = sum(entry.weight for entry in valid_entries)
+        scaled = [entry.weight * count / total for entry in valid_entries]
+        probabilities = [1.0] * count
+        aliases = list(range(count))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+        # Leftovers are 1.0 up to rounding and keep their default self-alias.
+        return cls(
+            values=tuple(entry.value for entry in valid_entries),
+            probabilities=tuple(probabilities),
+            aliases=tuple(aliases),
+        )
+
+
 @dataclass(slots=True)
 class DeterministicRNG:
     seed: int | str
@@ -63,3 +141,22 @@ class DeterministicRNG:
                 return entry.value
             cursor -= entry.weight
         return valid_entries[-1].value
+
+    def sample(self, table: WeightedTable[T]) -> T:
+        """Draw from a prebuilt table; consumes exactly what ``pick_weighted`` would."""
+        cursor = self.next_float() * table.total
+        if table.exact:
+            index = bisect_right(table.cumulative, cursor)
+            return table.values[index if index < len(table.values) else -1]
+        for value, weight in zip(table.values, table.weights):
+            if cursor < weight:
+                return value
+            cursor -= weight
+        return table.values[-1]
+
+    def sample_alias(self, table: AliasTable[T]) -> T:
+        scaled = self.next_float() * len(table.values)
+        index = int(scaled)
+        if scaled - index < table.probabilities[index]:
+            return table.values[index]
+        return table.values[table.aliases[index]]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import hashlib
 
 
@@ -87,10 +88,16 @@ def _tier_for_distance(distance: float) -> int:
     return len(TIER_TABLE) - 1
 
 
-def _wave_strength(step: int) -> float:
+def _wave_phase(step: int) -> int:
     if step <= 0 or step < WAVE_GRACE_STEPS:
+        return -1
+    return step % WAVE_CYCLE
+
+
+def _wave_strength(step: int) -> float:
+    phase = _wave_phase(step)
+    if phase < 0:
         return 0.0
-    phase = step % WAVE_CYCLE
     if phase in {0, 1}:
         return 0.20
     if phase == 2:
@@ -107,6 +114,7 @@ def _seed_to_int(seed: int | str | None) -> int:
     return int.from_bytes(digest[:8], byteorder="big", signed=False)
 
 
+@lru_cache(maxsize=1024)
 def profile_for_seed(seed: int | str | None) -> RunProfile:
     if not RUN_PROFILES:
         raise RuntimeError("Run profiles are not configured.")
@@ -123,10 +131,9 @@ def steps_until_next_wave(step: int) -> int:
     return WAVE_CYCLE
 
 
-def snapshot(distance: float, step: int, seed: int | str | None = None) -> DirectorSnapshot:
+def _compute_snapshot(distance: float, step: int, profile: RunProfile) -> DirectorSnapshot:
     tier = _tier_for_distance(distance)
     _, drain, hazard, reward = TIER_TABLE[tier]
-    profile = profile_for_seed(seed)
     drain *= profile.drain_mul
     hazard *= profile.hazard_mul
     reward *= profile.reward_mul
@@ -149,6 +156,35 @@ def snapshot(distance: float, step: int, seed: int | str | None = None) -> Direc
     )
 
 
+@dataclass(slots=True)
+class RunDirector:
+    """Seed-resolved director that memoizes snapshots by (threat tier, wave phase).
+
+    Snapshots only depend on those two values once the profile is known, so every
+    step of a run after the first few reuses an existing frozen snapshot.
+    """
+
+    profile: RunProfile
+    _snapshots: dict[tuple[int, int], DirectorSnapshot] = field(default_factory=dict, repr=False)
+
+    def snapshot(self, distance: float, step: int) -> DirectorSnapshot:
+        key = (_tier_for_distance(distance), _wave_phase(step))
+        cached = self._snapshots.get(key)
+        if cached is None:
+            cached = _compute_snapshot(distance, step, self.profile)
+            self._snapshots[key] = cached
+        return cached
+
+
+@lru_cache(maxsize=1024)
+def director_for_seed(seed: int | str | None) -> RunDirector:
+    return RunDirector(profile=profile_for_seed(seed))
+
+
+def snapshot(distance: float, step: int, seed: int | str | None = None) -> DirectorSnapshot:
+    return director_for_seed(seed).snapshot(distance, step)
+
+
 def next_extraction_target(distance: float) -> float:
     for target in EXTRACTION_MILESTONES:
         if distance < target:
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from .models import MATERIAL_ITEM_IDS, RUNNER_EQUIP_SLOTS, SAVE_VERSION, SaveData
 
@@ -12,6 +16,15 @@ DEFAULT_SLOT_COUNT = 3
 MIN_SLOT_COUNT = 3
 MAX_SLOT_COUNT = 5
 
+SaveFormat = Literal["json", "compact"]
+SAVE_FORMATS: tuple[str, ...] = ("json", "compact")
+DEFAULT_SAVE_FORMAT: SaveFormat = "json"
+# Compact envelope: 4-byte magic, 1-byte envelope version, zlib-compressed minified JSON.
+COMPACT_SAVE_MAGIC = b"BLSZ"
+COMPACT_SAVE_VERSION = 1
+# Journal records appended before a slot is compacted back into a full snapshot.
+DEFAULT_JOURNAL_COMPACT_RECORDS = 32
+
 
 def normalize_slot_count(slot_count: int) -> int:
     return max(MIN_SLOT_COUNT, min(MAX_SLOT_COUNT, int(slot_count)))
@@ -33,6 +46,119 @@ class SlotSummary:
     drafted_citizen: str | None = None
 
 
+def encode_save_payload(payload: dict[str, Any], save_format: SaveFormat = DEFAULT_SAVE_FORMAT) -> bytes:
+    if save_format == "json":
+        return json.dumps(payload, indent=2).encode("utf-8")
+    if save_format == "compact":
+        body = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+        return COMPACT_SAVE_MAGIC + bytes([COMPACT_SAVE_VERSION]) + body
+    raise ValueError(f"Unknown save format '{save_format}'.")
+
+
+def decode_save_bytes(raw: bytes) -> Any:
+    """Decode a slot file in either format; the compact envelope is detected by its magic."""
+    if raw.startswith(COMPACT_SAVE_MAGIC):
+        version = raw[len(COMPACT_SAVE_MAGIC)] if len(raw) > len(COMPACT_SAVE_MAGIC) else None
+        if version != COMPACT_SAVE_VERSION:
+            raise ValueError(f"Unsupported compact save version {version}.")
+        raw = zlib.decompress(raw[len(COMPACT_SAVE_MAGIC) + 1 :])
+    return json.loads(raw.decode("utf-8"))
+
+
+def save_checksum(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def vault_delta(base: dict[str, Any], current: dict[str, Any]) -> dict[str, Any] | None:
+    """Top-level vault changes from ``base`` to ``current`` as a journal record body.
+
+    Lists that only grew (fallen citizens, reserve) are recorded as ``extend`` so the
+    record stays proportional to the change. Returns None when nothing changed.
+    """
+    changed: dict[str, Any] = {}
+    extended: dict[str, list[Any]] = {}
+    for key, value in current.items():
+        old = base.get(key)
+        if key in base and old == value:
+            continue
+        if isinstance(value, list) and isinstance(old, list) and len(value) > len(old) and value[: len(old)] == old:
+            extended[key] = value[len(old) :]
+        else:
+            changed[key] = value
+    removed = [key for key in base if key not in current]
+    if not changed and not extended and not removed:
+        return None
+    record: dict[str, Any] = {}
+    if changed:
+        record["set"] = changed
+    if extended:
+        record["extend"] = extended
+    if removed:
+        record["unset"] = removed
+    return record
+
+
+def apply_vault_delta(vault: dict[str, Any], record: dict[str, Any]) -> None:
+    for key, value in _coerce_dict(record.get("set")).items():
+        vault[key] = value
+    for key, values in _coerce_dict(record.get("extend")).items():
+        vault[key] = [*vault.get(key, []), *values]
+    for key in record.get("unset", []):
+        vault.pop(key, None)
+
+
+def read_journal(path: Path, base_checksum: str) -> list[dict[str, Any]]:
+    """Journal records that belong to the snapshot with ``base_checksum``.
+
+    Unreadable lines are skipped: they can only be records torn by a crash or failed
+    write mid-append, and the in-memory base only advances once a record is fully
+    written, so the record after a torn one is a delta from the same state. Records
+    from an older snapshot (left behind if compaction crashed before deleting the
+    journal) are ignored.
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    records: list[dict[str, Any]] = []
+    for line in raw.splitlines():
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(record, dict) and record.get("base") == base_checksum:
+            records.append(record)
+    return records
+
+
+def append_journal_record(path: Path, record: dict[str, Any]) -> int:
+    """Append one record line durably; returns the journal size afterwards.
+
+    If the journal ends in a torn partial line, the record starts on a fresh line so
+    it never merges into the corrupt one.
+    """
+    line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+    with path.open("a+b") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size:
+            handle.seek(size - 1)
+            if handle.read(1) != b"\n":
+                line = b"\n" + line
+        handle.write(line)
+        handle.flush()
+        os.fsync(handle.fileno())
+        return handle.tell()
+
+
+@dataclass(slots=True)
+class _JournalBase:
+    """Last state persisted for a slot: the snapshot it sits on plus replayed records."""
+
+    snapshot_checksum: str
+    vault: dict[str, Any]
+    records: int
+
+
 def _coerce_dict(value: Any, default: dict[str, Any] | None = None) -> dict[str, Any]:
     if isinstance(value, dict):
         return value
@@ -241,12 +367,138 @@ def migrate_save(payload: Any) -> dict[str, Any]:
     return state
 
 
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file, fsync it and rename it over ``path``.
+
+    Readers and a crash mid-write only ever see the old or the new file, never a torn one.
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    if os.name == "posix":
+        # Persist the rename itself; best effort, some filesystems refuse directory fds.
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+@dataclass(slots=True)
+class _SaveFacts:
+    vault_level: int
+    tav: int
+    drone_bay_level: int
+    run_count: int
+    seed_preview: str
+    last_distance: float
+    last_time: int
+    drafted_citizen: str | None
+
+    @classmethod
+    def from_save(cls, data: SaveData) -> "_SaveFacts":
+        vault = data.vault
+        drafted = None
+        if getattr(vault, "active_deploy_citizen_id", None):
+            drafted = next(
+                (citizen.name for citizen in getattr(vault, "deploy_roster", []) if citizen.id == vault.active_deploy_citizen_id),
+                None,
+            )
+        return cls(
+            vault_level=int(vault.vault_level),
+            tav=int(vault.tav),
+            drone_bay_level=int(vault.upgrades.get("drone_bay_level", 0)),
+            run_count=int(vault.run_counter),
+            seed_preview=str(vault.last_run_seed if vault.last_run_seed is not None else vault.settings.base_seed),
+            last_distance=float(getattr(vault, "last_run_distance", 0.0) or 0.0),
+            last_time=int(getattr(vault, "last_run_time", 0) or 0),
+            drafted_citizen=drafted or (vault.current_citizen.name if vault.current_citizen else None),
+        )
+
+    @classmethod
+    def from_meta(cls, entry: dict[str, Any]) -> "_SaveFacts | None":
+        try:
+            return cls(
+                vault_level=int(entry["vault_level"]),
+                tav=int(entry["tav"]),
+                drone_bay_level=int(entry["drone_bay_level"]),
+                run_count=int(entry["run_count"]),
+                seed_preview=str(entry["seed_preview"]),
+                last_distance=float(entry["last_distance"]),
+                last_time=int(entry["last_time"]),
+                drafted_citizen=entry.get("drafted_citizen"),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(slots=True)
+class SlotSnapshot:
+    """A save serialized on the caller's thread, ready to be written from any thread."""
+
+    payload: dict[str, Any]
+    facts: _SaveFacts
+
+    @classmethod
+    def from_save(cls, save_data: SaveData) -> "SlotSnapshot":
+        save_data.save_version = SAVE_VERSION
+        return cls(payload=save_data.model_dump(mode="json"), facts=_SaveFacts.from_save(save_data))
+
+
+@dataclass(slots=True)
+class _IndexedSummary:
+    file_stamp: tuple[int, int] | None
+    slot_meta: dict[str, Any]
+    summary: SlotSummary
+
+
 class SlotStorage:
-    def __init__(self, saves_dir: Path, slot_count: int = DEFAULT_SLOT_COUNT) -> None:
+    def __init__(
+        self,
+        saves_dir: Path,
+        slot_count: int = DEFAULT_SLOT_COUNT,
+        save_format: SaveFormat = DEFAULT_SAVE_FORMAT,
+        journal: bool = False,
+        journal_compact_records: int = DEFAULT_JOURNAL_COMPACT_RECORDS,
+    ) -> None:
+        if save_format not in SAVE_FORMATS:
+            raise ValueError(f"Unknown save format '{save_format}'.")
         self.saves_dir = saves_dir
+        # Format used for new writes; reads accept either format regardless.
+        self.save_format: SaveFormat = save_format
         self.slot_count = normalize_slot_count(slot_count)
         self.slot_ids = tuple(range(1, self.slot_count + 1))
         self.meta_path = self.saves_dir / "meta.json"
+        self._meta: dict[str, Any] | None = None
+        self._meta_stamp: tuple[int, int] | None = None
+        self._summaries: dict[int, _IndexedSummary] = {}
+        # Journal mode appends vault deltas to slot<N>.journal instead of rewriting the
+        # snapshot, and compacts after journal_compact_records appends or on compact_journals().
+        self.journal = journal
+        self.journal_compact_records = max(1, int(journal_compact_records))
+        self._journal_bases: dict[int, _JournalBase] = {}
+        # Serializes meta.json read-modify-write between the UI thread and a background writer.
+        self._meta_lock = threading.RLock()
         self.saves_dir.mkdir(parents=True, exist_ok=True)
         if not self.meta_path.exists():
             self._write_meta({"last_slot": None, "slot_count": self.slot_count, "slots": {}})
@@ -254,6 +506,26 @@ class SlotStorage:
     def _slot_path(self, slot: int) -> Path:
         return self.saves_dir / f"slot{slot}.json"
 
+    def _journal_path(self, slot: int) -> Path:
+        return self.saves_dir / f"slot{slot}.journal"
+
+    def _read_slot_payload(self, slot: int) -> tuple[Any, str, list[dict[str, Any]]]:
+        """Decode the snapshot and replay its journal; returns (payload, snapshot checksum, records)."""
+        raw = self._slot_path(slot).read_bytes()
+        checksum = save_checksum(raw)
+        payload = decode_save_bytes(raw)
+        records = read_journal(self._journal_path(slot), checksum)
+        if records and isinstance(payload, dict):
+            vault = _coerce_dict(payload.get("vault"))
+            for record in records:
+                apply_vault_delta(vault, record)
+            payload["vault"] = vault
+        return payload, checksum, records
+
+    def _journal_size(self, slot: int) -> int:
+        stamp = _file_stamp(self._journal_path(slot))
+        return stamp[1] if stamp is not None else 0
+
     def _default_slot_meta(self, slot: int) -> dict[str, Any]:
         return {
             "slot_name": f"Slot {slot}",
@@ -282,7 +554,17 @@ class SlotStorage:
         return payload
 
     def _write_meta(self, payload: dict[str, Any]) -> None:
-        self.meta_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        atomic_write_bytes(self.meta_path, json.dumps(payload, indent=2).encode("utf-8"))
+        self._meta = payload
+        self._meta_stamp = _file_stamp(self.meta_path)
+
+    def _meta_view(self) -> dict[str, Any]:
+        # Read-only view for render-time queries; mutators go through _read_meta/_write_meta.
+        stamp = _file_stamp(self.meta_path)
+        if self._meta is None or stamp != self._meta_stamp:
+            self._meta = self._read_meta()
+            self._meta_stamp = stamp
+        return self._meta
 
     def slot_exists(self, slot: int) -> bool:
         return self._slot_path(slot).exists()
@@ -296,16 +578,65 @@ class SlotStorage:
             data.save_version = SAVE_VERSION
             self.save_slot(slot, data)
             return data
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload, checksum, records = self._read_slot_payload(slot)
+        self._journal_bases.pop(slot, None)
+        if self._is_trusted(slot, checksum) and isinstance(payload, dict) and payload.get("save_version") == SAVE_VERSION:
+            # Only a snapshot this build wrote, unmigrated, can be the base later journal deltas
+            # apply to. Loading itself gains nothing: migrate_save is a no-op at SAVE_VERSION.
+            self._journal_bases[slot] = _JournalBase(
+                snapshot_checksum=checksum,
+                vault=_coerce_dict(payload.get("vault")),
+                records=len(records),
+            )
         data = SaveData.model_validate(migrate_save(payload))
-        self._touch_meta_slot(slot, save_data=data)
+        self._touch_meta_slot(slot, facts=_SaveFacts.from_save(data), checksum=checksum, journal_size=self._journal_size(slot))
         return data
 
+    def _is_trusted(self, slot: int, checksum: str) -> bool:
+        entry = _coerce_dict(self._meta_view().get("slots")).get(str(slot))
+        return isinstance(entry, dict) and entry.get("checksum") == checksum
+
     def save_slot(self, slot: int, save_data: SaveData) -> None:
-        save_data.save_version = SAVE_VERSION
-        path = self._slot_path(slot)
-        path.write_text(json.dumps(save_data.model_dump(mode="json"), indent=2), encoding="utf-8")
-        self._touch_meta_slot(slot, save_data=save_data)
+        self.write_snapshot(slot, SlotSnapshot.from_save(save_data))
+
+    def write_snapshot(self, slot: int, snapshot: SlotSnapshot) -> None:
+        """Write a snapshot atomically and update meta; safe to call from a writer thread."""
+        vault = _coerce_dict(snapshot.payload.get("vault"))
+        base = self._journal_bases.get(slot) if self.journal else None
+        if base is not None and base.records < self.journal_compact_records:
+            record = vault_delta(base.vault, vault)
+            if record is not None:
+                record["base"] = base.snapshot_checksum
+                journal_size = append_journal_record(self._journal_path(slot), record)
+                base.vault = vault
+                base.records += 1
+            else:
+                journal_size = self._journal_size(slot)
+            self._touch_meta_slot(slot, facts=snapshot.facts, checksum=base.snapshot_checksum, journal_size=journal_size)
+            return
+
+        raw = encode_save_payload(snapshot.payload, self.save_format)
+        atomic_write_bytes(self._slot_path(slot), raw)
+        # The new snapshot already contains every journaled change; stale records would
+        # be ignored anyway since they reference the previous snapshot's checksum.
+        self._journal_path(slot).unlink(missing_ok=True)
+        checksum = save_checksum(raw)
+        if self.journal:
+            self._journal_bases[slot] = _JournalBase(snapshot_checksum=checksum, vault=vault, records=0)
+        self._touch_meta_slot(slot, facts=snapshot.facts, checksum=checksum, journal_size=0)
+
+    def compact_journals(self) -> None:
+        """Fold every pending journal back into a full snapshot."""
+        for slot in self.slot_ids:
+            if not self._journal_path(slot).exists():
+                continue
+            payload, _, records = self._read_slot_payload(slot)
+            if not records:
+                self._journal_path(slot).unlink(missing_ok=True)
+                continue
+            data = SaveData.model_validate(migrate_save(payload))
+            self._journal_bases.pop(slot, None)
+            self.write_snapshot(slot, SlotSnapshot.from_save(data))
 
     def create_new_game(self, slot: int, base_seed: int = 1337) -> SaveData:
         from .persistence import create_default_save_data
@@ -317,108 +648,132 @@ class SlotStorage:
 
     def delete_slot(self, slot: int) -> None:
         self._slot_path(slot).unlink(missing_ok=True)
-        meta = self._read_meta()
-        meta.get("slots", {}).pop(str(slot), None)
-        if meta.get("last_slot") == slot:
-            meta["last_slot"] = None
-        self._write_meta(meta)
+        self._journal_path(slot).unlink(missing_ok=True)
+        self._journal_bases.pop(slot, None)
+        self._summaries.pop(slot, None)
+        with self._meta_lock:
+            meta = self._read_meta()
+            meta.get("slots", {}).pop(str(slot), None)
+            if meta.get("last_slot") == slot:
+                meta["last_slot"] = None
+            self._write_meta(meta)
 
     def rename_slot(self, slot: int, name: str) -> None:
         clean = name.strip()
         if not clean:
             raise ValueError("Slot name cannot be empty.")
-        meta = self._read_meta()
-        entry = meta.setdefault("slots", {}).setdefault(str(slot), self._default_slot_meta(slot))
-        entry["slot_name"] = clean[:32]
-        self._write_meta(meta)
+        with self._meta_lock:
+            meta = self._read_meta()
+            entry = meta.setdefault("slots", {}).setdefault(str(slot), self._default_slot_meta(slot))
+            entry["slot_name"] = clean[:32]
+            self._write_meta(meta)
+        self._summaries.pop(slot, None)
 
     def last_slot(self) -> int | None:
-        value = self._read_meta().get("last_slot")
+        value = self._meta_view().get("last_slot")
         if isinstance(value, int) and value in self.slot_ids:
             return value
         return None
 
-    def _touch_meta_slot(self, slot: int, save_data: SaveData | None = None) -> None:
-        meta = self._read_meta()
-        slots = meta.setdefault("slots", {})
-        slot_key = str(slot)
-        entry = slots.setdefault(slot_key, self._default_slot_meta(slot))
-        entry["last_played"] = datetime.now(timezone.utc).isoformat()
-        if save_data is not None:
-            vault = save_data.vault
-            entry["vault_level"] = int(vault.vault_level)
-            entry["tav"] = int(vault.tav)
-            entry["run_count"] = int(vault.run_counter)
-            entry["seed_preview"] = str(vault.last_run_seed if vault.last_run_seed is not None else vault.settings.base_seed)
-            entry["last_distance"] = float(getattr(vault, "last_run_distance", 0.0) or 0.0)
-            entry["last_time"] = int(getattr(vault, "last_run_time", 0) or 0)
-            drafted = None
-            if getattr(vault, "active_deploy_citizen_id", None):
-                drafted = next(
-                    (citizen.name for citizen in getattr(vault, "deploy_roster", []) if citizen.id == vault.active_deploy_citizen_id),
-                    None,
-                )
-            entry["drafted_citizen"] = drafted or (vault.current_citizen.name if vault.current_citizen else None)
-            entry.setdefault("slot_name", f"Slot {slot}")
-        meta["last_slot"] = slot
-        self._write_meta(meta)
+    def _touch_meta_slot(
+        self,
+        slot: int,
+        facts: _SaveFacts | None = None,
+        checksum: str | None = None,
+        journal_size: int = 0,
+    ) -> None:
+        with self._meta_lock:
+            meta = self._read_meta()
+            slots = meta.setdefault("slots", {})
+            slot_key = str(slot)
+            entry = slots.setdefault(slot_key, self._default_slot_meta(slot))
+            entry["last_played"] = datetime.now(timezone.utc).isoformat()
+            if facts is not None:
+                entry["vault_level"] = facts.vault_level
+                entry["tav"] = facts.tav
+                entry["drone_bay_level"] = facts.drone_bay_level
+                entry["run_count"] = facts.run_count
+                entry["seed_preview"] = facts.seed_preview
+                entry["last_distance"] = facts.last_distance
+                entry["last_time"] = facts.last_time
+                entry["drafted_citizen"] = facts.drafted_citizen
+                entry.setdefault("slot_name", f"Slot {slot}")
+            if checksum is not None:
+                # sha256 of the slot file bytes; lets loads and summary scans trust this entry.
+                entry["checksum"] = checksum
+                entry["journal_size"] = journal_size
+            meta["last_slot"] = slot
+            self._write_meta(meta)
+        if facts is not None:
+            # The caller just wrote or parsed this slot, so index it without re-reading the file.
+            self._summaries[slot] = _IndexedSummary(
+                file_stamp=_file_stamp(self._slot_path(slot)),
+                slot_meta=dict(entry),
+                summary=self._summary_from_facts(slot, entry, facts),
+            )
 
     def list_slots(self) -> list[SlotSummary]:
+        """Summaries for every slot, served from the in-memory index.
+
+        Each call only stats ``meta.json`` and the slot files; a slot is re-parsed when its
+        file stamp or its meta entry changed since the summary was built.
+        """
         summaries: list[SlotSummary] = []
-        meta = self._read_meta()
-        slots_meta = _coerce_dict(meta.get("slots"))
+        slots_meta = _coerce_dict(self._meta_view().get("slots"))
         for slot in self.slot_ids:
             slot_meta = _coerce_dict(slots_meta.get(str(slot)), default=self._default_slot_meta(slot))
-            path = self._slot_path(slot)
-            if not path.exists():
-                summaries.append(
-                    SlotSummary(
-                        slot=slot,
-                        occupied=False,
-                        slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
-                        run_count=int(slot_meta.get("run_count", 0)),
-                        seed_preview=str(slot_meta.get("seed_preview", "-")),
-                        last_distance=float(slot_meta.get("last_distance", 0.0) or 0.0),
-                        last_time=int(slot_meta.get("last_time", 0) or 0),
-                        last_played=slot_meta.get("last_played"),
-                        drafted_citizen=slot_meta.get("drafted_citizen"),
-                    )
-                )
+            stamp = _file_stamp(self._slot_path(slot))
+            cached = self._summaries.get(slot)
+            if cached is not None and cached.file_stamp == stamp and cached.slot_meta == slot_meta:
+                summaries.append(cached.summary)
                 continue
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                data = SaveData.model_validate(migrate_save(payload))
-                vault = data.vault
-                summaries.append(
-                    SlotSummary(
-                        slot=slot,
-                        occupied=True,
-                        slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
-                        vault_level=vault.vault_level,
-                        tav=vault.tav,
-                        drone_bay_level=int(vault.upgrades.get("drone_bay_level", 0)),
-                        run_count=int(vault.run_counter),
-                        seed_preview=str(vault.last_run_seed if vault.last_run_seed is not None else vault.settings.base_seed),
-                        last_distance=float(getattr(vault, "last_run_distance", 0.0) or 0.0),
-                        last_time=int(getattr(vault, "last_run_time", 0) or 0),
-                        last_played=slot_meta.get("last_played"),
-                        drafted_citizen=next(
-                            (
-                                citizen.name
-                                for citizen in getattr(vault, "deploy_roster", [])
-                                if citizen.id == getattr(vault, "active_deploy_citizen_id", None)
-                            ),
-                            vault.current_citizen.name if vault.current_citizen else slot_meta.get("drafted_citizen"),
-                        ),
-                    )
-                )
-            except Exception:
-                summaries.append(
-                    SlotSummary(
-                        slot=slot,
-                        occupied=False,
-                        slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
-                        last_played=slot_meta.get("last_played"),
-                    )
-                )
+            summary = self._build_slot_summary(slot, slot_meta, stamp is not None)
+            self._summaries[slot] = _IndexedSummary(file_stamp=stamp, slot_meta=dict(slot_meta), summary=summary)
+            summaries.append(summary)
         return summaries
+
+    def _build_slot_summary(self, slot: int, slot_meta: dict[str, Any], exists: bool) -> SlotSummary:
+        if not exists:
+            return SlotSummary(
+                slot=slot,
+                occupied=False,
+                slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
+                run_count=int(slot_meta.get("run_count", 0)),
+                seed_preview=str(slot_meta.get("seed_preview", "-")),
+                last_distance=float(slot_meta.get("last_distance", 0.0) or 0.0),
+                last_time=int(slot_meta.get("last_time", 0) or 0),
+                last_played=slot_meta.get("last_played"),
+                drafted_citizen=slot_meta.get("drafted_citizen"),
+            )
+        try:
+            raw = self._slot_path(slot).read_bytes()
+            if slot_meta.get("checksum") == save_checksum(raw) and slot_meta.get("journal_size", 0) == self._journal_size(slot):
+                facts = _SaveFacts.from_meta(slot_meta)
+                if facts is not None:
+                    return self._summary_from_facts(slot, slot_meta, facts)
+            payload, _, _ = self._read_slot_payload(slot)
+            data = SaveData.model_validate(migrate_save(payload))
+            return self._summary_from_facts(slot, slot_meta, _SaveFacts.from_save(data))
+        except Exception:
+            return SlotSummary(
+                slot=slot,
+                occupied=False,
+                slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
+                last_played=slot_meta.get("last_played"),
+            )
+
+    def _summary_from_facts(self, slot: int, slot_meta: dict[str, Any], facts: _SaveFacts) -> SlotSummary:
+        return SlotSummary(
+            slot=slot,
+            occupied=True,
+            slot_name=str(slot_meta.get("slot_name", f"Slot {slot}")),
+            vault_level=facts.vault_level,
+            tav=facts.tav,
+            drone_bay_level=facts.drone_bay_level,
+            run_count=facts.run_count,
+            seed_preview=facts.seed_preview,
+            last_distance=facts.last_distance,
+            last_time=facts.last_time,
+            last_played=slot_meta.get("last_played"),
+            drafted_citizen=facts.drafted_citizen or slot_meta.get("drafted_citizen"),
+        )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from .loader import ContentBundle
 from .models import Event, GameState
-from .requirements import evaluate_requirement
+from .requirements import RequirementContext
 from .rng import DeterministicRNG, WeightedEntry
-from .run_director import snapshot as director_snapshot
+from .run_director import DirectorSnapshot, snapshot as director_snapshot
+
+HAZARD_TAGS = frozenset({"hazard", "combat", "crisis"})
 
 
 def _passes_trigger(event: Event, state: GameState) -> bool:
@@ -51,18 +53,18 @@ def _tier_tag_multiplier(event: Event, tier: int) -> float:
     return mult
 
 
-def _option_access_multiplier(event: Event, state: GameState, content: ContentBundle) -> float:
+def _option_access_multiplier(
+    event: Event,
+    state: GameState,
+    content: ContentBundle,
+    requirements: RequirementContext | None = None,
+) -> float:
     total = len(event.options)
     if total <= 0:
         return 0.0
-    unlocked = 0
-    for option in event.options:
-        if option.requirements is None:
-            unlocked += 1
-            continue
-        ok, _ = evaluate_requirement(option.requirements, state, content)
-        if ok:
-            unlocked += 1
+    if requirements is None:
+        requirements = RequirementContext(state, content)
+    unlocked = requirements.unlocked_count(event)
 
     if unlocked <= 0:
         return 0.04
@@ -79,15 +81,22 @@ def _option_access_multiplier(event: Event, state: GameState, content: ContentBu
     return mult
 
 
-def _effective_weight(event: Event, state: GameState, content: ContentBundle) -> float:
+def _effective_weight(
+    event: Event,
+    state: GameState,
+    content: ContentBundle,
+    director: DirectorSnapshot | None = None,
+    requirements: RequirementContext | None = None,
+) -> float:
     biome = content.biome_by_id.get(state.biome_id)
     if biome is None:
         return 0.0
     weight = event.weight
     for tag in event.tags:
         weight *= biome.event_weight_mul_by_tag.get(tag, 1.0)
-    director = director_snapshot(state.distance, state.step, state.seed)
-    if any(tag in {"hazard", "combat", "crisis"} for tag in event.tags):
+    if director is None:
+        director = director_snapshot(state.distance, state.step, state.seed)
+    if not HAZARD_TAGS.isdisjoint(event.tags):
         weight *= director.hazard_multiplier
     weight *= _tier_tag_multiplier(event, director.threat_tier)
     min_distance = float(event.trigger.min_distance or 0.0)
@@ -97,36 +106,47 @@ def _effective_weight(event: Event, state: GameState, content: ContentBundle) ->
         weight *= 0.55
     elif min_distance <= 4 and director.threat_tier >= 3:
         weight *= 0.60
-    weight *= _option_access_multiplier(event, state, content)
+    weight *= _option_access_multiplier(event, state, content, requirements)
     return max(0.0, weight)
 
 
-def _build_candidates(state: GameState, content: ContentBundle) -> list[WeightedEntry[Event]]:
+def _build_candidates(
+    state: GameState,
+    content: ContentBundle,
+    requirements: RequirementContext,
+) -> list[WeightedEntry[Event]]:
     candidates = []
-    for event in content.events:
+    director = director_snapshot(state.distance, state.step, state.seed)
+    for event in content.event_index.candidates(state.biome_id, state.distance, state.flags):
         if not _passes_trigger(event, state):
             continue
-        weight = _effective_weight(event, state, content)
+        weight = _effective_weight(event, state, content, director, requirements)
         if weight <= 0:
             continue
         candidates.append(WeightedEntry(value=event, weight=weight))
     return candidates
 
 
-def _unlocked_option_count(event: Event, state: GameState, content: ContentBundle) -> int:
-    unlocked = 0
-    for option in event.options:
-        if option.requirements is None:
-            unlocked += 1
-            continue
-        ok, _ = evaluate_requirement(option.requirements, state, content)
-        if ok:
-            unlocked += 1
-    return unlocked
+def _unlocked_option_count(
+    event: Event,
+    state: GameState,
+    content: ContentBundle,
+    requirements: RequirementContext | None = None,
+) -> int:
+    if requirements is None:
+        requirements = RequirementContext(state, content)
+    return requirements.unlocked_count(event)
 
 
-def select_event(state: GameState, content: ContentBundle, rng: DeterministicRNG) -> Event | None:
-    candidates = _build_candidates(state, content)
+def select_event(
+    state: GameState,
+    content: ContentBundle,
+    rng: DeterministicRNG,
+    requirements: RequirementContext | None = None,
+) -> Event | None:
+    if requirements is None:
+        requirements = RequirementContext(state, content)
+    candidates = _build_candidates(state, content, requirements)
 
     if not candidates:
         return None
@@ -136,7 +156,7 @@ def select_event(state: GameState, content: ContentBundle, rng: DeterministicRNG
         approachable = [
             entry
             for entry in candidates
-            if _unlocked_option_count(entry.value, state, content) >= 2
+            if _unlocked_option_count(entry.value, state, content, requirements) >= 2
         ]
         if approachable:
             candidates = approachable
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -11,8 +11,10 @@ class GameplaySettings(BaseModel):
 
     skip_intro: bool = False
     show_advanced_overlay: bool = False
+    show_frame_profiler: bool = False
     confirm_retreat: bool = True
     save_slots: int = Field(default=3, ge=3, le=5)
+    save_format: Literal["json", "compact"] = "json"
     tutorial_completed: bool = False
     replay_tutorial: bool = False
     vault_assistant_enabled: bool = True
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Any
+
+from .models import BODY_PARTS, RUNNER_EQUIP_SLOTS, EquippedSlots, GameState, MeterValues, RunLogCategory, RunLogEntry
+
+
+class SimMeters:
+    __slots__ = ("stamina", "hydration", "morale")
+
+    def __init__(self, stamina: float = 100.0, hydration: float = 100.0, morale: float = 100.0) -> None:
+        self.stamina = stamina
+        self.hydration = hydration
+        self.morale = morale
+
+
+class SimEquipped:
+    __slots__ = RUNNER_EQUIP_SLOTS
+
+    def __init__(self, **slots: str | None) -> None:
+        for slot in RUNNER_EQUIP_SLOTS:
+            setattr(self, slot, slots.get(slot))
+
+    def as_values(self) -> list[str]:
+        values = []
+        for slot in RUNNER_EQUIP_SLOTS:
+            item_id = getattr(self, slot)
+            if item_id:
+                values.append(item_id)
+        return values
+
+    def as_dict(self) -> dict[str, str | None]:
+        return {slot: getattr(self, slot) for slot in RUNNER_EQUIP_SLOTS}
+
+
+class SimRunLogEntry:
+    """Slotted run-log entry; becomes a ``RunLogEntry`` only in ``to_game_state``."""
+
+    __slots__ = ("timestamp", "step", "category", "message", "details")
+
+    def __init__(self, timestamp: str, step: int, category: RunLogCategory, message: str, details: dict[str, Any]) -> None:
+        self.timestamp = timestamp
+        self.step = step
+        self.category = category
+        self.message = message
+        self.details = details
+
+    @classmethod
+    def from_entry(cls, entry: RunLogEntry) -> "SimRunLogEntry":
+        return cls(entry.timestamp, entry.step, entry.category, entry.message, deepcopy(entry.details))
+
+    def to_entry(self) -> RunLogEntry:
+        return RunLogEntry.model_construct(
+            timestamp=self.timestamp,
+            step=self.step,
+            category=self.category,
+            message=self.message,
+            details=deepcopy(self.details),
+        )
+
+
+class SimState:
+    """Plain ``__slots__`` run state for headless simulation.
+
+    Mirrors every ``GameState`` field so travel, selection, requirements and outcomes
+    can run on it unchanged, without pydantic attribute hooks or model construction.
+    Convert at the edges with ``from_game_state`` / ``to_game_state``.
+    """
+
+    __slots__ = (
+        "seed",
+        "step",
+        "distance",
+        "time",
+        "biome_id",
+        "mission_name",
+        "meters",
+        "hunger",
+        "hunger_drain_mul",
+        "hydration_drain_mul",
+        "travel_speed_bonus",
+        "medical_efficiency",
+        "injury",
+        "injuries",
+        "flags",
+        "death_flags",
+        "inventory",
+        "equipped",
+        "dead",
+        "death_reason",
+        "last_event_id",
+        "recent_event_ids",
+        "event_cooldowns",
+        "rng_state",
+        "rng_calls",
+        "run_log",
+        "run_log_max",
+    )
+
+    def __init__(self, seed: int | str, biome_id: str, rng_state: int, rng_calls: int = 0) -> None:
+        self.seed = seed
+        self.step = 0
+        self.distance = 0.0
+        self.time = 0
+        self.biome_id = biome_id
+        self.mission_name = "Bootstrap Salvage Sweep"
+        self.meters = SimMeters()
+        self.hunger = 100.0
+        self.hunger_drain_mul = 1.0
+        self.hydration_drain_mul = 1.0
+        self.travel_speed_bonus = 0.0
+        self.medical_efficiency = 0.0
+        self.injury = 0.0
+        self.injuries: dict[str, float] = {part: 0.0 for part in BODY_PARTS}
+        self.flags: set[str] = set()
+        self.death_flags: set[str] = set()
+        self.inventory: dict[str, int] = {}
+        self.equipped = SimEquipped()
+        self.dead = False
+        self.death_reason: str | None = None
+        self.last_event_id: str | None = None
+        self.recent_event_ids: list[str] = []
+        self.event_cooldowns: dict[str, int] = {}
+        self.rng_state = rng_state
+        self.rng_calls = rng_calls
+        self.run_log: list[SimRunLogEntry] = []
+        self.run_log_max = 300
+
+    @classmethod
+    def from_game_state(cls, state: GameState) -> "SimState":
+        sim = cls(seed=state.seed, biome_id=state.biome_id, rng_state=state.rng_state, rng_calls=state.rng_calls)
+        sim.step = state.step
+        sim.distance = state.distance
+        sim.time = state.time
+        sim.mission_name = state.mission_name
+        sim.meters = SimMeters(state.meters.stamina, state.meters.hydration, state.meters.morale)
+        sim.hunger = state.hunger
+        sim.hunger_drain_mul = state.hunger_drain_mul
+        sim.hydration_drain_mul = state.hydration_drain_mul
+        sim.travel_speed_bonus = state.travel_speed_bonus
+        sim.medical_efficiency = state.medical_efficiency
+        sim.injury = state.injury
+        sim.injuries = dict(state.injuries)
+        sim.flags = set(state.flags)
+        sim.death_flags = set(state.death_flags)
+        sim.inventory = dict(state.inventory)
+        sim.equipped = SimEquipped(**{slot: getattr(state.equipped, slot) for slot in RUNNER_EQUIP_SLOTS})
+        sim.dead = state.dead
+        sim.death_reason = state.death_reason
+        sim.last_event_id = state.last_event_id
+        sim.recent_event_ids = list(state.recent_event_ids)
+        sim.event_cooldowns = dict(state.event_cooldowns)
+        sim.run_log = [SimRunLogEntry.from_entry(entry) for entry in state.run_log]
+        sim.run_log_max = state.run_log_max
+        return sim
+
+    def to_game_state(self) -> GameState:
+        # model_construct keeps every value exactly as simulated; the engine already
+        # maintains the invariants GameState's validators would enforce.
+        return GameState.model_construct(
+            seed=self.seed,
+            step=self.step,
+            distance=self.distance,
+            time=self.time,
+            biome_id=self.biome_id,
+            mission_name=self.mission_name,
+            meters=MeterValues.model_construct(
+                stamina=self.meters.stamina,
+                hydration=self.meters.hydration,
+                morale=self.meters.morale,
+            ),
+            hunger=self.hunger,
+            hunger_drain_mul=self.hunger_drain_mul,
+            hydration_drain_mul=self.hydration_drain_mul,
+            travel_speed_bonus=self.travel_speed_bonus,
+            medical_efficiency=self.medical_efficiency,
+            injury=self.injury,
+            injuries=dict(self.injuries),
+            flags=set(self.flags),
+            death_flags=set(self.death_flags),
+            inventory=dict(self.inventory),
+            equipped=EquippedSlots.model_construct(**self.equipped.as_dict()),
+            dead=self.dead,
+            death_reason=self.death_reason,
+            last_event_id=self.last_event_id,
+            recent_event_ids=list(self.recent_event_ids),
+            event_cooldowns=dict(self.event_cooldowns),
+            rng_state=self.rng_state,
+            rng_calls=self.rng_calls,
+            run_log=[entry.to_entry() for entry in self.run_log],
+            run_log_max=self.run_log_max,
+        )
+
+    def append_run_log(
+        self,
+        category: RunLogCategory,
+        message: str,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        self.run_log.append(
+            SimRunLogEntry(datetime.now(timezone.utc).isoformat(), self.step, category, message, details or {})
+        )
+        overflow = len(self.run_log) - int(self.run_log_max)
+        if overflow > 0:
+            del self.run_log[:overflow]
+
+
+RunState = GameState | SimState
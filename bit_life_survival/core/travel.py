@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from .loader import ContentBundle
-from .models import GameState, clamp_meter, clamp_injury, make_log_entry, sync_total_injury
+from .models import GameState, LogLevel, clamp_meter, clamp_injury, make_log_entry, sync_total_injury
 from .run_director import snapshot as director_snapshot
 
 BASE_SPEED = 1.0
@@ -93,10 +93,12 @@ def compute_loadout_summary(state: GameState, content: ContentBundle) -> dict[st
     }
 
 
-def advance_travel(state: GameState, content: ContentBundle) -> list:
+def advance_travel(state: GameState, content: ContentBundle, log_level: LogLevel = "full") -> list:
     logs: list = []
+    full = log_level == "full"
     if state.dead:
-        logs.append(make_log_entry(state, "system", "Travel skipped: runner is dead."))
+        if log_level != "none":
+            logs.append(make_log_entry(state, "system", "Travel skipped: runner is dead." if full else ""))
         return logs
 
     biome = content.biome_by_id.get(state.biome_id)
@@ -151,6 +153,10 @@ def advance_travel(state: GameState, content: ContentBundle) -> list:
         state.injuries["torso"] = clamp_injury(state.injuries.get("torso", 0.0) + starvation_injury + dehydration_injury)
         sync_total_injury(state)
 
+    if log_level == "none":
+        apply_death_checks(state)
+        return logs
+
     logs.append(
         make_log_entry(
             state,
@@ -159,7 +165,9 @@ def advance_travel(state: GameState, content: ContentBundle) -> list:
                 f"You traveled {distance_delta:.2f} miles through the {biome.name.lower()}. "
                 f"The march drained stamina ({-stamina_drain:+.1f}), hydration ({-hydration_drain:+.1f}), "
                 f"hunger ({-hunger_drain:+.1f}), and morale ({-morale_drain:+.1f})."
-            ),
+            )
+            if full
+            else "",
             data={
                 "distanceDelta": distance_delta,
                 "director": {
@@ -185,6 +193,9 @@ def advance_travel(state: GameState, content: ContentBundle) -> list:
 
     death_reason = apply_death_checks(state)
     if death_reason:
-        logs.append(make_log_entry(state, "death", f"Runner died: {death_reason}."))
+        if full:
+            logs.append(make_log_entry(state, "death", f"Runner died: {death_reason}."))
+        else:
+            logs.append(make_log_entry(state, "death", "", data={"deathReason": death_reason}))
 
     return logs
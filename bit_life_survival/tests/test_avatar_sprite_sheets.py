@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pygame
+
+from bit_life_survival.app.ui import avatar
+
+
+def test_sprite_sheet_cells_match_procedural_sprites() -> None:
+    pygame.init()
+    sheet = avatar.SpriteSheet("gameplay", "citizen_a", 32)
+    for frame, pose, blink_step in ((0, "walk", 0), (3, "jump", 7), (2, "crouch", 19)):
+        area = sheet.cell(avatar._gameplay_cell(sheet.seed, frame, pose, blink_step))
+        expected = pygame.transform.scale(avatar._render_gameplay_sprite("citizen_a", frame, pose, blink_step), (32, 32))
+        assert pygame.image.tobytes(sheet.surface.subsurface(area), "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    assert not sheet.complete
+    assert sheet.bake() == avatar.GAMEPLAY_SHEET_CELLS - 3
+    assert sheet.complete
+
+
+def test_held_poses_share_one_cell_per_face_across_walk_frames() -> None:
+    pygame.init()
+    sheet = avatar.SpriteSheet("gameplay", "citizen_b", 32)
+    assert avatar.GAMEPLAY_SHEET_CELLS == 36
+    cells_by_pose: dict[str, set[int]] = {}
+    for pose in ("walk", "jump", "crouch"):
+        for frame in range(4):
+            for blink_step in range(39):
+                cell = avatar._gameplay_cell(sheet.seed, frame, pose, blink_step)
+                cells_by_pose.setdefault(pose, set()).add(cell)
+                if blink_step % 13 == 0:
+                    expected = pygame.transform.scale(avatar._render_gameplay_sprite("citizen_b", frame, pose, blink_step), (32, 32))
+                    assert pygame.image.tobytes(sheet.surface.subsurface(sheet.cell(cell)), "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    assert len(cells_by_pose["walk"]) == 24
+    assert len(cells_by_pose["jump"]) == len(cells_by_pose["crouch"]) == 6
+    assert set().union(*cells_by_pose.values()) == set(range(avatar.GAMEPLAY_SHEET_CELLS))
+
+
+def test_sprite_sheet_cache_evicts_by_bytes() -> None:
+    pygame.init()
+    sheet_bytes = avatar.SpriteSheet("gameplay", "probe", 24).nbytes
+    cache = avatar.SpriteSheetCache(max_bytes=sheet_bytes * 2)
+    first = cache.sheet("gameplay", "a", 24)
+    assert cache.sheet("gameplay", "a", 24) is first
+    cache.sheet("gameplay", "b", 24)
+    cache.sheet("gameplay", "c", 24)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.sheets) == (1, 3, 1, 2)
+    assert stats.bytes_used == sheet_bytes * 2
+    assert cache.sheet("gameplay", "a", 24) is not first
+
+    assert cache.bake_pending(budget_ms=10_000.0) == avatar.GAMEPLAY_SHEET_CELLS * 2
+    assert cache.bake_pending(budget_ms=10_000.0) == 0
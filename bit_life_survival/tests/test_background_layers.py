@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pygame
+
+from bit_life_survival.app.ui import theme
+from bit_life_survival.app.ui.backgrounds import BackgroundRenderer
+
+
+def test_static_layers_are_reused_until_palette_or_size_changes() -> None:
+    pygame.init()
+    original_theme = theme.CURRENT_THEME
+    renderer = BackgroundRenderer()
+    surface = pygame.Surface((640, 360))
+    try:
+        renderer.draw(surface, "vault")
+        first = pygame.image.tobytes(surface, "RGB")
+        layers = dict(renderer._static_layers)
+        renderer.update(0.5)
+        renderer.draw(surface, "vault")
+        assert renderer._static_layers == layers
+        assert pygame.image.tobytes(surface, "RGB") == first
+
+        other_theme = next(name for name in theme.available_themes() if name != theme.CURRENT_THEME)
+        theme.apply_theme(other_theme)
+        renderer.draw(surface, "vault")
+        assert len(renderer._static_layers) == 2
+        assert pygame.image.tobytes(surface, "RGB") != first
+
+        renderer.draw(pygame.Surface((320, 180)), "vault")
+        assert len(renderer._static_layers) == 3
+        renderer.invalidate()
+        assert renderer._static_layers == {}
+    finally:
+        theme.apply_theme(original_theme)
+
+
+def test_animated_biomes_still_change_between_frames() -> None:
+    pygame.init()
+    renderer = BackgroundRenderer()
+    surface = pygame.Surface((640, 360))
+    for biome_id in ("suburbs", "industrial", "forest"):
+        renderer.t = 0.2
+        renderer.draw(surface, biome_id)
+        before = pygame.image.tobytes(surface, "RGB")
+        renderer.t = 1.9
+        renderer.draw(surface, biome_id)
+        assert pygame.image.tobytes(surface, "RGB") != before
+
+
+def test_particle_sprites_are_baked_once_and_reused() -> None:
+    pygame.init()
+    renderer = BackgroundRenderer()
+    surface = pygame.Surface((640, 360))
+    for biome_id in ("suburbs", "industrial", "forest"):
+        renderer.draw(surface, biome_id)
+    sprites = dict(renderer._sprites)
+    assert sprites
+    for _ in range(5):
+        renderer.update(0.37)
+        for biome_id in ("suburbs", "industrial", "forest"):
+            renderer.draw(surface, biome_id)
+    assert renderer._sprites == sprites
+    renderer.invalidate()
+    assert renderer._sprites == {}
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pygame
 
 from bit_life_survival.app.ui import button_skins
+from bit_life_survival.app.ui.widgets import Button
 
 
 def test_skin_label_matching_allows_exact_button_art_labels() -> None:
@@ -21,3 +22,45 @@ def test_frame_text_mode_allows_semantic_reuse_without_embedded_label_match() ->
     pygame.display.set_mode((16, 16))
     surface = button_skins.get_button_surface("mission", (256, 64), hovered=False, enabled=True, render_mode="frame_text")
     assert surface is not None
+
+
+def test_tint_scales_tone_by_luminance_and_keeps_alpha() -> None:
+    pygame.init()
+    raw = pygame.Surface((3, 1), pygame.SRCALPHA)
+    raw.set_at((0, 0), (0, 0, 0, 255))
+    raw.set_at((1, 0), (255, 255, 255, 128))
+    raw.set_at((2, 0), (90, 40, 200, 0))
+    tinted = button_skins._single_hue_tint(raw, (200, 100, 50))
+    assert tuple(tinted.get_at((0, 0))) == (70, 35, 17, 255)
+    assert tuple(tinted.get_at((1, 0))) == (199, 99, 49, 128)
+    assert tuple(tinted.get_at((2, 0))) == (0, 0, 0, 0)
+
+
+def test_prewarm_renders_hover_and_disabled_variants_ahead_of_draw() -> None:
+    pygame.init()
+    pygame.display.set_mode((16, 16))
+    button_skins.clear_cache()
+    button = Button(pygame.Rect(0, 0, 190, 46), "Deploy")
+    assert button_skins.queue_prewarm([button, Button(pygame.Rect(0, 0, 90, 30), "Odd", allow_skin=False)]) == 3
+    while button_skins.prewarm_pending():
+        button_skins.prewarm_step(50.0)
+    misses = button_skins._render_tinted.cache_info().misses
+    for hovered, enabled in ((False, True), (True, True), (False, False)):
+        assert button_skins.get_button_surface("deploy", (190, 46), hovered=hovered, enabled=enabled) is not None
+    assert button_skins._render_tinted.cache_info().misses == misses
+
+
+def test_prewarm_step_tints_in_slices_and_matches_direct_render() -> None:
+    pygame.init()
+    pygame.display.set_mode((16, 16))
+    button_skins.clear_cache()
+    expected = pygame.image.tobytes(button_skins.get_button_surface("deploy", (190, 46), hovered=False, enabled=True), "RGBA")
+    button_skins.clear_cache()
+    button_skins.queue_prewarm([Button(pygame.Rect(0, 0, 190, 46), "Deploy")])
+    slices = 0
+    while not button_skins.prewarm_step(0.0):
+        slices += 1
+    width, height = button_skins._load_raw("deploy").get_size()
+    assert slices >= width * height // button_skins.TINT_SLICE_PIXELS
+    surface = button_skins.get_button_surface("deploy", (190, 46), hovered=False, enabled=True)
+    assert pygame.image.tobytes(surface, "RGBA") == expected
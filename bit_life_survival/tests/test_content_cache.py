@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from bit_life_survival.core.loader import load_content
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+
+
+def _copy_content(tmp_path: Path) -> Path:
+    target = tmp_path / "content"
+    shutil.copytree(CONTENT_DIR, target, ignore=shutil.ignore_patterns("__pycache__"))
+    return target
+
+
+def test_cached_bundle_matches_fresh_load(tmp_path: Path) -> None:
+    content_dir = _copy_content(tmp_path)
+    fresh = load_content(content_dir, use_cache=False)
+    first = load_content(content_dir)
+    cache_files = list((content_dir / "__pycache__").glob("content-*.pickle"))
+    assert len(cache_files) == 1
+
+    cached = load_content(content_dir)
+    assert cached.fingerprint == fresh.fingerprint == first.fingerprint
+    assert [event.model_dump() for event in cached.events] == [event.model_dump() for event in fresh.events]
+    assert cached.event_index.candidates("suburbs", 5.0, set()) is not None
+    assert sorted(cached.loot_sampler_by_id) == sorted(fresh.loot_sampler_by_id)
+
+
+def test_content_edit_rebuilds_cache_and_changes_fingerprint(tmp_path: Path) -> None:
+    content_dir = _copy_content(tmp_path)
+    before = load_content(content_dir)
+
+    items_path = content_dir / "items.json"
+    items = json.loads(items_path.read_text(encoding="utf-8"))
+    items[0]["name"] = "Renamed For Cache Test"
+    items_path.write_text(json.dumps(items, indent=2), encoding="utf-8")
+
+    after = load_content(content_dir)
+    assert after.fingerprint != before.fingerprint
+    assert after.items[0].name == "Renamed For Cache Test"
+    assert len(list((content_dir / "__pycache__").glob("content-*.pickle"))) == 1
+
+
+def test_corrupt_cache_falls_back_to_validation(tmp_path: Path) -> None:
+    content_dir = _copy_content(tmp_path)
+    cache_dir = tmp_path / "cache"
+    expected = load_content(content_dir, cache_dir=cache_dir)
+    for cache_file in cache_dir.glob("content-*.pickle"):
+        cache_file.write_bytes(b"not a pickle")
+
+    reloaded = load_content(content_dir, cache_dir=cache_dir)
+    assert reloaded.fingerprint == expected.fingerprint
+    assert len(reloaded.events) == len(expected.events)
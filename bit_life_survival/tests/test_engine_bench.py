@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from bit_life_survival.tools.engine_bench import (
+    BENCH_CASES,
+    compare_results,
+    results_payload,
+    run_benchmarks,
+    select_cases,
+)
+
+
+def test_engine_bench_times_every_selected_case() -> None:
+    cases = select_cases(["select_event", "evaluate_requirement", "run_drone_recovery", "slot_storage"])
+    assert [case.name for case in cases] == [
+        "select_event",
+        "evaluate_requirement",
+        "run_drone_recovery",
+        "slot_storage.save_slot",
+        "slot_storage.load_slot",
+    ]
+    results = run_benchmarks([replace(case, number=min(case.number, 5)) for case in cases], repeats=2, warmup=0)
+    assert [result.name for result in results] == [case.name for case in cases]
+    assert all(result.repeats == 2 and 0.0 < result.min_us <= result.median_us for result in results)
+    assert {case.name for case in BENCH_CASES} >= {"load_content.cached", "apply_outcomes", "advance_travel", "run_simulation.200"}
+    with pytest.raises(ValueError):
+        select_cases(["no_such_bench"])
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold() -> None:
+    baseline = {"version": 1, "results": {"a": {"min_us": 100.0}, "b": {"min_us": 100.0}}}
+    current = {"version": 1, "results": {"a": {"min_us": 119.0}, "b": {"min_us": 130.0}, "c": {"min_us": 5.0}}}
+    regressions = compare_results(current, baseline, threshold=0.2)
+    assert [(regression.name, regression.ratio) for regression in regressions] == [("b", 1.3)]
+    assert results_payload([])["results"] == {}
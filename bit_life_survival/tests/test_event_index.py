@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from bit_life_survival.core.event_index import EventIndex
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.core.models import Event
+
+
+def _make_event(event_id: str, trigger: dict) -> Event:
+    return Event.model_validate(
+        {
+            "id": event_id,
+            "title": "Indexed Event",
+            "text": "Testing the event index.",
+            "trigger": trigger,
+            "weight": 1.0,
+            "options": [{"id": "a", "label": "Go", "outcomes": [{"setFlags": ["seen"]}], "logLine": "Go."}],
+        }
+    )
+
+
+def _could_trigger(event: Event, biome_id: str, distance: float, flags: set[str]) -> bool:
+    trigger = event.trigger
+    if trigger.biome_ids and biome_id not in trigger.biome_ids:
+        return False
+    if trigger.min_distance is not None and distance < trigger.min_distance:
+        return False
+    if trigger.max_distance is not None and distance > trigger.max_distance:
+        return False
+    if trigger.required_flags_all and any(flag not in flags for flag in trigger.required_flags_all):
+        return False
+    return True
+
+
+def test_event_index_returns_superset_in_catalog_order() -> None:
+    events = [
+        _make_event("anywhere", {}),
+        _make_event("suburbs_early", {"biomeIds": ["suburbs"], "maxDistance": 5}),
+        _make_event("suburbs_mid", {"biomeIds": ["suburbs"], "minDistance": 5, "maxDistance": 12}),
+        _make_event("flagged", {"minDistance": 3, "requiredFlagsAll": ["radio", "map"]}),
+        _make_event("forest_only", {"biomeIds": ["forest"], "minDistance": 8}),
+        _make_event("late", {"minDistance": 12}),
+    ]
+    index = EventIndex(events)
+    flag_sets = [set(), {"radio"}, {"radio", "map"}, {"map"}]
+    for biome_id in ("suburbs", "forest", "unknown"):
+        for distance in (0.0, 2.5, 3.0, 5.0, 5.5, 8.0, 12.0, 12.01, 40.0):
+            for flags in flag_sets:
+                indexed = list(index.candidates(biome_id, distance, flags))
+                expected = [event for event in events if _could_trigger(event, biome_id, distance, flags)]
+                assert [event for event in indexed if _could_trigger(event, biome_id, distance, flags)] == expected
+                positions = [events.index(event) for event in indexed]
+                assert positions == sorted(positions)
+
+
+def test_event_index_prunes_out_of_range_and_flag_gated_events() -> None:
+    events = [
+        _make_event("early", {"maxDistance": 4}),
+        _make_event("late", {"minDistance": 20}),
+        _make_event("flagged", {"requiredFlagsAll": ["radio"]}),
+    ]
+    index = EventIndex(events)
+    assert [event.id for event in index.candidates("suburbs", 1.0, set())] == ["early"]
+    assert [event.id for event in index.candidates("suburbs", 25.0, {"radio"})] == ["late", "flagged"]
+
+
+def test_loaded_content_index_matches_full_catalog_scan() -> None:
+    content = load_content(Path(__file__).resolve().parents[1] / "content")
+    for distance in (0.0, 4.0, 9.5, 13.0, 30.0):
+        indexed = [
+            event
+            for event in content.event_index.candidates("suburbs", distance, set())
+            if _could_trigger(event, "suburbs", distance, set())
+        ]
+        expected = [event for event in content.events if _could_trigger(event, "suburbs", distance, set())]
+        assert indexed == expected
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pygame
+
+from bit_life_survival.app.scenes.core import Scene
+from bit_life_survival.app.scenes.load_game import LoadGameScene
+from bit_life_survival.app.scenes.menu import MASCOT_WANDER_S, MainMenuScene
+from bit_life_survival.app.services.frame_pacing import FrameScheduler
+
+
+def test_scheduler_idles_without_animation_and_wakes_on_input() -> None:
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    scheduler = FrameScheduler(pygame.time.Clock(), idle_fps=20, idle_grace_s=0.05)
+
+    assert scheduler.wants_idle(animating=True) is False
+    time.sleep(0.06)
+    assert scheduler.wants_idle(animating=False) is True
+
+    _, events = scheduler.next_frame(animating=False)
+    assert scheduler.idle is True
+    assert events == []
+
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"tag": "wake"}))
+    started = time.monotonic()
+    _, events = scheduler.next_frame(animating=False)
+    assert time.monotonic() - started < 0.04
+    assert [event.type for event in events] == [pygame.USEREVENT]
+    assert scheduler.wants_idle(animating=False) is False
+
+
+def test_ambient_scenes_allow_idle_pacing() -> None:
+    assert LoadGameScene().is_animating(app=None) is False
+    assert Scene().is_animating(app=None) is True
+
+
+def test_menu_mascot_walks_at_full_rate_then_stands_until_input() -> None:
+    menu = MainMenuScene()
+    assert menu.is_animating(app=None) is True
+    menu.update(None, MASCOT_WANDER_S / 2)
+    assert menu.is_animating(app=None) is True
+    menu.update(None, MASCOT_WANDER_S)
+    assert menu.is_animating(app=None) is False
+    standing = menu._mascot_time_s
+    menu.update(None, 1.0)
+    assert menu._mascot_time_s == standing
+
+    menu.handle_event(SimpleNamespace(quit=lambda: None), pygame.event.Event(pygame.QUIT))
+    assert menu.is_animating(app=None) is True
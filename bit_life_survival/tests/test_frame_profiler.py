@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import csv
+import time
+from pathlib import Path
+
+import pygame
+
+from bit_life_survival.app.services.frame_profiler import PHASES, FrameProfiler
+from bit_life_survival.app.ui.overlays.profiler import draw_profiler_overlay
+
+
+def test_profiler_splits_phases_and_summarizes_per_scene(tmp_path: Path) -> None:
+    profiler = FrameProfiler(window_frames=4)
+    for scene, render_s in (("MenuScene", 0.002), ("MenuScene", 0.002), ("RunScene", 0.02)):
+        profiler.start_frame(scene)
+        profiler.lap("events")
+        time.sleep(render_s)
+        profiler.lap("render")
+        sample = profiler.end_frame(background_ms=1.0)
+        render_ms = sample.phases[PHASES.index("render")]
+        assert sample.phases[PHASES.index("background")] == 1.0
+        assert render_ms >= render_s * 1000.0 - 1.0 - 0.5
+
+    assert profiler.scenes() == ["MenuScene", "RunScene"]
+    menu = profiler.summary("MenuScene")
+    run = profiler.summary("RunScene")
+    assert menu.frames == 2 and run.frames == 1
+    assert run.p99_ms > menu.p99_ms
+    assert sum(run.histogram) == 1 and run.histogram[0] == 0
+    assert menu.fps > 0.0
+
+    path = profiler.dump_csv(tmp_path / "trace.csv")
+    rows = list(csv.DictReader(path.open(encoding="utf-8")))
+    assert [row["scene"] for row in rows] == ["MenuScene", "MenuScene", "RunScene"]
+    assert float(rows[2]["background_ms"]) == 1.0
+
+    pygame.init()
+    panel = draw_profiler_overlay(pygame.Surface((640, 360)), run)
+    assert panel.right == 632
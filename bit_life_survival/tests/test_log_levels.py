@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from bit_life_survival.core.engine import create_initial_sim_state, create_initial_state, run_simulation
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.core.models import LogEntry
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+
+
+def _run(seed: int | str, log_level: str):
+    content = load_content(CONTENT_DIR)
+    return run_simulation(create_initial_state(seed, "suburbs"), content, steps=40, policy="random", log_level=log_level)
+
+
+def test_quiet_runs_reach_the_same_final_state() -> None:
+    for seed in (3, 17, "quiet"):
+        full_state, full_logs = _run(seed, "full")
+        for level in ("events", "none"):
+            state, _ = _run(seed, level)
+            assert state.model_dump(mode="python") == full_state.model_dump(mode="python")
+            assert state.rng_calls == full_state.rng_calls
+        assert full_logs
+
+
+def test_events_level_keeps_structured_entries_without_lines() -> None:
+    full_state, full_logs = _run(21, "full")
+    _, event_logs = _run(21, "events")
+    _, quiet_logs = _run(21, "none")
+
+    assert quiet_logs == []
+    assert [(entry.step, entry.type) for entry in event_logs] == [(entry.step, entry.type) for entry in full_logs]
+    assert all(entry.line == "" for entry in event_logs)
+    for full_entry, event_entry in zip(full_logs, event_logs):
+        if full_entry.data is not None:
+            assert event_entry.data == full_entry.data
+    assert full_state.dead or full_state.step == 40
+
+
+def test_sim_state_quiet_run_matches_game_state() -> None:
+    content = load_content(CONTENT_DIR)
+    game_state, _ = run_simulation(create_initial_state(8, "suburbs"), content, steps=30, policy="greedy", log_level="none")
+    sim_state, logs = run_simulation(create_initial_sim_state(8, "suburbs"), content, steps=30, policy="greedy", log_level="none")
+    assert logs == []
+    assert sim_state.to_game_state().model_dump(mode="python") == game_state.model_dump(mode="python")
+
+
+def test_none_level_constructs_no_log_entries(monkeypatch) -> None:
+    constructed = []
+    original_init = LogEntry.__init__
+
+    def counting_init(self, *args, **kwargs) -> None:
+        constructed.append(1)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(LogEntry, "__init__", counting_init)
+    content = load_content(CONTENT_DIR)
+    run_simulation(create_initial_sim_state(12, "suburbs"), content, steps=40, policy="greedy", log_level="full")
+    assert constructed
+    constructed.clear()
+    run_simulation(create_initial_sim_state(12, "suburbs"), content, steps=40, policy="greedy", log_level="none")
+    assert constructed == []
@@ -6,6 +6,7 @@ from types import SimpleNamespace
 import pygame
 
 from bit_life_survival.app.scenes.base import BaseScene
+from bit_life_survival.app.ui.claw_room import ROOM_WANDER_S
 from bit_life_survival.core.loader import load_content
 from bit_life_survival.core.models import EquippedSlots
 from bit_life_survival.core.persistence import create_default_save_data
@@ -117,3 +118,27 @@ def test_base_mission_context_includes_next_run_profile_preview() -> None:
     assert scene.active_context == "mission"
     surface = app.screen
     scene.render(app, surface)
+
+
+def test_base_stays_at_full_rate_while_room_actors_walk_then_idles_once_they_stand() -> None:
+    app = _AppStub()
+    scene = BaseScene()
+    scene._build_layout(app)
+    scene.update(app, 1 / 60.0)
+    actors = scene.claw_room.intake_actors
+    assert actors
+    start = {actor_id: actor.x_norm for actor_id, actor in actors.items()}
+    for _ in range(30):
+        scene.update(app, 1 / 60.0)
+    assert any(actor.x_norm != start[actor_id] for actor_id, actor in actors.items())
+    assert scene.is_animating(app) is True
+
+    for _ in range(int(ROOM_WANDER_S * 60) + 60):
+        scene.update(app, 1 / 60.0)
+    assert scene.is_animating(app) is False
+    settled = {actor_id: (actor.x_norm, actor.walk_phase, actor.lane_blend) for actor_id, actor in actors.items()}
+    scene.update(app, 1 / 60.0)
+    assert settled == {actor_id: (actor.x_norm, actor.walk_phase, actor.lane_blend) for actor_id, actor in actors.items()}
+
+    scene.handle_event(app, pygame.event.Event(pygame.MOUSEMOTION, {"pos": (0, 0), "rel": (1, 0), "buttons": (0, 0, 0)}))
+    assert scene.is_animating(app) is True
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pygame
+
+from bit_life_survival.app.ui.pixel_renderer import PixelRenderer
+
+
+def test_present_only_redraws_changed_bands_and_matches_full_scale() -> None:
+    pygame.init()
+    window_size = (1872, 1053)
+    renderer = PixelRenderer(virtual_width=1280, virtual_height=720)
+    reference = PixelRenderer(virtual_width=1280, virtual_height=720, dirty_tracking=False)
+    renderer.set_window_size(window_size)
+    reference.set_window_size(window_size)
+    canvas = pygame.Surface((1280, 720))
+    canvas.fill((40, 30, 50))
+    window = pygame.Surface(window_size)
+    expected = pygame.Surface(window_size)
+
+    assert renderer.present(window, canvas) == [window.get_rect()]
+    assert renderer.present(window, canvas) == []
+
+    canvas.fill((220, 180, 90), pygame.Rect(300, 200, 40, 10))
+    dirty = renderer.present(window, canvas)
+    reference.present(expected, canvas)
+    assert len(dirty) == 1
+    assert dirty[0].height < window_size[1] // 4
+    assert dirty[0].top <= 200 * 1053 // 720 < dirty[0].bottom
+    assert pygame.image.tobytes(window, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+    renderer.invalidate()
+    assert renderer.present(window, canvas) == [window.get_rect()]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from bit_life_survival.tools.render_bench import baseline_payload, compare_to_baseline, parse_resolution, run_render_bench
+
+
+def test_render_bench_reports_scene_costs_and_flags_regressions(tmp_path) -> None:
+    assert parse_resolution("1280X720") == (1280, 720)
+    results = run_render_bench(2, [(1280, 720)], ["ember"], ["menu"], tmp_path)
+    assert [result.key for result in results] == ["menu@1280x720/ember"]
+    result = results[0]
+    assert result.frames == 2 and result.mean_ms > 0.0
+    assert result.text_calls_per_frame > 0.0
+
+    baseline = baseline_payload(results)
+    assert compare_to_baseline(results, baseline, tolerance=0.25, slack_ms=0.5) == []
+
+    recorded = baseline["results"][result.key]
+    recorded["mean_ms"] = result.mean_ms / 10.0
+    recorded["surfaces_per_frame"] = result.surfaces_per_frame - 2.0
+    regressions = compare_to_baseline(results, baseline, tolerance=0.25, slack_ms=0.0)
+    assert {regression.metric for regression in regressions} == {"mean_ms", "surfaces_per_frame"}
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from bit_life_survival.core.engine import _instantiate_event, create_initial_state
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.core.models import Event, EventOption
+from bit_life_survival.core.requirements import (
+    RequirementContext,
+    compile_requirement,
+    evaluate_requirement,
+    option_requirement,
+)
+from bit_life_survival.core.selector import _option_access_multiplier, _unlocked_option_count
+
+
+def _content():
+    return load_content(Path(__file__).resolve().parents[1] / "content")
+
+
+def test_compiled_requirement_explain_keeps_lock_reason_text() -> None:
+    content = _content()
+    state = create_initial_state(seed=5, biome_id="suburbs")
+    state.meters.stamina = 20.0
+    state.injuries["torso"] = 30.0
+    state.injury = 30.0
+
+    cases = [
+        ({"hasTag": "Medical"}, (False, ["Requires owned item with tag 'Medical'."])),
+        ({"hasItem": "riot_vest"}, (False, ["Requires item 'riot_vest' in inventory or equipped slots."])),
+        ({"flag": "radio"}, (False, ["Requires flag 'radio'."])),
+        ({"meterGte": {"meter": "stamina", "value": 40}}, (False, ["Requires stamina >= 40.0."])),
+        ({"injuryLte": 10}, (False, ["Requires injury <= 10.0."])),
+        ({"distanceGte": 3}, (False, ["Requires distance >= 3.0."])),
+        ({"not": {"injuryLte": 50}}, (False, ["Blocked by negated requirement."])),
+        (
+            {"all": [{"flag": "radio"}, {"injuryLte": 50}, {"hasTag": "Tech"}]},
+            (False, ["Requires flag 'radio'.", "Requires owned item with tag 'Tech'."]),
+        ),
+        (
+            {"any": [{"hasTag": "Combat"}, {"hasTag": "Authority"}]},
+            (False, ["Requires any of: Requires owned item with tag 'Combat'. OR Requires owned item with tag 'Authority'."]),
+        ),
+        ({"any": [{"flag": "radio"}, {"injuryLte": 50}]}, (True, [])),
+        ({"mystery": 1}, (False, ["Unknown requirement."])),
+    ]
+    for expr, expected in cases:
+        compiled = compile_requirement(expr)
+        assert compiled.explain(state, content) == expected
+        assert evaluate_requirement(expr, state, content) == expected
+        assert compiled.check(state, content) is expected[0]
+
+
+def test_compiled_requirement_sees_inventory_and_equipped_items() -> None:
+    content = _content()
+    state = create_initial_state(seed=6, biome_id="suburbs")
+    combat_or_authority = compile_requirement({"any": [{"hasTag": "Combat"}, {"hasTag": "Authority"}]})
+    assert combat_or_authority.check(state, content) is False
+
+    state.equipped.armor = "riot_vest"
+    assert combat_or_authority.check(state, content) is True
+    assert compile_requirement({"hasItem": "riot_vest"}).check(state, content) is True
+
+    state.equipped.armor = None
+    state.inventory["field_pack"] = 1
+    assert compile_requirement({"hasTag": "Medical"}).explain(state, content) == (True, [])
+    state.inventory["field_pack"] = 0
+    assert compile_requirement({"hasTag": "Medical"}).check(state, content) is False
+
+
+def test_option_requirement_is_compiled_once_and_tracks_replacement() -> None:
+    content = _content()
+    compiled_options = [option for event in content.events for option in event.options if option.requirements]
+    assert compiled_options
+    assert all(option._compiled_requirements is not None for option in compiled_options)
+
+    option = EventOption.model_validate(
+        {"id": "o", "label": "Open", "requirements": {"flag": "radio"}, "outcomes": [{"setFlags": ["x"]}], "logLine": "L"}
+    )
+    first = option_requirement(option)
+    assert option_requirement(option) is first
+    option.requirements = {"flag": "map"}
+    replaced = option_requirement(option)
+    assert replaced is not first
+    assert replaced.explain(create_initial_state(seed=1, biome_id="suburbs"), content) == (False, ["Requires flag 'map'."])
+
+
+class _CountingRequirement:
+    def __init__(self, inner) -> None:
+        self.inner = inner
+        self.checks = 0
+        self.explains = 0
+
+    def check(self, state, content) -> bool:
+        self.checks += 1
+        return self.inner.check(state, content)
+
+    def explain(self, state, content):
+        self.explains += 1
+        return self.inner.explain(state, content)
+
+
+def test_requirement_context_evaluates_each_option_once_per_step() -> None:
+    content = _content()
+    state = create_initial_state(seed=8, biome_id="suburbs")
+    event = Event.model_validate(
+        {
+            "id": "memo",
+            "title": "Memo",
+            "text": "Shared requirement evaluation.",
+            "weight": 1.0,
+            "options": [
+                {"id": "open", "label": "Open", "outcomes": [{"setFlags": ["a"]}], "logLine": "A"},
+                {
+                    "id": "medical",
+                    "label": "Medical",
+                    "requirements": {"hasTag": "Medical"},
+                    "outcomes": [{"setFlags": ["b"]}],
+                    "logLine": "B",
+                },
+                {
+                    "id": "calm",
+                    "label": "Calm",
+                    "requirements": {"injuryLte": 50},
+                    "outcomes": [{"setFlags": ["c"]}],
+                    "logLine": "C",
+                },
+            ],
+        }
+    )
+    counters = {}
+    for option in event.options[1:]:
+        counter = _CountingRequirement(option_requirement(option))
+        option._compiled_requirements = (option.requirements, counter)
+        counters[option.id] = counter
+
+    context = RequirementContext(state, content)
+    _option_access_multiplier(event, state, content, context)
+    assert _unlocked_option_count(event, state, content, context) == 2
+    instance = _instantiate_event(event, state, content, context)
+
+    assert [option.locked for option in instance.options] == [False, True, False]
+    assert instance.options[1].lock_reasons == ["Requires owned item with tag 'Medical'."]
+    assert all(counter.checks == 1 for counter in counters.values())
+    assert counters["medical"].explains == 1
+    assert counters["calm"].explains == 0
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from bit_life_survival.core.rng import AliasTable, DeterministicRNG, WeightedEntry, WeightedTable
+
+
+def _entries(weights: list[float]) -> list[WeightedEntry[str]]:
+    return [WeightedEntry(value=f"v{index}", weight=weight) for index, weight in enumerate(weights)]
+
+
+@pytest.mark.parametrize("weights", [[8, 7, 7, 6, 5, 0, 3], [1, 2.5, 0.1, 4.25], [0.1] * 10, [3]])
+def test_weighted_table_matches_pick_weighted_draw_for_draw(weights: list[float]) -> None:
+    entries = _entries(weights)
+    table = WeightedTable.build(entries)
+    # Scaled by the same ``sum`` as pick_weighted, never the running cumulative total.
+    assert table.total == sum(weight for weight in weights if weight > 0)
+    scan_rng = DeterministicRNG.from_seed("sampler")
+    table_rng = DeterministicRNG.from_seed("sampler")
+    for _ in range(2000):
+        assert table_rng.sample(table) == scan_rng.pick_weighted(entries)
+    assert table_rng.state == scan_rng.state
+    assert table_rng.calls == scan_rng.calls
+
+
+def test_alias_table_tracks_the_weights() -> None:
+    weights = [8, 7, 1, 0, 4]
+    table = AliasTable.build(_entries(weights))
+    rng = DeterministicRNG.from_seed(99)
+    draws = 40000
+    counts = Counter(rng.sample_alias(table) for _ in range(draws))
+    assert rng.calls == draws
+    assert "v3" not in counts
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        if weight:
+            assert counts[f"v{index}"] / draws == pytest.approx(weight / total, abs=0.01)
+
+
+def test_samplers_reject_empty_distributions() -> None:
+    with pytest.raises(ValueError):
+        WeightedTable.build(_entries([0, 0]))
+    with pytest.raises(ValueError):
+        AliasTable.build([])
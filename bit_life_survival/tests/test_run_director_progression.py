@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from bit_life_survival.core.run_director import profile_for_seed, snapshot, steps_until_next_wave
+from bit_life_survival.core.run_director import (
+    _compute_snapshot,
+    director_for_seed,
+    profile_for_seed,
+    snapshot,
+    steps_until_next_wave,
+)
 
 
 def test_run_director_threat_and_reward_scale_with_distance() -> None:
@@ -42,3 +48,14 @@ def test_run_profile_is_deterministic_for_seed_and_changes_scaling() -> None:
     assert seeded.profile_id == profile_a.id
     assert seeded.reward_multiplier > 0.0
     assert baseline.reward_multiplier > 0.0
+
+
+def test_cached_director_snapshots_match_fresh_computation() -> None:
+    for seed in (None, 7, 12345, "wraith"):
+        profile = profile_for_seed(seed)
+        for step in range(0, 60):
+            for distance in (0.0, 9.99, 10.0, 17.5, 28.0, 39.9, 55.0, 120.0):
+                assert snapshot(distance, step, seed) == _compute_snapshot(distance, step, profile)
+    director = director_for_seed(12345)
+    assert director_for_seed(12345) is director
+    assert director.snapshot(20.0, 20) is director.snapshot(21.0, 29)
@@ -39,3 +39,259 @@ def test_save_slot_rename_and_delete(tmp_path: Path) -> None:
     service.delete_slot(2)
     slot2_after = next(summary for summary in service.list_slots() if summary.slot == 2)
     assert slot2_after.occupied is False
+
+
+def test_list_slots_serves_summaries_from_index(tmp_path: Path, monkeypatch) -> None:
+    from bit_life_survival.core import save_system
+
+    service = SaveService(tmp_path / "saves", slot_count=3)
+    created = service.create_new_game(slot=1, base_seed=7)
+    service.create_new_game(slot=3, base_seed=8)
+
+    parses: list[int] = []
+    original_migrate = save_system.migrate_save
+
+    def counting_migrate(payload):
+        parses.append(1)
+        return original_migrate(payload)
+
+    monkeypatch.setattr(save_system, "migrate_save", counting_migrate)
+    for _ in range(20):
+        summaries = service.list_slots()
+        assert service.last_slot() == 3
+    assert parses == []
+    assert [summary.occupied for summary in summaries] == [True, False, True]
+
+    created.vault.tav = 77
+    service.save_slot(1, created)
+    service.rename_slot(3, "Backup")
+    by_slot = {summary.slot: summary for summary in service.list_slots()}
+    assert by_slot[1].tav == 77
+    assert by_slot[3].slot_name == "Backup"
+    assert parses == []
+
+
+def test_list_slots_picks_up_external_file_changes(tmp_path: Path) -> None:
+    import json
+    import os
+
+    saves_dir = tmp_path / "saves"
+    service = SaveService(saves_dir, slot_count=3)
+    service.create_new_game(slot=2, base_seed=11)
+    assert next(summary for summary in service.list_slots() if summary.slot == 2).tav == 0
+
+    slot_path = saves_dir / "slot2.json"
+    payload = json.loads(slot_path.read_text(encoding="utf-8"))
+    payload["vault"]["tav"] = 123
+    slot_path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = slot_path.stat()
+    os.utime(slot_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert next(summary for summary in service.list_slots() if summary.slot == 2).tav == 123
+
+
+def test_write_behind_coalesces_saves_and_flushes_on_close(tmp_path: Path) -> None:
+    import threading
+
+    service = SaveService(tmp_path / "saves", slot_count=3, write_behind=True)
+    data = service.create_new_game(slot=1, base_seed=5)
+    service.flush()
+
+    storage = service._slots
+    gate = threading.Event()
+    written: list[tuple[int, int]] = []
+    original_write = storage.write_snapshot
+
+    def gated_write(slot, snapshot):
+        gate.wait(timeout=5)
+        written.append((slot, snapshot.payload["vault"]["tav"]))
+        original_write(slot, snapshot)
+
+    storage.write_snapshot = gated_write  # type: ignore[method-assign]
+    data.vault.tav = 1
+    service.save_slot(1, data)
+    for tav in range(2, 12):
+        data.vault.tav = tav
+        service.save_slot(1, data)
+    assert service.slot_exists(1)
+    gate.set()
+    service.close()
+
+    assert written[-1] == (1, 11)
+    assert len(written) <= 2
+    reloaded = SaveService(tmp_path / "saves", slot_count=3).load_slot(1)
+    assert reloaded.vault.tav == 11
+
+
+def test_failed_write_leaves_previous_slot_intact(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import pytest
+
+    from bit_life_survival.core import save_system
+
+    service = SaveService(tmp_path / "saves", slot_count=3)
+    data = service.create_new_game(slot=1, base_seed=5)
+    data.vault.tav = 9
+    service.save_slot(1, data)
+
+    def failing_fsync(fd: int) -> None:
+        raise OSError("disk went away")
+
+    monkeypatch.setattr(save_system.os, "fsync", failing_fsync)
+    data.vault.tav = 99
+    with pytest.raises(OSError):
+        service.save_slot(1, data)
+    monkeypatch.undo()
+
+    assert sorted(path.name for path in (tmp_path / "saves").iterdir()) == ["meta.json", "slot1.json"]
+    assert service.load_slot(1).vault.tav == 9
+    assert os.path.getsize(tmp_path / "saves" / "slot1.json") > 0
+
+
+def test_compact_format_roundtrips_and_reads_alongside_json(tmp_path: Path) -> None:
+    from bit_life_survival.core.save_system import COMPACT_SAVE_MAGIC
+
+    saves_dir = tmp_path / "saves"
+    service = SaveService(saves_dir, slot_count=3)
+    json_data = service.create_new_game(slot=1, base_seed=3)
+    json_data.vault.tav = 12
+    service.save_slot(1, json_data)
+
+    service.set_save_format("compact")
+    compact_data = service.create_new_game(slot=2, base_seed=4)
+    compact_data.vault.tav = 34
+    service.save_slot(2, compact_data)
+
+    json_bytes = (saves_dir / "slot1.json").read_bytes()
+    compact_bytes = (saves_dir / "slot2.json").read_bytes()
+    assert json_bytes.lstrip().startswith(b"{")
+    assert compact_bytes.startswith(COMPACT_SAVE_MAGIC)
+    assert len(compact_bytes) < len(json_bytes) // 3
+
+    fresh = SaveService(saves_dir, slot_count=3)
+    by_slot = {summary.slot: summary for summary in fresh.list_slots()}
+    assert by_slot[1].occupied and by_slot[1].tav == 12
+    assert by_slot[2].occupied and by_slot[2].tav == 34
+    assert fresh.load_slot(1).model_dump() == json_data.model_dump()
+    assert fresh.load_slot(2).model_dump() == compact_data.model_dump()
+
+
+def test_checksummed_summaries_skip_decoding_and_tampered_files_fall_back(tmp_path: Path, monkeypatch) -> None:
+    import json
+
+    from bit_life_survival.core import save_system
+
+    saves_dir = tmp_path / "saves"
+    service = SaveService(saves_dir, slot_count=3)
+    data = service.create_new_game(slot=1, base_seed=21)
+    data.vault.tav = 5
+    service.save_slot(1, data)
+
+    migrations: list[int] = []
+    original_migrate = save_system.migrate_save
+
+    def counting_migrate(payload):
+        migrations.append(1)
+        return original_migrate(payload)
+
+    monkeypatch.setattr(save_system, "migrate_save", counting_migrate)
+    fresh = SaveService(saves_dir, slot_count=3)
+    assert next(summary for summary in fresh.list_slots() if summary.slot == 1).tav == 5
+    assert migrations == []
+    assert fresh.load_slot(1).vault.tav == 5
+    assert 1 in fresh._slots._journal_bases
+
+    slot_path = saves_dir / "slot1.json"
+    payload = json.loads(slot_path.read_text(encoding="utf-8"))
+    payload["vault"]["tav"] = 500
+    slot_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    tampered = SaveService(saves_dir, slot_count=3)
+    assert next(summary for summary in tampered.list_slots() if summary.slot == 1).tav == 500
+    assert tampered.load_slot(1).vault.tav == 500
+    assert 1 not in tampered._slots._journal_bases
+    assert len(migrations) == 3
+
+
+def test_journal_mode_appends_deltas_and_replays_on_load(tmp_path: Path) -> None:
+    from bit_life_survival.core.models import Citizen
+
+    saves_dir = tmp_path / "saves"
+    service = SaveService(saves_dir, slot_count=3, journal=True)
+    data = service.create_new_game(slot=1, base_seed=13)
+    snapshot_bytes = (saves_dir / "slot1.json").read_bytes()
+    journal_path = saves_dir / "slot1.journal"
+    # create_new_game stamps last_run_seed with a second save, which is already journaled.
+    assert len(journal_path.read_bytes().splitlines()) == 1
+
+    for index in range(5):
+        data.vault.tav += 3
+        data.vault.storage["scrap"] = data.vault.storage.get("scrap", 0) + 1
+        data.vault.fallen_citizens.append(Citizen(id=f"fallen-{index}", name=f"Runner {index}", quirk="Steady"))
+        service.save_slot(1, data)
+
+    lines = journal_path.read_bytes().splitlines()
+    assert len(lines) == 6
+    assert (saves_dir / "slot1.json").read_bytes() == snapshot_bytes
+    assert all(len(line) < 1024 for line in lines)
+
+    replayed = SaveService(saves_dir, slot_count=3, journal=True)
+    summary = next(entry for entry in replayed.list_slots() if entry.slot == 1)
+    assert summary.tav == data.vault.tav
+    assert replayed.load_slot(1).model_dump() == data.model_dump()
+
+    replayed.close()
+    assert not journal_path.exists()
+    assert SaveService(saves_dir, slot_count=3).load_slot(1).model_dump() == data.model_dump()
+
+
+def test_journal_compacts_after_record_limit_and_ignores_torn_tail(tmp_path: Path) -> None:
+    from bit_life_survival.core.save_system import SlotStorage
+
+    saves_dir = tmp_path / "saves"
+    storage = SlotStorage(saves_dir, slot_count=3, journal=True, journal_compact_records=3)
+    data = storage.create_new_game(slot=2, base_seed=8)
+    journal_path = saves_dir / "slot2.journal"
+    for tav in range(1, 4):
+        data.vault.tav = tav
+        storage.save_slot(2, data)
+    assert len(journal_path.read_bytes().splitlines()) == 3
+
+    data.vault.tav = 4
+    storage.save_slot(2, data)
+    assert not journal_path.exists()
+
+    data.vault.tav = 5
+    storage.save_slot(2, data)
+    with journal_path.open("ab") as handle:
+        handle.write(b'{"base":"torn","set":{"ta')
+    assert SlotStorage(saves_dir, slot_count=3).load_slot(2).vault.tav == 5
+
+
+def test_journal_records_appended_after_torn_tail_survive_replay_and_compaction(tmp_path: Path) -> None:
+    from bit_life_survival.core.save_system import SlotStorage
+
+    saves_dir = tmp_path / "saves"
+    storage = SlotStorage(saves_dir, slot_count=3, journal=True)
+    data = storage.create_new_game(slot=1, base_seed=8)
+    data.vault.tav = 10
+    storage.save_slot(1, data)
+    journal_path = saves_dir / "slot1.journal"
+    with journal_path.open("ab") as handle:
+        handle.write(b'{"base":"torn","set":{"ta')
+
+    reopened = SlotStorage(saves_dir, slot_count=3, journal=True)
+    data = reopened.load_slot(1)
+    assert data.vault.tav == 10
+    data.vault.tav = 50
+    data.vault.run_counter = 7
+    reopened.save_slot(1, data)
+
+    replayed = SlotStorage(saves_dir, slot_count=3, journal=True).load_slot(1)
+    assert (replayed.vault.tav, replayed.vault.run_counter) == (50, 7)
+
+    SlotStorage(saves_dir, slot_count=3, journal=True).compact_journals()
+    assert not journal_path.exists()
+    compacted = SlotStorage(saves_dir, slot_count=3).load_slot(1)
+    assert (compacted.vault.tav, compacted.vault.run_counter) == (50, 7)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bit_life_survival.core.engine import create_initial_state, run_simulation
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.tools.simulate import (
+    build_batch_jobs,
+    parse_seed_spec,
+    run_batch,
+    state_signature,
+    summarize_batch,
+    summarize_batch_groups,
+)
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+
+
+def test_parse_seed_spec_expands_ranges_and_keeps_string_seeds() -> None:
+    assert parse_seed_spec("1-3,7, alpha ,run-b") == [1, 2, 3, 7, "alpha", "run-b"]
+    with pytest.raises(ValueError):
+        parse_seed_spec("9-2")
+    with pytest.raises(ValueError):
+        parse_seed_spec(" , ")
+
+
+def test_batch_results_match_single_run_signatures() -> None:
+    content = load_content(CONTENT_DIR)
+    jobs = build_batch_jobs([11, 12, "batch"], ["suburbs"], ["safe", "greedy"], steps=12, log_level="full")
+    results = run_batch(jobs, CONTENT_DIR, workers=1, content=content)
+
+    assert [(result.seed, result.policy) for result in results] == [(job.seed, job.policy) for job in jobs]
+    for job, result in zip(jobs, results):
+        final_state, logs = run_simulation(create_initial_state(job.seed, job.biome_id), content, steps=12, policy=job.policy)
+        assert result.signature == state_signature(final_state, logs)
+        assert result.distance == final_state.distance
+
+
+def test_batch_process_pool_matches_in_process_run() -> None:
+    jobs = build_batch_jobs(list(range(1, 7)), ["suburbs"], ["random"], steps=8)
+    serial = run_batch(jobs, CONTENT_DIR, workers=1)
+    pooled = run_batch(jobs, CONTENT_DIR, workers=2)
+    assert [result.signature for result in pooled] == [result.signature for result in serial]
+    assert summarize_batch(pooled).signature == summarize_batch(serial).signature
+
+
+def test_summarize_batch_aggregates_survival_and_death_reasons() -> None:
+    jobs = build_batch_jobs(list(range(1, 9)), ["suburbs"], ["safe", "greedy"], steps=40)
+    results = run_batch(jobs, CONTENT_DIR, workers=1)
+    overall = summarize_batch(results)
+    groups = summarize_batch_groups(results)
+
+    assert overall.runs == 16
+    assert [(group.policy, group.runs) for group in groups] == [("safe", 8), ("greedy", 8)]
+    deaths = sum(1 for result in results if result.dead)
+    assert sum(overall.death_reasons.values()) == deaths
+    assert overall.survival_rate == pytest.approx((16 - deaths) / 16)
+    assert overall.distance_percentiles[10] <= overall.distance_percentiles[50] <= overall.distance_percentiles[90]
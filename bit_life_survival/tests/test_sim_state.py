@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from bit_life_survival.core.engine import create_initial_sim_state, create_initial_state, run_simulation
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.core.sim_state import SimState
+
+
+def _content():
+    return load_content(Path(__file__).resolve().parents[1] / "content")
+
+
+def test_sim_state_round_trips_game_state_losslessly() -> None:
+    content = _content()
+    state = create_initial_state(4242, "suburbs")
+    state.equipped.pack = "backpack_basic"
+    state.equipped.utility2 = "lockpick_set"
+    state.append_run_log("SYSTEM", "Deployed.", {"note": 1})
+    final_state, _ = run_simulation(state, content, steps=12, policy="greedy")
+
+    sim = SimState.from_game_state(final_state)
+    restored = sim.to_game_state()
+    assert restored.model_dump(mode="python") == final_state.model_dump(mode="python")
+
+    sim.append_run_log("LOOT", "Found scrap.", {"qty": 2})
+    entry = sim.to_game_state().run_log[-1]
+    assert (entry.step, entry.category, entry.message, entry.details) == (final_state.step, "LOOT", "Found scrap.", {"qty": 2})
+    assert entry.timestamp
+
+    sim.inventory["scrap"] = 99
+    sim.meters.stamina = 1.0
+    assert final_state.inventory.get("scrap") != 99
+    assert final_state.meters.stamina != 1.0
+
+
+def test_sim_state_backend_matches_game_state_runs() -> None:
+    content = _content()
+    for policy in ("safe", "random", "greedy"):
+        for seed in (3, 77, "wraith"):
+            model_final, model_logs = run_simulation(create_initial_state(seed, "suburbs"), content, steps=40, policy=policy)
+            sim_final, sim_logs = run_simulation(create_initial_sim_state(seed, "suburbs"), content, steps=40, policy=policy)
+
+            assert isinstance(sim_final, SimState)
+            assert [entry.to_dict() for entry in sim_logs] == [entry.to_dict() for entry in model_logs]
+            assert sim_final.to_game_state().model_dump(mode="python") == model_final.model_dump(mode="python")
+
+
+def test_initial_sim_state_matches_initial_game_state() -> None:
+    sim = create_initial_sim_state(901, "suburbs")
+    model = create_initial_state(901, "suburbs")
+    assert sim.to_game_state().model_dump(mode="python") == model.model_dump(mode="python")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pygame
+
+from bit_life_survival.app.ui import theme
+from bit_life_survival.app.ui.text_cache import TextSurfaceCache, TextWrapCache
+
+
+def test_text_cache_hits_evicts_by_bytes_and_drops_on_style_change() -> None:
+    pygame.init()
+    original_theme = theme.CURRENT_THEME
+    font = theme.get_font(15)
+    cache = TextSurfaceCache(max_bytes=1 << 20)
+    try:
+        first = cache.render(font, "Stamina 80", (200, 200, 200))
+        assert cache.render(font, "Stamina 80", (200, 200, 200)) is first
+        assert cache.render(font, "Stamina 80", (10, 10, 10)) is not first
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+        assert stats.bytes_used > 0
+
+        one_entry = first.get_bytesize() * first.get_width() * first.get_height()
+        small = TextSurfaceCache(max_bytes=one_entry * 2)
+        for index in range(6):
+            small.render(font, f"Stamina 8{index}", (200, 200, 200))
+        assert small.stats().entries == 2
+        assert small.stats().evictions == 4
+        assert small.stats().bytes_used <= small.max_bytes
+
+        theme.apply_theme(original_theme)
+        assert cache.render(font, "Stamina 80", (200, 200, 200)) is not first
+        assert cache.stats().entries == 1
+    finally:
+        theme.apply_theme(original_theme)
+
+
+def test_wrap_cache_matches_greedy_wrap_and_memoizes() -> None:
+    pygame.init()
+    font = theme.get_font(15)
+    text = "The convoy stalls beside a collapsed overpass while scavengers argue over the last water drum."
+    cache = TextWrapCache(max_entries=2)
+
+    def greedy(width: int) -> tuple[str, ...]:
+        words = text.split()
+        lines, current = [], words[0]
+        for word in words[1:]:
+            if font.size(f"{current} {word}")[0] <= width:
+                current = f"{current} {word}"
+            else:
+                lines.append(current)
+                current = word
+        return (*lines, current)
+
+    for width in (90, 180, 400):
+        assert cache.wrap(text, font, width) == greedy(width)
+    assert cache.misses == 3
+    assert cache.wrap(text, font, 400) == greedy(400)
+    assert cache.hits == 1
+    assert cache.wrap(text, font, 90) == greedy(90)
+    assert cache.misses == 4
+    assert cache.wrap("   ", font, 90) == ("",)
+    assert cache.wrap(text, font, 0) == (text,)
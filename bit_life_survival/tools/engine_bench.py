@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from bit_life_survival.core.drone import run_drone_recovery
+from bit_life_survival.core.engine import create_initial_sim_state, create_initial_state, run_simulation
+from bit_life_survival.core.loader import ContentBundle, load_content
+from bit_life_survival.core.models import GameState, LogLevel
+from bit_life_survival.core.outcomes import apply_outcomes
+from bit_life_survival.core.persistence import create_default_vault_state
+from bit_life_survival.core.requirements import evaluate_requirement
+from bit_life_survival.core.rng import DeterministicRNG
+from bit_life_survival.core.save_system import SlotStorage
+from bit_life_survival.core.selector import select_event
+from bit_life_survival.core.travel import advance_travel
+
+app = typer.Typer(add_completion=False, help="Micro-benchmarks for the core engine loop with baseline comparison.")
+console = Console()
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "engine.json"
+BASELINE_VERSION = 1
+BENCH_SEEDS: tuple[int, ...] = (11, 29, 47, 83, 131, 197, 263, 331)
+BENCH_BIOME = "suburbs"
+# Steps run before sampling mid-run states, so inventories, flags and injuries are populated.
+STATE_WARMUP_STEPS = 12
+SIMULATION_STEPS: tuple[int, ...] = (10, 50, 200)
+# Simulated steps per timed round (about 0.5-0.8s); rounds of a single 200-step op swung
+# by 40% between runs, too noisy to gate on.
+SIMULATION_STEPS_PER_ROUND = 1600
+
+# A case's ``prepare(fixture, number)`` builds fresh inputs for ``number`` operations
+# outside the timed region and returns the callable that performs them.
+Prepare = Callable[["BenchFixture", int], Callable[[], None]]
+
+
+@dataclass(slots=True)
+class BenchCase:
+    name: str
+    number: int
+    prepare: Prepare
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    number: int
+    repeats: int
+    min_us: float
+    median_us: float
+    mean_us: float
+    stdev_us: float
+
+
+@dataclass(slots=True)
+class Regression:
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us if self.baseline_us else float("inf")
+
+
+class BenchFixture:
+    """Content plus deterministic mid-run states shared by every case."""
+
+    def __init__(self, content: ContentBundle, saves_dir: Path) -> None:
+        self.content = content
+        self.saves_dir = saves_dir
+        self.states: list[GameState] = []
+        for seed in BENCH_SEEDS:
+            state, _ = run_simulation(create_initial_state(seed, BENCH_BIOME), content, steps=STATE_WARMUP_STEPS)
+            if not state.dead:
+                self.states.append(state)
+        if not self.states:
+            raise RuntimeError("Every benchmark seed died during warmup; adjust BENCH_SEEDS.")
+        self.requirements = [
+            option.requirements
+            for event in content.events
+            for option in event.options
+            if option.requirements
+        ]
+        self.outcomes = [option.outcomes for event in content.events for option in event.options]
+
+    def fresh_states(self, count: int) -> list[GameState]:
+        return [self.states[index % len(self.states)].model_copy(deep=True) for index in range(count)]
+
+
+def _rng_for(state: GameState) -> DeterministicRNG:
+    return DeterministicRNG(seed=state.seed, state=state.rng_state, calls=state.rng_calls)
+
+
+def _prepare_load_content(use_cache: bool) -> Prepare:
+    def prepare(fixture: BenchFixture, number: int) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(number):
+                load_content(CONTENT_DIR, use_cache=use_cache)
+
+        return run
+
+    return prepare
+
+
+def _prepare_select_event(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    states = fixture.fresh_states(number)
+    rngs = [_rng_for(state) for state in states]
+    content = fixture.content
+
+    def run() -> None:
+        for state, rng in zip(states, rngs):
+            select_event(state, content, rng)
+
+    return run
+
+
+def _prepare_evaluate_requirement(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    states = fixture.states
+    exprs = fixture.requirements
+    content = fixture.content
+    pairs = [(exprs[index % len(exprs)], states[index % len(states)]) for index in range(number)]
+
+    def run() -> None:
+        for expr, state in pairs:
+            evaluate_requirement(expr, state, content)
+
+    return run
+
+
+def _prepare_apply_outcomes(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    states = fixture.fresh_states(number)
+    rngs = [_rng_for(state) for state in states]
+    outcomes = [fixture.outcomes[index % len(fixture.outcomes)] for index in range(number)]
+    content = fixture.content
+
+    def run() -> None:
+        for state, batch, rng in zip(states, outcomes, rngs):
+            apply_outcomes(state, batch, content, rng)
+
+    return run
+
+
+def _prepare_advance_travel(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    states = fixture.fresh_states(number)
+    content = fixture.content
+
+    def run() -> None:
+        for state in states:
+            advance_travel(state, content)
+
+    return run
+
+
+def _prepare_drone_recovery(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    states = fixture.fresh_states(number)
+    for index, state in enumerate(states):
+        state.dead = True
+        if index % 2:
+            state.death_reason = "Extracted successfully"
+            state.death_flags.add("extracted")
+        else:
+            state.death_reason = "Collapsed from exhaustion"
+    vaults = [create_default_vault_state(base_seed=state.seed) for state in states]
+    content = fixture.content
+
+    def run() -> None:
+        for vault, state in zip(vaults, states):
+            run_drone_recovery(vault, state, content)
+
+    return run
+
+
+def _slot_storage(fixture: BenchFixture) -> tuple[SlotStorage, Any]:
+    storage = SlotStorage(fixture.saves_dir, slot_count=3)
+    save_data = storage.create_new_game(slot=1, base_seed=BENCH_SEEDS[0])
+    save_data.vault.current_citizen = save_data.vault.citizen_queue[0]
+    save_data.vault.materials["scrap"] = 420
+    return storage, save_data
+
+
+def _prepare_save_slot(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    storage, save_data = _slot_storage(fixture)
+
+    def run() -> None:
+        for _ in range(number):
+            storage.save_slot(1, save_data)
+
+    return run
+
+
+def _prepare_load_slot(fixture: BenchFixture, number: int) -> Callable[[], None]:
+    storage, save_data = _slot_storage(fixture)
+    storage.save_slot(1, save_data)
+
+    def run() -> None:
+        for _ in range(number):
+            storage.load_slot(1)
+
+    return run
+
+
+def _prepare_run_simulation(
+    steps: int,
+    initial_state: Callable[[int, str], Any] = create_initial_state,
+    log_level: LogLevel = "full",
+) -> Prepare:
+    # Seeded runs die after roughly 20 steps, so one operation simulates ``steps`` steps in
+    # total across consecutive seeds rather than a single run that would stop early.
+    def prepare(fixture: BenchFixture, number: int) -> Callable[[], None]:
+        pool = number * (steps // 10 + 2)
+        states = [initial_state(BENCH_SEEDS[index % len(BENCH_SEEDS)] + index, BENCH_BIOME) for index in range(pool)]
+        content = fixture.content
+
+        def run() -> None:
+            remaining = iter(states)
+            for _ in range(number):
+                budget = steps
+                while budget > 0:
+                    final_state, _ = run_simulation(next(remaining), content, steps=budget, log_level=log_level)
+                    budget -= max(1, final_state.step)
+
+        return run
+
+    return prepare
+
+
+BENCH_CASES: tuple[BenchCase, ...] = (
+    BenchCase("load_content.cached", 100, _prepare_load_content(use_cache=True)),
+    BenchCase("load_content.uncached", 40, _prepare_load_content(use_cache=False)),
+    BenchCase("select_event", 200, _prepare_select_event),
+    BenchCase("evaluate_requirement", 2000, _prepare_evaluate_requirement),
+    BenchCase("apply_outcomes", 500, _prepare_apply_outcomes),
+    BenchCase("advance_travel", 500, _prepare_advance_travel),
+    BenchCase("run_drone_recovery", 200, _prepare_drone_recovery),
+    # Disk-bound: enough writes per round that fsync jitter averages out.
+    BenchCase("slot_storage.save_slot", 300, _prepare_save_slot),
+    BenchCase("slot_storage.load_slot", 400, _prepare_load_slot),
+    *(
+        BenchCase(f"run_simulation.{steps}", SIMULATION_STEPS_PER_ROUND // steps, _prepare_run_simulation(steps))
+        for steps in SIMULATION_STEPS
+    ),
+    # Headless batch configuration: slotted state, with and without log construction.
+    BenchCase("run_simulation.200.sim", SIMULATION_STEPS_PER_ROUND // 200, _prepare_run_simulation(200, create_initial_sim_state)),
+    BenchCase(
+        "run_simulation.200.sim_nolog",
+        SIMULATION_STEPS_PER_ROUND // 200,
+        _prepare_run_simulation(200, create_initial_sim_state, "none"),
+    ),
+)
+
+
+def select_cases(patterns: list[str] | None) -> list[BenchCase]:
+    if not patterns:
+        return list(BENCH_CASES)
+    selected = [case for case in BENCH_CASES if any(case.name.startswith(pattern) for pattern in patterns)]
+    if not selected:
+        raise ValueError(f"No benchmark matches {', '.join(patterns)}.")
+    return selected
+
+
+def time_case(case: BenchCase, fixture: BenchFixture, repeats: int, warmup: int) -> BenchResult:
+    """Run ``warmup`` untimed rounds, then ``repeats`` timed rounds of ``case.number`` operations."""
+    for _ in range(warmup):
+        case.prepare(fixture, case.number)()
+    samples: list[float] = []
+    for _ in range(repeats):
+        run = case.prepare(fixture, case.number)
+        # Like timeit: collector pauses depend on whatever earlier cases left on the heap.
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - started) * 1e6 / case.number)
+        finally:
+            gc.enable()
+    return BenchResult(
+        name=case.name,
+        number=case.number,
+        repeats=repeats,
+        min_us=round(min(samples), 3),
+        median_us=round(statistics.median(samples), 3),
+        mean_us=round(statistics.fmean(samples), 3),
+        stdev_us=round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+    )
+
+
+def run_benchmarks(cases: list[BenchCase], repeats: int, warmup: int, content_dir: Path = CONTENT_DIR) -> list[BenchResult]:
+    content = load_content(content_dir)
+    with tempfile.TemporaryDirectory(prefix="bls-engine-bench-") as saves_dir:
+        fixture = BenchFixture(content, Path(saves_dir))
+        return [time_case(case, fixture, repeats, warmup) for case in cases]
+
+
+def results_payload(results: list[BenchResult]) -> dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[Regression]:
+    """Per-op regressions beyond ``threshold`` (0.2 = 20% slower), judged on the best round.
+
+    The minimum is the least noisy estimate of the true cost; slower rounds mostly measure
+    scheduler and cache interference.
+    """
+    regressions: list[Regression] = []
+    recorded = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        base = recorded.get(name)
+        if base is None:
+            continue
+        if result["min_us"] > base["min_us"] * (1.0 + threshold):
+            regressions.append(Regression(name, base["min_us"], result["min_us"]))
+    return regressions
+
+
+def _format_us(value: float) -> str:
+    if value >= 1000.0:
+        return f"{value / 1000.0:.2f} ms"
+    return f"{value:.1f} us"
+
+
+def _print_comparison(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[Regression]:
+    regressions = compare_results(current, baseline, threshold)
+    regressed = {regression.name for regression in regressions}
+    recorded = baseline.get("results", {})
+    table = Table(title=f"Engine Benchmarks vs Baseline (best round, threshold {threshold:.0%})")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    for name, result in current.get("results", {}).items():
+        base = recorded.get(name)
+        if base is None:
+            table.add_row(name, "-", _format_us(result["min_us"]), "new")
+            continue
+        change = (result["min_us"] / base["min_us"] - 1.0) * 100.0 if base["min_us"] else 0.0
+        style = "red" if name in regressed else "green"
+        table.add_row(
+            name,
+            _format_us(base["min_us"]),
+            _format_us(result["min_us"]),
+            f"[{style}]{change:+.1f}%[/{style}]",
+        )
+    console.print(table)
+    return regressions
+
+
+def _load_payload(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        console.print(f"[bold red]Cannot read benchmark file {path}:[/bold red] {exc}")
+        raise typer.Exit(1) from exc
+    if payload.get("version") != BASELINE_VERSION:
+        console.print(f"[bold red]{path} has unsupported version {payload.get('version')!r}.[/bold red]")
+        raise typer.Exit(1)
+    return payload
+
+
+def _exit_on_regressions(regressions: list[Regression]) -> None:
+    if not regressions:
+        return
+    for regression in regressions:
+        console.print(
+            f"[bold red]Regression[/bold red] {regression.name}: "
+            f"{_format_us(regression.baseline_us)} -> {_format_us(regression.current_us)} ({regression.ratio:.2f}x)"
+        )
+    raise typer.Exit(1)
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    only: list[str] = typer.Option([], "--only", help="Run benchmarks whose name starts with this prefix (repeatable)."),
+    repeats: int = typer.Option(7, "--repeats", min=1, help="Timed rounds per benchmark."),
+    warmup: int = typer.Option(1, "--warmup", min=0, help="Untimed rounds before timing."),
+    json_out: Path | None = typer.Option(None, "--json", help="Write results to this file."),
+    baseline: Path | None = typer.Option(None, "--baseline", help="Compare against this baseline; exit 1 on regressions."),
+    threshold: float = typer.Option(0.2, "--threshold", min=0.0, help="Allowed best-round slowdown before flagging (0.2 = 20%)."),
+) -> None:
+    if ctx.invoked_subcommand is not None:
+        return
+    try:
+        cases = select_cases(only)
+    except ValueError as exc:
+        console.print(f"[bold red]{exc}[/bold red]")
+        raise typer.Exit(1) from exc
+
+    results = run_benchmarks(cases, repeats=repeats, warmup=warmup)
+    payload = results_payload(results)
+
+    table = Table(title=f"Engine Benchmarks ({repeats} rounds, {warmup} warmup)")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Ops/round", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("Stdev", justify="right")
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.number),
+            _format_us(result.min_us),
+            _format_us(result.median_us),
+            _format_us(result.mean_us),
+            _format_us(result.stdev_us),
+        )
+    console.print(table)
+
+    if json_out is not None:
+        json_out.parent.mkdir(parents=True, exist_ok=True)
+        json_out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        console.print(f"Wrote benchmark results to {json_out}")
+    if baseline is not None:
+        _exit_on_regressions(_print_comparison(payload, _load_payload(baseline), threshold))
+
+
+@app.command()
+def compare(
+    current: Path = typer.Argument(..., help="Results JSON written by --json."),
+    baseline: Path = typer.Option(DEFAULT_BASELINE, "--baseline", help="Baseline JSON to compare against."),
+    threshold: float = typer.Option(0.2, "--threshold", min=0.0, help="Allowed best-round slowdown before flagging (0.2 = 20%)."),
+) -> None:
+    """Compare a results file with the baseline; exit 1 on regressions."""
+    _exit_on_regressions(_print_comparison(_load_payload(current), _load_payload(baseline), threshold))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+app = typer.Typer(add_completion=False, help="Headless scene render benchmark with baseline comparison.")
+console = Console()
+
+SCENES: tuple[str, ...] = ("menu", "base", "operations", "briefing", "research", "run", "load_game")
+DEFAULT_RESOLUTIONS: tuple[str, ...] = ("1280x720", "1920x1080")
+DEFAULT_THEMES: tuple[str, ...] = ("ember",)
+BASELINE_VERSION = 1
+FRAME_DT = 1.0 / 60.0
+
+
+@dataclass(slots=True)
+class SceneBenchResult:
+    scene: str
+    resolution: str
+    theme: str
+    frames: int
+    first_ms: float
+    mean_ms: float
+    p95_ms: float
+    surfaces_per_frame: float
+    text_calls_per_frame: float
+    text_renders_per_frame: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.scene}@{self.resolution}/{self.theme}"
+
+
+@dataclass(slots=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def parse_resolution(spec: str) -> tuple[int, int]:
+    width, sep, height = spec.lower().partition("x")
+    if not sep:
+        raise ValueError(f"Resolution '{spec}' must look like 1280x720.")
+    return int(width), int(height)
+
+
+@contextmanager
+def count_surface_allocations() -> Iterator[list[int]]:
+    """Count ``pygame.Surface(...)`` constructions made while the block runs."""
+    import pygame
+
+    counter = [0]
+    original = pygame.Surface
+
+    class _CountingSurface(original):  # type: ignore[misc, valid-type]
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            counter[0] += 1
+            super().__init__(*args, **kwargs)
+
+    pygame.Surface = _CountingSurface  # type: ignore[misc]
+    try:
+        yield counter
+    finally:
+        pygame.Surface = original  # type: ignore[misc]
+
+
+def _scene_factories(stub) -> dict[str, Callable[[], Any]]:
+    from bit_life_survival.app.scenes.base import BaseScene
+    from bit_life_survival.app.scenes.briefing import BriefingScene
+    from bit_life_survival.app.scenes.load_game import LoadGameScene
+    from bit_life_survival.app.scenes.menu import MainMenuScene
+    from bit_life_survival.app.scenes.operations import OperationsScene
+    from bit_life_survival.app.scenes.research import ResearchScene
+    from bit_life_survival.app.scenes.run import RunScene
+
+    def entered(scene):
+        scene.on_enter(stub)
+        return scene
+
+    return {
+        "menu": MainMenuScene,
+        "base": lambda: entered(BaseScene()),
+        "operations": lambda: entered(OperationsScene(initial_tab="loadout")),
+        "briefing": lambda: BriefingScene(run_seed=stub.compute_run_seed(), biome_id="suburbs"),
+        "research": ResearchScene,
+        "run": lambda: entered(RunScene(run_seed=stub.compute_run_seed(), biome_id="suburbs")),
+        "load_game": LoadGameScene,
+    }
+
+
+def bench_scene(stub, scene, frames: int) -> tuple[float, list[float], int, int, int]:
+    """Render ``scene`` once cold, then ``frames`` more; returns timings and counters."""
+    from bit_life_survival.app.ui.text_cache import TEXT_CACHE
+
+    started = time.perf_counter()
+    scene.render(stub, stub.screen)
+    first_ms = (time.perf_counter() - started) * 1000.0
+
+    before = TEXT_CACHE.stats()
+    timings: list[float] = []
+    with count_surface_allocations() as surfaces:
+        for _ in range(frames):
+            started = time.perf_counter()
+            stub.backgrounds.update(FRAME_DT)
+            scene.render(stub, stub.screen)
+            timings.append((time.perf_counter() - started) * 1000.0)
+    after = TEXT_CACHE.stats()
+    text_renders = after.misses - before.misses
+    text_calls = text_renders + after.hits - before.hits
+    return first_ms, timings, surfaces[0], text_calls, text_renders
+
+
+def run_render_bench(
+    frames: int,
+    resolutions: list[tuple[int, int]],
+    themes: list[str],
+    scenes: list[str],
+    saves_dir: Path,
+) -> list[SceneBenchResult]:
+    from bit_life_survival.app.ui import theme as ui_theme
+    from bit_life_survival.tools.scene_harness import REPO_ROOT, AppStub, draft_first_citizen, prime_research
+
+    original_theme = ui_theme.CURRENT_THEME
+    results: list[SceneBenchResult] = []
+    try:
+        for theme_name in themes:
+            ui_theme.apply_theme(theme_name)
+            for width, height in resolutions:
+                stub = AppStub(REPO_ROOT, saves_dir / f"{theme_name}-{width}x{height}", screen_size=(width, height))
+                draft_first_citizen(stub)
+                prime_research(stub.save_data.vault)
+                factories = _scene_factories(stub)
+                for scene_name in scenes:
+                    first_ms, timings, surfaces, text_calls, text_renders = bench_scene(stub, factories[scene_name](), frames)
+                    ordered = sorted(timings)
+                    results.append(
+                        SceneBenchResult(
+                            scene=scene_name,
+                            resolution=f"{width}x{height}",
+                            theme=theme_name,
+                            frames=frames,
+                            first_ms=round(first_ms, 3),
+                            mean_ms=round(sum(timings) / len(timings), 3),
+                            p95_ms=round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 3),
+                            surfaces_per_frame=round(surfaces / frames, 2),
+                            text_calls_per_frame=round(text_calls / frames, 2),
+                            text_renders_per_frame=round(text_renders / frames, 2),
+                        )
+                    )
+                stub.save_service.close()
+    finally:
+        ui_theme.apply_theme(original_theme)
+    return results
+
+
+def compare_to_baseline(
+    results: list[SceneBenchResult],
+    baseline: dict[str, Any],
+    tolerance: float,
+    slack_ms: float,
+) -> list[Regression]:
+    """Flag timing regressions beyond ``tolerance`` (+``slack_ms``) and any rise in per-frame counts."""
+    regressions: list[Regression] = []
+    recorded = baseline.get("results", {})
+    for result in results:
+        base = recorded.get(result.key)
+        if base is None:
+            continue
+        if result.mean_ms > base["mean_ms"] * (1.0 + tolerance) + slack_ms:
+            regressions.append(Regression(result.key, "mean_ms", base["mean_ms"], result.mean_ms))
+        for metric in ("surfaces_per_frame", "text_renders_per_frame"):
+            current = getattr(result, metric)
+            if current > base[metric] + 0.5:
+                regressions.append(Regression(result.key, metric, base[metric], current))
+    return regressions
+
+
+def baseline_payload(results: list[SceneBenchResult]) -> dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "results": {result.key: asdict(result) for result in results},
+    }
+
+
+@app.command()
+def main(
+    frames: int = typer.Option(60, "--frames", min=1, help="Measured frames per scene (after one cold frame)."),
+    resolutions: list[str] = typer.Option(list(DEFAULT_RESOLUTIONS), "--resolution", help="Virtual resolution WxH (repeatable)."),
+    themes: list[str] = typer.Option(list(DEFAULT_THEMES), "--theme", help="UI theme (repeatable)."),
+    scenes: list[str] = typer.Option(list(SCENES), "--scene", help=f"Scene to run (repeatable): {'|'.join(SCENES)}."),
+    json_out: Path | None = typer.Option(None, "--json", help="Write results to this file."),
+    baseline: Path | None = typer.Option(None, "--baseline", help="Compare against this baseline file; exit 1 on regressions."),
+    save_baseline: Path | None = typer.Option(None, "--save-baseline", help="Write these results as a new baseline."),
+    tolerance: float = typer.Option(0.25, "--tolerance", min=0.0, help="Allowed relative ms/frame increase over baseline."),
+    slack_ms: float = typer.Option(0.5, "--slack-ms", min=0.0, help="Absolute ms/frame noise allowance on top of --tolerance."),
+) -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from bit_life_survival.app.ui import theme as ui_theme
+
+    unknown_scenes = [scene for scene in scenes if scene not in SCENES]
+    if unknown_scenes:
+        console.print(f"[bold red]Unknown scene '{unknown_scenes[0]}'.[/bold red]")
+        raise typer.Exit(1)
+    unknown_themes = [name for name in themes if name not in ui_theme.available_themes()]
+    if unknown_themes:
+        console.print(f"[bold red]Unknown theme '{unknown_themes[0]}'.[/bold red]")
+        raise typer.Exit(1)
+    try:
+        parsed_resolutions = [parse_resolution(spec) for spec in resolutions]
+    except ValueError as exc:
+        console.print(f"[bold red]Invalid resolution:[/bold red] {exc}")
+        raise typer.Exit(1) from exc
+
+    with tempfile.TemporaryDirectory(prefix="bls-render-bench-") as saves_dir:
+        results = run_render_bench(frames, parsed_resolutions, themes, scenes, Path(saves_dir))
+
+    baseline_results: dict[str, Any] = {}
+    regressions: list[Regression] = []
+    if baseline is not None:
+        baseline_data = json.loads(baseline.read_text(encoding="utf-8"))
+        baseline_results = baseline_data.get("results", {})
+        regressions = compare_to_baseline(results, baseline_data, tolerance, slack_ms)
+
+    table = Table(title=f"Scene Render Benchmark ({frames} frames)")
+    table.add_column("Scene", style="cyan", no_wrap=True)
+    table.add_column("Resolution", no_wrap=True)
+    table.add_column("Theme", no_wrap=True)
+    table.add_column("Cold ms", justify="right")
+    table.add_column("ms/frame", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Surfaces/frame", justify="right")
+    table.add_column("Text calls/frame", justify="right")
+    table.add_column("Text renders/frame", justify="right")
+    if baseline is not None:
+        table.add_column("vs baseline", justify="right")
+    regressed = {regression.key for regression in regressions}
+    for result in results:
+        row = [
+            result.scene,
+            result.resolution,
+            result.theme,
+            f"{result.first_ms:.2f}",
+            f"{result.mean_ms:.2f}",
+            f"{result.p95_ms:.2f}",
+            f"{result.surfaces_per_frame:.1f}",
+            f"{result.text_calls_per_frame:.1f}",
+            f"{result.text_renders_per_frame:.1f}",
+        ]
+        if baseline is not None:
+            base = baseline_results.get(result.key)
+            if base is None:
+                row.append("new")
+            else:
+                delta = (result.mean_ms / base["mean_ms"] - 1.0) * 100.0 if base["mean_ms"] else 0.0
+                style = "red" if result.key in regressed else "green"
+                row.append(f"[{style}]{delta:+.1f}%[/{style}]")
+        table.add_row(*row)
+    console.print(table)
+
+    if json_out is not None:
+        json_out.write_text(json.dumps([asdict(result) for result in results], indent=2), encoding="utf-8")
+        console.print(f"Wrote benchmark results to {json_out}")
+    if save_baseline is not None:
+        save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        save_baseline.write_text(json.dumps(baseline_payload(results), indent=2), encoding="utf-8")
+        console.print(f"Wrote baseline to {save_baseline}")
+    if regressions:
+        for regression in regressions:
+            console.print(
+                f"[bold red]Regression[/bold red] {regression.key} {regression.metric}: "
+                f"{regression.baseline:g} -> {regression.current:g}"
+            )
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
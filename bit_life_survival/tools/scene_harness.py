@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pygame
+
+from bit_life_survival.app.services.saves import SaveService
+from bit_life_survival.app.ui.backgrounds import BackgroundRenderer
+from bit_life_survival.core.loader import load_content
+from bit_life_survival.core.models import EquippedSlots
+from bit_life_survival.core.persistence import create_default_save_data, transfer_selected_citizen_to_roster
+from bit_life_survival.core.research import buy_research
+from bit_life_survival.core.settings import default_settings
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class AppStub:
+    """Minimal stand-in for ``GameApp`` that lets scenes update and render off-screen.
+
+    Seeds two save slots with a mid-game vault so the base, operations, load and run
+    scenes all have something to show.
+    """
+
+    def __init__(self, repo_root: Path, saves_dir: Path, screen_size: tuple[int, int] = (1920, 1080)) -> None:
+        pygame.init()
+        self.screen = pygame.Surface(screen_size)
+        self.content = load_content(repo_root / "bit_life_survival" / "content")
+        self.save_data = create_default_save_data(base_seed=2042)
+        self.current_loadout = EquippedSlots()
+        self.settings = default_settings()
+        self.settings["gameplay"]["tutorial_completed"] = True
+        self.settings["gameplay"]["replay_tutorial"] = False
+        self.backgrounds = BackgroundRenderer()
+        self.current_slot = 1
+        self.gameplay_logger = logging.getLogger("scene_harness")
+
+        saves_dir.mkdir(parents=True, exist_ok=True)
+        self.save_service = SaveService(saves_dir, slot_count=3)
+
+        slot1 = self.save_service.create_new_game(slot=1, base_seed=2042)
+        slot1.vault.tav = 48
+        slot1.vault.vault_level = 3
+        slot1.vault.upgrades["drone_bay_level"] = 2
+        slot1.vault.last_run_distance = 19.4
+        slot1.vault.last_run_time = 31
+        slot1.vault.materials["scrap"] = 420
+        slot1.vault.settings.seen_run_help = True
+        self.save_service.save_slot(1, slot1)
+
+        slot2 = self.save_service.create_new_game(slot=2, base_seed=3001)
+        slot2.vault.tav = 11
+        slot2.vault.last_run_distance = 6.7
+        slot2.vault.last_run_time = 14
+        self.save_service.save_slot(2, slot2)
+
+        self.save_data = slot1
+
+    def save_current_slot(self) -> None:
+        if self.current_slot is not None and self.save_data is not None:
+            self.save_service.save_slot(self.current_slot, self.save_data)
+
+    def save_settings(self) -> None:
+        return
+
+    def virtual_mouse_pos(self) -> tuple[int, int]:
+        return (0, 0)
+
+    def compute_run_seed(self) -> int:
+        return int(self.save_data.vault.settings.base_seed) + int(self.save_data.vault.run_counter)
+
+    def change_scene(self, _scene) -> None:
+        return
+
+    def return_staged_loadout(self) -> None:
+        return
+
+    def quit(self) -> None:
+        return
+
+
+def draft_first_citizen(app: AppStub) -> None:
+    """Draft and kit out the first queued citizen, as the base/operations/run screens expect."""
+    drafted = transfer_selected_citizen_to_roster(app.save_data.vault, app.save_data.vault.citizen_queue[0].id)
+    drafted.loadout.pack = "backpack_basic"
+    drafted.loadout.armor = "armor_scrap"
+    drafted.loadout.utility1 = "water_pouch"
+    drafted.loadout.utility2 = "ration_pack"
+    drafted.kit = {
+        "water_pouch": 3,
+        "ration_pack": 2,
+        "medkit_small": 1,
+    }
+    app.current_loadout = drafted.loadout.model_copy(deep=True)
+    app.save_data.vault.current_citizen = drafted
+    app.save_data.vault.active_deploy_citizen_id = drafted.id
+
+
+def prime_research(vault) -> None:
+    vault.materials["scrap"] = 2400
+    progression = [
+        ("rationing", 2),
+        ("water_recycling", 1),
+        ("field_medicine", 1),
+        ("salvage_tools", 2),
+        ("route_caching", 1),
+        ("deep_contracts", 1),
+        ("intake_protocols", 2),
+        ("team_doctrine", 1),
+        ("drone_recovery_suite", 2),
+        ("drone_pathing", 1),
+        ("ops_planning", 2),
+        ("forward_command", 1),
+    ]
+    for node_id, target_level in progression:
+        for _ in range(target_level):
+            try:
+                buy_research(vault, node_id)
+            except ValueError:
+                break
+    vault.materials["scrap"] = max(160, int(vault.materials.get("scrap", 0)))
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from bit_life_survival.core.engine import create_initial_state, run_simulation
-from bit_life_survival.core.loader import ContentValidationError, load_content
+from bit_life_survival.core.engine import create_initial_sim_state, create_initial_state, run_simulation
+from bit_life_survival.core.loader import ContentBundle, ContentValidationError, load_content
+from bit_life_survival.core.models import RUNNER_EQUIP_SLOTS, LogLevel
 
 app = typer.Typer(add_completion=False, help="Run deterministic headless simulation for balancing and testing.")
 console = Console()
 
 AutopickPolicy = Literal["safe", "random", "greedy"]
+AUTOPICK_POLICIES: tuple[str, ...] = ("safe", "random", "greedy")
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "content"
+PERCENTILES: tuple[int, ...] = (10, 50, 90)
+LOG_LEVELS: tuple[str, ...] = ("full", "events", "none")
 
 
 def _normalize_seed(raw_seed: str) -> int | str:
@@ -40,7 +49,7 @@ def _state_signature_payload(state, logs) -> dict:
         "injury": round(state.injury, 6),
         "flags": sorted(state.flags),
         "inventory": dict(sorted(state.inventory.items())),
-        "equipped": state.equipped.model_dump(mode="python"),
+        "equipped": {slot: getattr(state.equipped, slot) for slot in RUNNER_EQUIP_SLOTS},
         "dead": state.dead,
         "death_reason": state.death_reason,
         "last_event_id": state.last_event_id,
@@ -51,16 +60,192 @@ def _state_signature_payload(state, logs) -> dict:
     }
 
 
-@app.command()
+def state_signature(state, logs) -> str:
+    payload = _state_signature_payload(state, logs)
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def parse_seed_spec(spec: str) -> list[int | str]:
+    """Expand a seed spec such as ``1-100,250,alpha`` into an ordered seed list."""
+    seeds: list[int | str] = []
+    for raw_part in spec.split(","):
+        part = raw_part.strip()
+        if not part:
+            continue
+        start_text, sep, end_text = part.partition("-")
+        if sep and start_text.strip().isdigit() and end_text.strip().isdigit():
+            start, end = int(start_text), int(end_text)
+            if end < start:
+                raise ValueError(f"Seed range '{part}' ends before it starts.")
+            seeds.extend(range(start, end + 1))
+            continue
+        seeds.append(_normalize_seed(part))
+    if not seeds:
+        raise ValueError("Seed spec did not contain any seeds.")
+    return seeds
+
+
+@dataclass(slots=True)
+class BatchJob:
+    seed: int | str
+    biome_id: str
+    policy: str
+    steps: int
+    # Signatures hash the timeline too, so they only compare across runs at the same level.
+    log_level: LogLevel = "none"
+
+
+@dataclass(slots=True)
+class BatchRunResult:
+    seed: int | str
+    biome_id: str
+    policy: str
+    steps: int
+    distance: float
+    time: int
+    dead: bool
+    death_reason: str | None
+    signature: str
+
+
+@dataclass(slots=True)
+class BatchGroupSummary:
+    biome_id: str
+    policy: str
+    runs: int
+    survival_rate: float
+    death_reasons: dict[str, int]
+    distance_percentiles: dict[int, float]
+    time_percentiles: dict[int, float]
+    signature: str
+
+
+_WORKER_CONTENT: ContentBundle | None = None
+
+
+def _init_batch_worker(content_dir: str) -> None:
+    global _WORKER_CONTENT
+    _WORKER_CONTENT = load_content(content_dir)
+
+
+def _run_batch_job_with_content(job: BatchJob, content: ContentBundle) -> BatchRunResult:
+    state = create_initial_sim_state(job.seed, job.biome_id)
+    final_state, logs = run_simulation(
+        state,
+        content,
+        steps=job.steps,
+        policy=job.policy,  # type: ignore[arg-type]
+        log_level=job.log_level,
+    )
+    return BatchRunResult(
+        seed=final_state.seed,
+        biome_id=job.biome_id,
+        policy=job.policy,
+        steps=final_state.step,
+        distance=final_state.distance,
+        time=final_state.time,
+        dead=final_state.dead,
+        death_reason=final_state.death_reason,
+        signature=state_signature(final_state, logs),
+    )
+
+
+def _run_batch_job(job: BatchJob) -> BatchRunResult:
+    if _WORKER_CONTENT is None:
+        raise RuntimeError("Batch worker content was not initialized.")
+    return _run_batch_job_with_content(job, _WORKER_CONTENT)
+
+
+def build_batch_jobs(
+    seeds: list[int | str],
+    biomes: list[str],
+    policies: list[str],
+    steps: int,
+    log_level: LogLevel = "none",
+) -> list[BatchJob]:
+    return [
+        BatchJob(seed=seed, biome_id=biome_id, policy=policy, steps=steps, log_level=log_level)
+        for biome_id in biomes
+        for policy in policies
+        for seed in seeds
+    ]
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    content_dir: Path | str = CONTENT_DIR,
+    workers: int | None = None,
+    content: ContentBundle | None = None,
+) -> list[BatchRunResult]:
+    """Run every job and return results in job order.
+
+    With one worker the jobs run in-process against ``content`` (loaded once if not
+    given); otherwise each pool worker loads the content bundle once at startup.
+    """
+    worker_count = workers if workers is not None else (os.cpu_count() or 1)
+    worker_count = max(1, min(worker_count, len(jobs) or 1))
+    if worker_count == 1:
+        bundle = content if content is not None else load_content(content_dir)
+        return [_run_batch_job_with_content(job, bundle) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (worker_count * 8))
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=_init_batch_worker,
+        initargs=(str(content_dir),),
+    ) as pool:
+        return list(pool.map(_run_batch_job, jobs, chunksize=chunksize))
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    position = (len(sorted_values) - 1) * (pct / 100.0)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction)
+
+
+def summarize_batch(results: list[BatchRunResult], biome_id: str = "*", policy: str = "*") -> BatchGroupSummary:
+    distances = sorted(result.distance for result in results)
+    times = sorted(float(result.time) for result in results)
+    survivors = sum(1 for result in results if not result.dead)
+    death_reasons = Counter(result.death_reason or "Unknown" for result in results if result.dead)
+    digest = hashlib.sha256("".join(result.signature for result in results).encode("utf-8")).hexdigest()[:16]
+    return BatchGroupSummary(
+        biome_id=biome_id,
+        policy=policy,
+        runs=len(results),
+        survival_rate=(survivors / len(results)) if results else 0.0,
+        death_reasons=dict(death_reasons.most_common()),
+        distance_percentiles={pct: _percentile(distances, pct) for pct in PERCENTILES},
+        time_percentiles={pct: _percentile(times, pct) for pct in PERCENTILES},
+        signature=digest,
+    )
+
+
+def summarize_batch_groups(results: list[BatchRunResult]) -> list[BatchGroupSummary]:
+    grouped: dict[tuple[str, str], list[BatchRunResult]] = {}
+    for result in results:
+        grouped.setdefault((result.biome_id, result.policy), []).append(result)
+    return [summarize_batch(group, biome_id, policy) for (biome_id, policy), group in grouped.items()]
+
+
+@app.callback(invoke_without_command=True)
 def main(
+    ctx: typer.Context,
     seed: str = typer.Option("123", "--seed", help="Seed value (int or string)."),
     steps: int = typer.Option(50, "--steps", min=1, help="Max number of simulation steps."),
     biome: str = typer.Option("suburbs", "--biome", help="Starting biome id."),
     autopick: AutopickPolicy = typer.Option("safe", "--autopick", help="Choice policy: safe|random|greedy."),
 ) -> None:
-    content_dir = Path(__file__).resolve().parents[1] / "content"
+    if ctx.invoked_subcommand is not None:
+        return
     try:
-        content = load_content(content_dir)
+        content = load_content(CONTENT_DIR)
     except ContentValidationError as exc:
         console.print(f"[bold red]Content load failed:[/bold red] {exc}")
         raise typer.Exit(1) from exc
@@ -102,10 +287,88 @@ def main(
     console.print()
     console.print(summary)
 
-    payload = _state_signature_payload(final_state, logs)
-    signature = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    signature = state_signature(final_state, logs)
     console.print(f"\n[bold green]Deterministic signature:[/bold green] {signature}")
 
 
+def _format_percentiles(values: dict[int, float]) -> str:
+    return " / ".join(f"p{pct}={value:.2f}" for pct, value in values.items())
+
+
+@app.command()
+def batch(
+    seeds: str = typer.Option("1-100", "--seeds", help="Seed list and ranges, e.g. '1-1000' or '5,9,alpha'."),
+    steps: int = typer.Option(50, "--steps", min=1, help="Max number of simulation steps per run."),
+    biomes: list[str] = typer.Option(["suburbs"], "--biome", help="Starting biome id (repeatable)."),
+    policies: list[str] = typer.Option(["safe"], "--autopick", help="Choice policy (repeatable): safe|random|greedy."),
+    workers: int = typer.Option(0, "--workers", min=0, help="Worker processes (0 = one per CPU)."),
+    log_level: str = typer.Option("none", "--log-level", help="Run log detail: full|events|none."),
+    json_out: Path | None = typer.Option(None, "--json", help="Write per-run results and summaries to this file."),
+) -> None:
+    try:
+        seed_list = parse_seed_spec(seeds)
+    except ValueError as exc:
+        console.print(f"[bold red]Invalid seeds:[/bold red] {exc}")
+        raise typer.Exit(1) from exc
+    unknown_policies = [policy for policy in policies if policy not in AUTOPICK_POLICIES]
+    if unknown_policies:
+        console.print(f"[bold red]Unknown autopick policy '{unknown_policies[0]}'.[/bold red]")
+        raise typer.Exit(1)
+    if log_level not in LOG_LEVELS:
+        console.print(f"[bold red]Unknown log level '{log_level}'.[/bold red]")
+        raise typer.Exit(1)
+
+    try:
+        content = load_content(CONTENT_DIR)
+    except ContentValidationError as exc:
+        console.print(f"[bold red]Content load failed:[/bold red] {exc}")
+        raise typer.Exit(1) from exc
+    unknown_biomes = [biome_id for biome_id in biomes if biome_id not in content.biome_by_id]
+    if unknown_biomes:
+        console.print(f"[bold red]Unknown biome '{unknown_biomes[0]}'.[/bold red]")
+        raise typer.Exit(1)
+
+    jobs = build_batch_jobs(seed_list, biomes, policies, steps, log_level)  # type: ignore[arg-type]
+    results = run_batch(jobs, CONTENT_DIR, workers=workers or None, content=content)
+    groups = summarize_batch_groups(results)
+    overall = summarize_batch(results)
+
+    summary = Table(title=f"Batch Summary ({len(results)} runs)")
+    summary.add_column("Biome", style="cyan", no_wrap=True)
+    summary.add_column("Policy", style="cyan", no_wrap=True)
+    summary.add_column("Runs", justify="right")
+    summary.add_column("Survival", justify="right")
+    summary.add_column("Distance")
+    summary.add_column("Time")
+    summary.add_column("Signature", style="green", no_wrap=True)
+    for group in [*groups, overall]:
+        summary.add_row(
+            group.biome_id,
+            group.policy,
+            str(group.runs),
+            f"{group.survival_rate * 100:.1f}%",
+            _format_percentiles(group.distance_percentiles),
+            _format_percentiles(group.time_percentiles),
+            group.signature,
+        )
+    console.print(summary)
+
+    deaths = Table(title="Death Reasons")
+    deaths.add_column("Reason", style="red")
+    deaths.add_column("Count", justify="right")
+    for reason, count in overall.death_reasons.items():
+        deaths.add_row(reason, str(count))
+    console.print(deaths)
+
+    if json_out is not None:
+        payload: dict[str, Any] = {
+            "summary": asdict(overall),
+            "groups": [asdict(group) for group in groups],
+            "runs": [asdict(result) for result in results],
+        }
+        json_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        console.print(f"Wrote batch results to {json_out}")
+
+
 if __name__ == "__main__":
     app()